@@ -7,6 +7,7 @@ from heapq import heappush, heappop
 from itertools import count
 import logging
 from threading import Lock
+from time import time
 
 
 logger = logging.getLogger(__name__)
@@ -42,6 +43,7 @@ class ScheduledTask(object):
         self._valid = True
         self._pending = True
         self._notify = None
+        self._created = time()
 
     #--------------------------------------------------------------------------
     # Private API
@@ -99,6 +101,42 @@ class ScheduledTask(object):
         return self._result
 
 
+class TaskStats(object):
+    """ An object which accumulates the statistics for the tasks run
+    by an Application.
+
+    """
+    __slots__ = (
+        'executed', 'batches', 'max_pending', 'total_latency', 'max_latency',
+    )
+
+    def __init__(self):
+        """ Initialize a TaskStats.
+
+        """
+        self.executed = 0
+        self.batches = 0
+        self.max_pending = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    def depth(self, pending):
+        """ Record the depth of the task queue.
+
+        """
+        if pending > self.max_pending:
+            self.max_pending = pending
+
+    def record(self, latency):
+        """ Record the latency of a task which is about to run.
+
+        """
+        self.executed += 1
+        self.total_latency += latency
+        if latency > self.max_latency:
+            self.max_latency = latency
+
+
 class Application(object):
     """ The application object which manages the top-level communication
     protocol for serving Enaml views.
@@ -109,6 +147,12 @@ class Application(object):
     #: Private storage for the singleton application instance.
     _instance = None
 
+    #: The time slice, in milliseconds, for running scheduled tasks.
+    #: As many tasks as fit in the slice are run in priority order on
+    #: each cycle of the event loop, before yielding to other events.
+    #: The default of zero runs a single task per cycle.
+    task_time_slice = 0
+
     @staticmethod
     def instance():
         """ Get the global Application instance.
@@ -151,30 +195,42 @@ class Application(object):
         self._task_heap = []
         self._counter = count()
         self._heap_lock = Lock()
+        self._draining = False
+        self._task_stats = TaskStats()
         self.add_factories(factories)
 
     #--------------------------------------------------------------------------
     # Private API
     #--------------------------------------------------------------------------
-    def _process_task(self, task):
-        """ Processes the given task, then dispatches the next task.
+    def _process_tasks(self):
+        """ Run the tasks on the heap for one cycle of the event loop.
 
-        """
-        try:
-            task._execute()
-        finally:
-            self._next_task()
-
-    def _next_task(self):
-        """ Pulls the next task off the heap and processes it on the
-        main gui thread.
+        Tasks are run in priority order until the heap is empty or the
+        `task_time_slice` is used up. If tasks remain, processing is
+        continued on the next cycle of the event loop, which allows any
+        pending input events to be processed in the meantime.
 
         """
         heap = self._task_heap
-        with self._heap_lock:
-            if heap:
-                priority, ignored, task = heappop(heap)
-                self.deferred_call(self._process_task, task)
+        lock = self._heap_lock
+        stats = self._task_stats
+        deadline = time() + self.task_time_slice / 1000.0
+        stats.batches += 1
+        try:
+            while True:
+                with lock:
+                    if not heap:
+                        break
+                    task = heappop(heap)[2]
+                stats.record(time() - task._created)
+                task._execute()
+                if time() >= deadline:
+                    break
+        finally:
+            with lock:
+                self._draining = bool(heap)
+                if heap:
+                    self.deferred_call(self._process_tasks)
 
     #--------------------------------------------------------------------------
     # Abstract API
@@ -348,14 +404,13 @@ class Application(object):
         task = ScheduledTask(callback, args, kwargs)
         heap = self._task_heap
         with self._heap_lock:
-            needs_start = len(heap) == 0
             item = (-priority, self._counter.next(), task)
             heappush(heap, item)
+            self._task_stats.depth(len(heap))
+            needs_start = not self._draining
+            self._draining = True
         if needs_start:
-            if self.is_main_thread():
-                self._next_task()
-            else:
-                self.deferred_call(self._next_task)
+            self.deferred_call(self._process_tasks)
         return task
 
     def has_pending_tasks(self):
@@ -368,9 +423,42 @@ class Application(object):
 
         """
         with self._heap_lock:
-            has_pending = len(self._heap) > 0
+            has_pending = len(self._task_heap) > 0
         return has_pending
 
+    def task_stats(self):
+        """ Get the statistics for the scheduled tasks.
+
+        Returns
+        -------
+        result : dict
+            A dict with the current number of 'pending' tasks, the
+            'max_pending' queue depth, the number of 'executed' tasks,
+            the number of event loop cycles or 'batches' used to run
+            them, and the 'mean_latency' and 'max_latency' in seconds
+            between scheduling a task and running it.
+
+        """
+        stats = self._task_stats
+        with self._heap_lock:
+            pending = len(self._task_heap)
+        executed = stats.executed
+        mean = stats.total_latency / executed if executed else 0.0
+        return {
+            'pending': pending,
+            'max_pending': stats.max_pending,
+            'executed': executed,
+            'batches': stats.batches,
+            'mean_latency': mean,
+            'max_latency': stats.max_latency,
+        }
+
+    def reset_task_stats(self):
+        """ Reset the statistics for the scheduled tasks.
+
+        """
+        self._task_stats = TaskStats()
+
     def add_factories(self, factories):
         """ Add session factories to the application.
 
@@ -409,6 +497,23 @@ class Application(object):
         ]
         return info
 
+    def handle_request(self, request):
+        """ Handle a request from a remote client.
+
+        This method is called by a server transport for each message
+        it receives. Applications which serve remote clients must
+        reimplement this method. The default implementation raises
+        NotImplementedError.
+
+        Parameters
+        ----------
+        request : BaseRequest
+            The request object created by the server transport.
+
+        """
+        msg = '%s does not serve remote clients'
+        raise NotImplementedError(msg % type(self).__name__)
+
     def destroy(self):
         """ Destroy this application instance.
 
@@ -497,7 +602,7 @@ def is_main_thread():
     return app.is_main_thread()
 
 
-def schedule(self, callback, args=None, kwargs=None, priority=0):
+def schedule(callback, args=None, kwargs=None, priority=0):
     """ Schedule a callable to be executed on the event loop thread.
 
     This call is thread-safe.
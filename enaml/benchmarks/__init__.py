@@ -0,0 +1,11 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+""" Benchmarks for measuring the performance of the Enaml framework.
+
+The benchmarks can be run from the command line with:
+
+    python -m enaml.benchmarks --help
+
+"""
@@ -0,0 +1,74 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+""" Run the Enaml session startup benchmark.
+
+"""
+import optparse
+
+from .startup import (
+    STAGES, compare_results, load_results, run_benchmark, save_results
+)
+
+
+def main():
+    usage = 'usage: %prog [options]'
+    parser = optparse.OptionParser(usage=usage, description=__doc__)
+    parser.add_option(
+        '-n', '--size', type='int', default=100,
+        help='The number of leaf widgets in the view [default: %default].'
+    )
+    parser.add_option(
+        '-d', '--depth', type='int', default=3,
+        help='The nesting depth of the containers [default: %default].'
+    )
+    parser.add_option(
+        '-r', '--repeat', type='int', default=5,
+        help='The number of runs of each stage [default: %default].'
+    )
+    parser.add_option(
+        '--no-client', action='store_false', dest='client', default=True,
+        help='Skip the Qt client stages.'
+    )
+    parser.add_option(
+        '-o', '--output', help='The JSON file in which to save the results.'
+    )
+    parser.add_option(
+        '-c', '--compare', help='A JSON results file to compare against.'
+    )
+    options, args = parser.parse_args()
+
+    results = run_benchmark(
+        options.size, options.depth, options.repeat, options.client
+    )
+    stages = results['stages']
+    print '%-12s %12s %12s %10s %12s' % (
+        'stage', 'min (ms)', 'mean (ms)', 'objects', 'rss growth kb'
+    )
+    for name in STAGES:
+        if name in stages:
+            stage = stages[name]
+            print '%-12s %12.3f %12.3f %10d %12s' % (
+                name, stage['min'] * 1000, stage['mean'] * 1000,
+                stage['objects'], stage['rss_growth_kb'],
+            )
+    for name, reason in sorted(results['skipped'].iteritems()):
+        print '%-12s skipped: %s' % (name, reason)
+
+    if options.output:
+        save_results(results, options.output)
+
+    if options.compare:
+        baseline = load_results(options.compare)
+        print
+        header = ('stage', 'base (ms)', 'min (ms)', 'ratio')
+        print '%-12s %12s %12s %8s' % header
+        for name, old, new, ratio in compare_results(baseline, results):
+            print '%-12s %12.3f %12.3f %8.2f' % (
+                name, old * 1000, new * 1000, ratio
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,347 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+""" A benchmark of the stages of starting an Enaml session.
+
+The stages are timed separately for a synthetic view:
+
+    parse
+        Parsing the Enaml source into an ast with `parse`.
+
+    compile
+        Compiling the ast into a code object with `EnamlCompiler`.
+
+    execute
+        Executing the code object, which creates the enamldef types.
+
+    instantiate
+        Creating the view through the enamldef builders.
+
+    initialize
+        Opening the server session, which initializes the view.
+
+    snapshot
+        Taking the snapshot of the session with `Session.snapshot`.
+
+    build
+        Building the client objects with `QtSession.build`.
+
+    init_layout
+        Initializing the client windows, which runs the first
+        `init_layout` of the containers.
+
+Each stage also reports the number of objects it creates and the
+growth of the peak resident set size of the process during the stage.
+Since the peak is a high-water mark for the whole process, a stage
+which allocates less than an earlier stage already did reports no
+growth.
+
+The client stages require Qt and are skipped if it is not available.
+The Qt platform defaults to 'offscreen' so that the benchmark can run
+on a headless machine.
+
+"""
+from contextlib import contextmanager
+import gc
+import json
+import os
+import platform
+import sys
+import time
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+from enaml.core.enaml_compiler import EnamlCompiler
+from enaml.core.import_hooks import imports
+from enaml.core.parser import parse
+from enaml.session import Session
+
+from .synthetic import make_source
+
+
+#: The names of the benchmarked stages, in execution order.
+STAGES = (
+    'parse', 'compile', 'execute', 'instantiate', 'initialize', 'snapshot',
+    'build', 'init_layout',
+)
+
+
+#: The names of the stages which require the Qt client.
+CLIENT_STAGES = ('build', 'init_layout')
+
+
+def _peak_rss():
+    """ Get the peak resident set size of the process in kilobytes.
+
+    Returns
+    -------
+    result : int or None
+        The peak resident set size or None if it is not available.
+
+    """
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Darwin reports the value in bytes instead of kilobytes.
+    if sys.platform == 'darwin':
+        rss //= 1024
+    return rss
+
+
+def load_qt():
+    """ Load the Qt client classes used by the client stages.
+
+    Returns
+    -------
+    result : tuple
+        A 2-tuple of the QtSession class and an error message. The
+        class is None if Qt is not available.
+
+    """
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    try:
+        from enaml.qt.qt.QtGui import QApplication
+        # Importing the application registers the default factories.
+        from enaml.qt import qt_application
+        from enaml.qt.qt_session import QtSession
+    except Exception as exc:
+        return None, 'Qt is not available: %s' % exc
+    QApplication.instance() or QApplication([])
+    return QtSession, ''
+
+
+class BenchmarkSession(Session):
+    """ A session which serves the windows it is given.
+
+    """
+    def on_open(self):
+        """ The windows are provided when the session is created.
+
+        """
+        pass
+
+
+class StageTimer(object):
+    """ An object which records the time and memory of each stage.
+
+    """
+    def __init__(self):
+        """ Initialize a StageTimer.
+
+        """
+        self.times = {}
+        self.objects = {}
+        self.rss_growth = {}
+
+    @contextmanager
+    def measure(self, name):
+        """ A context manager which measures a stage.
+
+        Parameters
+        ----------
+        name : str
+            The name of the stage being measured.
+
+        """
+        gc.collect()
+        n_objects = len(gc.get_objects())
+        start_rss = _peak_rss()
+        start = time.time()
+        yield
+        elapsed = time.time() - start
+        self.times.setdefault(name, []).append(elapsed)
+        objects = len(gc.get_objects()) - n_objects
+        self.objects.setdefault(name, []).append(objects)
+        if start_rss is not None:
+            growth = _peak_rss() - start_rss
+            self.rss_growth.setdefault(name, []).append(growth)
+
+    def results(self):
+        """ Get the results for the measured stages.
+
+        Returns
+        -------
+        result : dict
+            A dict mapping stage name to a dict of results with the
+            keys 'times', 'min', 'mean', 'objects' and 'rss_growth_kb'.
+            The 'rss_growth_kb' is the largest growth of the peak
+            resident set size during a run of the stage, or None if
+            it is not available.
+
+        """
+        results = {}
+        for name, times in self.times.iteritems():
+            growth = self.rss_growth.get(name)
+            results[name] = {
+                'times': times,
+                'min': min(times),
+                'mean': sum(times) / len(times),
+                'objects': max(self.objects[name]),
+                'rss_growth_kb': max(growth) if growth else None,
+            }
+        return results
+
+
+def run_once(source, timer, qt_session_class=None):
+    """ Run all stages of the benchmark once.
+
+    Parameters
+    ----------
+    source : str
+        The Enaml source code which defines a `Main` Window.
+
+    timer : StageTimer
+        The timer with which to measure the stages.
+
+    qt_session_class : type, optional
+        The QtSession class to use for the client stages. If not
+        given, the client stages are skipped.
+
+    """
+    filename = '<benchmark>'
+    with timer.measure('parse'):
+        ast = parse(source, filename)
+    with timer.measure('compile'):
+        code = EnamlCompiler.compile(ast, filename)
+    ns = {}
+    with timer.measure('execute'):
+        with imports():
+            exec code in ns
+    Main = ns['Main']
+    with timer.measure('instantiate'):
+        view = Main()
+    session = BenchmarkSession(windows=[view])
+    with timer.measure('initialize'):
+        session.open('benchmark')
+    with timer.measure('snapshot'):
+        snapshot = session.snapshot()
+    if qt_session_class is not None:
+        groups = session.widget_groups[:]
+        qt_session = qt_session_class(session.session_id, groups)
+        with timer.measure('build'):
+            windows = [qt_session.build(tree, None) for tree in snapshot]
+        with timer.measure('init_layout'):
+            for window in windows:
+                window.initialize()
+        for window in windows:
+            window.destroy()
+    for window in session.windows:
+        window.destroy()
+
+
+def run_benchmark(size=100, depth=3, repeat=5, client=True):
+    """ Run the startup benchmark for a synthetic view.
+
+    Parameters
+    ----------
+    size : int, optional
+        The number of leaf widgets in the synthetic view.
+
+    depth : int, optional
+        The number of nested container levels in the synthetic view.
+
+    repeat : int, optional
+        The number of times to run each stage.
+
+    client : bool, optional
+        Whether to run the Qt client stages. They are skipped if Qt
+        is not available.
+
+    Returns
+    -------
+    result : dict
+        A JSON serializable dict with the keys 'config', 'stages' and
+        'skipped'.
+
+    """
+    qt_session_class = None
+    skipped = {}
+    if client:
+        qt_session_class, error = load_qt()
+        if qt_session_class is None:
+            for name in CLIENT_STAGES:
+                skipped[name] = error
+    else:
+        for name in CLIENT_STAGES:
+            skipped[name] = 'disabled'
+    source = make_source(size, depth)
+    timer = StageTimer()
+    for ignored in xrange(repeat):
+        run_once(source, timer, qt_session_class)
+    config = {
+        'size': size,
+        'depth': depth,
+        'repeat': repeat,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'timestamp': time.time(),
+    }
+    return {'config': config, 'stages': timer.results(), 'skipped': skipped}
+
+
+def save_results(results, path):
+    """ Save the benchmark results as JSON.
+
+    Parameters
+    ----------
+    results : dict
+        The results returned by `run_benchmark`.
+
+    path : str
+        The path of the file to write.
+
+    """
+    with open(path, 'w') as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+
+
+def load_results(path):
+    """ Load benchmark results saved with `save_results`.
+
+    Parameters
+    ----------
+    path : str
+        The path of the file to read.
+
+    Returns
+    -------
+    result : dict
+        The benchmark results.
+
+    """
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare_results(baseline, results):
+    """ Compare the stage times of two benchmark runs.
+
+    Parameters
+    ----------
+    baseline : dict
+        The results of the baseline run.
+
+    results : dict
+        The results of the run to compare against the baseline.
+
+    Returns
+    -------
+    result : list
+        A list of (stage, baseline_min, min, ratio) tuples for the
+        stages which were run in both runs, in execution order.
+
+    """
+    rows = []
+    old_stages = baseline['stages']
+    new_stages = results['stages']
+    for name in STAGES:
+        if name in old_stages and name in new_stages:
+            old = old_stages[name]['min']
+            new = new_stages[name]['min']
+            ratio = new / old if old > 0 else float('inf')
+            rows.append((name, old, new, ratio))
+    return rows
@@ -0,0 +1,110 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+""" Generators for synthetic Enaml sources used by the benchmarks.
+
+"""
+from math import ceil
+
+
+#: The imports placed at the top of a synthetic source.
+HEADER = """\
+from enaml.widgets.api import (
+    Window, Container, Label, Field, PushButton, CheckBox
+)
+
+
+enamldef Main(Window):
+    id: main
+    attr counter = 0
+    title = 'Benchmark'
+"""
+
+
+#: The templates for the leaf widgets of a synthetic tree. Each leaf
+#: exercises a different type of operator binding.
+LEAF_TEMPLATES = (
+    ("Label:", "text << 'label %d: %%d' %% main.counter"),
+    ("Field:", "text = 'field %d'"),
+    ("PushButton:", "text = 'button %d'", "clicked :: main.counter += 1"),
+    ("CheckBox:", "text = 'check %d'", "checked << main.counter > 0"),
+)
+
+
+def _emit(lines, indent, level, depth, fanout, count, counter):
+    """ Emit the lines for a synthetic container subtree.
+
+    Parameters
+    ----------
+    lines : list
+        The list of source lines to which to append.
+
+    indent : str
+        The indentation for the container.
+
+    level : int
+        The nesting level of the container.
+
+    depth : int
+        The number of nested container levels in the tree.
+
+    fanout : int
+        The maximum number of child containers per container.
+
+    count : int
+        The number of leaf widgets to place in the subtree.
+
+    counter : list
+        A single element list holding the next leaf widget index.
+
+    """
+    lines.append(indent + 'Container:')
+    indent += '    '
+    if level >= depth:
+        for ignored in xrange(count):
+            index = counter[0]
+            counter[0] += 1
+            template = LEAF_TEMPLATES[index % len(LEAF_TEMPLATES)]
+            lines.append(indent + template[0])
+            for binding in template[1:]:
+                if '%d' in binding:
+                    binding = binding % index
+                lines.append(indent + '    ' + binding)
+        if count == 0:
+            lines.append(indent + 'pass')
+        return
+    nchildren = max(1, min(fanout, count))
+    base, extra = divmod(count, nchildren)
+    for idx in xrange(nchildren):
+        sub_count = base + (1 if idx < extra else 0)
+        _emit(lines, indent, level + 1, depth, fanout, sub_count, counter)
+
+
+def make_source(size, depth):
+    """ Make the source code for a synthetic Enaml view.
+
+    The view is a `Main` enamldef of a Window which holds a tree of
+    nested Containers. The innermost containers hold the leaf widgets,
+    which are evenly distributed across the tree.
+
+    Parameters
+    ----------
+    size : int
+        The total number of leaf widgets in the tree.
+
+    depth : int
+        The number of nested container levels in the tree.
+
+    Returns
+    -------
+    result : str
+        The Enaml source code for the view.
+
+    """
+    depth = max(1, depth)
+    fanout = max(2, int(ceil(size ** (1.0 / depth))))
+    lines = [HEADER.rstrip('\n')]
+    _emit(lines, '    ', 1, depth, fanout, size, [0])
+    lines.append('')
+    return '\n'.join(lines)
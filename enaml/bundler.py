@@ -0,0 +1,110 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+""" Command-line tool to build a bundle of precompiled .enaml modules.
+
+Each root is a directory on the Python path. The .enaml files below a
+root are compiled and stored in the bundle under their fully qualified
+module names. Load the bundle with EnamlBundleImporter.add_bundle.
+
+"""
+import optparse
+import os
+import sys
+
+from enaml.core.enaml_compiler import EnamlCompiler
+from enaml.core.import_hooks import CACHEDIR, EnamlBundle
+from enaml.core.parser import parse
+
+
+def find_modules(root):
+    """ Find the .enaml modules below a root directory.
+
+    Parameters
+    ----------
+    root : string
+        The directory on the Python path below which to search.
+
+    Returns
+    -------
+    result : list
+        A sorted list of (fullname, src_path) tuples for the modules.
+
+    """
+    modules = []
+    ext = os.path.extsep + 'enaml'
+    for dirpath, dirnames, filenames in os.walk(root):
+        if CACHEDIR in dirnames:
+            dirnames.remove(CACHEDIR)
+        for filename in filenames:
+            if filename.endswith(ext):
+                src_path = os.path.join(dirpath, filename)
+                relpath = os.path.relpath(src_path, root)
+                fullname = relpath[:-len(ext)].replace(os.sep, '.')
+                modules.append((fullname, src_path))
+    modules.sort()
+    return modules
+
+
+def build_bundle(path, roots):
+    """ Compile the .enaml modules below the given roots into a bundle.
+
+    Parameters
+    ----------
+    path : string
+        The path of the bundle file to write.
+
+    roots : iterable
+        The directories on the Python path below which to search for
+        .enaml modules. A module found below an earlier root takes
+        precedence over a module of the same name found below a later
+        root.
+
+    Returns
+    -------
+    result : list
+        The fully qualified names of the modules in the bundle.
+
+    """
+    bundle_dir = os.path.dirname(os.path.abspath(path))
+    seen = set()
+    modules = []
+    for root in roots:
+        for fullname, src_path in find_modules(root):
+            if fullname in seen:
+                continue
+            seen.add(fullname)
+            with open(src_path) as src_file:
+                src = src_file.read()
+            src_path = os.path.abspath(src_path)
+            ast = parse(src, filename=src_path)
+            code = EnamlCompiler.compile(ast, src_path)
+            relpath = os.path.relpath(src_path, bundle_dir)
+            modules.append((fullname, relpath, code))
+    EnamlBundle.write(path, modules)
+    return [fullname for fullname, relpath, code in modules]
+
+
+def main():
+    usage = 'usage: %prog [options] bundle_file root [root ...]'
+    parser = optparse.OptionParser(usage=usage, description=__doc__)
+    parser.add_option(
+        '-q', '--quiet', action='store_true', default=False,
+        help='Do not list the bundled modules.'
+    )
+
+    options, args = parser.parse_args()
+    if len(args) < 2:
+        parser.print_usage()
+        sys.exit(1)
+
+    names = build_bundle(args[0], args[1:])
+    if not options.quiet:
+        for name in names:
+            print name
+        print 'Bundled %d modules into %s' % (len(names), args[0])
+
+
+if __name__ == '__main__':
+    main()
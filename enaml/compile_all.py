@@ -0,0 +1,169 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+""" Command-line tool to compile the .enaml files of source trees.
+
+The .enaml files below each root are compiled ahead of time into the
+__enamlcache__ files used by the Enaml importer, so that no process
+pays the compile cost on the first import of a module. Files with a
+current cache are skipped unless --force is given.
+
+"""
+import multiprocessing
+import optparse
+import os
+import sys
+import traceback
+
+from enaml.bundler import find_modules
+from enaml.core.enaml_compiler import EnamlCompiler
+from enaml.core.import_hooks import MAGIC, EnamlImporter, make_file_info
+from enaml.core.parser import parse
+
+
+def compile_file(src_path, force=False):
+    """ Compile a .enaml file into its cache file.
+
+    The cache directory of the file must already exist.
+
+    Parameters
+    ----------
+    src_path : string
+        The path of the .enaml file.
+
+    force : bool, optional
+        Whether to compile the file even if its cache is current.
+
+    Returns
+    -------
+    result : (src_path, status, error)
+        The status is one of 'compiled', 'skipped' or 'failed'. The
+        error is a message describing a failure, or None.
+
+    """
+    file_info = make_file_info(src_path)
+    importer = EnamlImporter(file_info)
+    try:
+        src_mod_time = int(os.stat(src_path).st_mtime)
+        if not force and os.path.exists(file_info.cache_path):
+            magic, ts = importer._get_magic_info(file_info)
+            if magic == MAGIC and src_mod_time <= ts:
+                return (src_path, 'skipped', None)
+        with open(src_path) as src_file:
+            src = src_file.read()
+        ast = parse(src, filename=src_path)
+        code = EnamlCompiler.compile(ast, src_path)
+        importer._write_cache(code, src_mod_time, file_info)
+        # Validate that the cache file holds the header which the
+        # importer expects, since writing the cache is best effort.
+        magic, ts = importer._get_magic_info(file_info)
+        if magic != MAGIC or ts != src_mod_time:
+            msg = 'invalid cache header in %s' % file_info.cache_path
+            return (src_path, 'failed', msg)
+    except Exception:
+        return (src_path, 'failed', traceback.format_exc())
+    return (src_path, 'compiled', None)
+
+
+def _compile_worker(args):
+    """ Compile a file in a worker process of the pool.
+
+    """
+    return compile_file(*args)
+
+
+def compile_trees(roots, jobs=None, force=False):
+    """ Compile the .enaml files below the given roots.
+
+    Parameters
+    ----------
+    roots : iterable
+        The directories below which to compile the .enaml files.
+
+    jobs : int, optional
+        The number of worker processes to use. The default uses one
+        per cpu. A value of 1 compiles the files in this process.
+
+    force : bool, optional
+        Whether to compile the files even if their caches are current.
+
+    Returns
+    -------
+    result : list
+        The list of (src_path, status, error) results for the files,
+        sorted by path.
+
+    """
+    paths = []
+    for root in roots:
+        paths.extend(src_path for fullname, src_path in find_modules(root))
+
+    # The cache directories are created up front, since the workers
+    # would otherwise race to create them.
+    results = []
+    tasks = []
+    for src_path in paths:
+        cache_dir = make_file_info(src_path).cache_dir
+        try:
+            if not os.path.isdir(cache_dir):
+                os.mkdir(cache_dir)
+        except OSError as e:
+            results.append((src_path, 'failed', str(e)))
+        else:
+            tasks.append((src_path, force))
+
+    if jobs is None:
+        jobs = multiprocessing.cpu_count()
+    jobs = min(jobs, len(tasks))
+    if jobs > 1:
+        pool = multiprocessing.Pool(jobs)
+        try:
+            results.extend(pool.imap_unordered(_compile_worker, tasks))
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        results.extend(_compile_worker(task) for task in tasks)
+    results.sort()
+    return results
+
+
+def main():
+    usage = 'usage: %prog [options] root [root ...]'
+    parser = optparse.OptionParser(usage=usage, description=__doc__)
+    parser.add_option(
+        '-j', '--jobs', type='int', default=None,
+        help='The number of worker processes [default: one per cpu].'
+    )
+    parser.add_option(
+        '-f', '--force', action='store_true', default=False,
+        help='Compile files even if their caches are current.'
+    )
+    parser.add_option(
+        '-q', '--quiet', action='store_true', default=False,
+        help='Only report errors.'
+    )
+
+    options, args = parser.parse_args()
+    if len(args) == 0:
+        parser.print_usage()
+        sys.exit(1)
+
+    results = compile_trees(args, options.jobs, options.force)
+    failed = [result for result in results if result[1] == 'failed']
+    if not options.quiet:
+        compiled = sum(1 for result in results if result[1] == 'compiled')
+        print 'Compiled %d, skipped %d, failed %d of %d files' % (
+            compiled, len(results) - compiled - len(failed), len(failed),
+            len(results),
+        )
+    for src_path, status, error in failed:
+        print >> sys.stderr, '*** Error compiling %s' % src_path
+        print >> sys.stderr, error
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
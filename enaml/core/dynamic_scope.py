@@ -36,6 +36,60 @@ class AbstractScopeListener(object):
         raise NotImplementedError
 
 
+#------------------------------------------------------------------------------
+# Scope Cache
+#------------------------------------------------------------------------------
+#: The generation of the object trees. It is incremented whenever the
+#: parent of an object changes, which invalidates every scope cache.
+_scope_generation = 0
+
+
+def invalidate_scope_caches():
+    """ Invalidate the name resolution cache of every expression.
+
+    This is called by `Object` whenever the parent of an object changes,
+    since that can change which ancestor resolves a name.
+
+    """
+    global _scope_generation
+    _scope_generation += 1
+
+
+class ScopeCache(object):
+    """ A per-expression cache of the ancestors which resolve names.
+
+    The cache maps a name to the number of parent steps from the object
+    which owns an expression to the ancestor which resolved that name
+    on a previous evaluation, so that subsequent lookups go directly to
+    that ancestor instead of trying each object in between. The cache
+    is emptied when the parent of any object changes.
+
+    """
+    __slots__ = ('_generation', '_depths')
+
+    def __init__(self):
+        """ Initialize a ScopeCache.
+
+        """
+        self._generation = _scope_generation
+        self._depths = {}
+
+    def depths(self):
+        """ Get the valid dict of resolution depths.
+
+        Returns
+        -------
+        result : dict
+            The dict mapping name to ancestor depth, which is passed
+            to a DynamicScope or Nonlocals as its cache.
+
+        """
+        if self._generation != _scope_generation:
+            self._generation = _scope_generation
+            self._depths = {}
+        return self._depths
+
+
 #------------------------------------------------------------------------------
 # Dynamic Scope
 #------------------------------------------------------------------------------
@@ -50,6 +104,67 @@ class DynamicAttributeError(AttributeError):
     pass
 
 
+def _ancestor_lookup(obj, name, listener, cache):
+    """ Resolve a name on the first ancestor of an object which has it.
+
+    Parameters
+    ----------
+    obj : Declarative
+        The object from which to start the lookup.
+
+    name : str
+        The name of the attribute to lookup.
+
+    listener : DynamicScopeListener or None
+        A listener which should be notified when the name is loaded.
+
+    cache : dict or None
+        The dict of resolution depths of a `ScopeCache`, or None.
+
+    Raises
+    ------
+    KeyError
+        No ancestor of the object has the named attribute.
+
+    """
+    if cache is not None and name in cache:
+        parent = obj
+        for i in xrange(cache[name]):
+            parent = parent.parent
+            if parent is None:
+                break
+        else:
+            try:
+                value = getattr(parent, name)
+            except DynamicAttributeError:
+                raise
+            except AttributeError:
+                # The ancestor no longer resolves the name, so the
+                # cache entry is dropped and the full lookup is run.
+                del cache[name]
+            else:
+                if listener is not None:
+                    listener.dynamic_load(parent, name, value)
+                return value
+    depth = 0
+    parent = obj
+    while parent is not None:
+        try:
+            value = getattr(parent, name)
+        except DynamicAttributeError:
+            raise
+        except AttributeError:
+            parent = parent.parent
+            depth += 1
+        else:
+            if cache is not None:
+                cache[name] = depth
+            if listener is not None:
+                listener.dynamic_load(parent, name, value)
+            return value
+    raise KeyError(name)
+
+
 class DynamicScope(object):
     """ A custom mapping object that implements Enaml's dynamic scope.
 
@@ -64,7 +179,7 @@ class DynamicScope(object):
     order to avoid unnecessary reference cycles.
 
     """
-    def __init__(self, obj, identifiers, overrides, listener):
+    def __init__(self, obj, identifiers, overrides, listener, cache=None):
         """ Initialize a DynamicScope.
 
         Parameters
@@ -83,11 +198,16 @@ class DynamicScope(object):
             A listener which should be notified when a name is loaded
             via dynamic scoping.
 
+        cache : dict or None, optional
+            A dict which maps a name to the number of parent steps to
+            the ancestor which resolved it. See `ScopeCache`.
+
         """
         self._obj = obj
         self._identifiers = identifiers
         self._overrides = overrides
         self._listener = listener
+        self._cache = cache
 
     def __getitem__(self, name):
         """ Lookup and return an item from the scope.
@@ -109,20 +229,7 @@ class DynamicScope(object):
         dct = self._identifiers
         if name in dct:
             return dct[name]
-        parent = self._obj
-        while parent is not None:
-            try:
-                value = getattr(parent, name)
-            except DynamicAttributeError:
-                raise
-            except AttributeError:
-                parent = parent.parent
-            else:
-                listener = self._listener
-                if listener is not None:
-                    listener.dynamic_load(parent, name, value)
-                return value
-        raise KeyError(name)
+        return _ancestor_lookup(self._obj, name, self._listener, self._cache)
 
     def __setitem__(self, name, value):
         """ Set an item in the scope.
@@ -171,7 +278,7 @@ class Nonlocals(object):
     magic name in the scope of an expression.
 
     """
-    def __init__(self, obj, listener):
+    def __init__(self, obj, listener, cache=None):
         """ Initialize a nonlocal scope.
 
         Parameters
@@ -183,15 +290,20 @@ class Nonlocals(object):
             A listener which should be notified when a name is loaded
             via dynamic scoping.
 
+        cache : dict or None, optional
+            A dict which maps a name to the number of parent steps to
+            the ancestor which resolved it. See `ScopeCache`.
+
         """
         self._nls_obj = obj
         self._nls_listener = listener
+        self._nls_cache = cache
 
     def __repr__(self):
         """ A pretty representation of the NonlocalScope.
 
         """
-        return 'Nonlocals[%s]' % self._obj
+        return 'Nonlocals[%s]' % self._nls_obj
 
     def __call__(self, level=0):
         """ Get a new nonlocals object for the given offset.
@@ -215,7 +327,10 @@ class Nonlocals(object):
         if offset != level:
             msg = 'Scope level %s is out of range'
             raise ValueError(msg % level)
-        return Nonlocals(target, self._nls_listener)
+        # The cache is only valid for lookups which start at the object
+        # which owns the executing code.
+        cache = self._nls_cache if level == 0 else None
+        return Nonlocals(target, self._nls_listener, cache)
 
     def __getattr__(self, name):
         """ A convenience method which allows accessing items in the
@@ -233,7 +348,7 @@ class Nonlocals(object):
         scope via setattr instead of setitem.
 
         """
-        if name in ('_nls_obj', '_nls_listener'):
+        if name in ('_nls_obj', '_nls_listener', '_nls_cache'):
             super(Nonlocals, self).__setattr__(name, value)
         else:
             try:
@@ -256,20 +371,9 @@ class Nonlocals(object):
             The named item is not contained in the nonlocals.
 
         """
-        parent = self._nls_obj
-        while parent is not None:
-            try:
-                value = getattr(parent, name)
-            except DynamicAttributeError:
-                raise
-            except AttributeError:
-                parent = parent.parent
-            else:
-                listener = self._nls_listener
-                if listener is not None:
-                    listener.dynamic_load(parent, name, value)
-                return value
-        raise KeyError(name)
+        return _ancestor_lookup(
+            self._nls_obj, name, self._nls_listener, self._nls_cache
+        )
 
     def __setitem__(self, name, value):
         """ Sets the value of the nonlocal.
@@ -326,3 +430,9 @@ class Nonlocals(object):
             res = False
         return res
 
+
+# Use the faster versions of the scope objects if they're available.
+try:
+    from enaml.extensions.dynamicscope import DynamicScope, Nonlocals
+except ImportError:
+    pass
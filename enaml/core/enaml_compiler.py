@@ -63,7 +63,11 @@ from .code_tracing import inject_tracing, inject_inversion
 # 7 : Fix bug with local deletes - 10 December 2012
 #     This fixes a bug in the locals optimization where the DELETE_NAME
 #     opcode was not being replaced with DELETE_FAST.
-COMPILER_VERSION = 7
+# 8 : Static attribute chains - 16 October 2026
+#     The functions for `<<` and `:=` expressions which are a plain
+#     attribute chain such as `model.person.name` are given a `_chain`
+#     attribute, which allows them to be evaluated without tracing.
+COMPILER_VERSION = 8
 
 
 # The Enaml compiler translates an Enaml AST into Python bytecode.
@@ -334,6 +338,39 @@ def compile_delegate(py_ast, filename):
     return (sub_code, upd_code)
 
 
+def analyze_chain(py_ast):
+    """ Statically analyze an expression for an attribute chain.
+
+    An expression is an attribute chain if it consists only of a name
+    followed by zero or more attribute loads, such as `model.name` or
+    `model.person.name`. The dependencies of such an expression are
+    fully determined by the objects along the chain, so it can be
+    evaluated and subscribed without tracing the bytecode.
+
+    Parameters
+    ----------
+    py_ast : ast.Expression
+        A Python ast Expression node.
+
+    Returns
+    -------
+    result : tuple or None
+        The tuple of names which make up the chain, starting with the
+        root name, or None if the expression is not an attribute chain.
+
+    """
+    names = []
+    node = py_ast.body
+    while isinstance(node, ast.Attribute):
+        names.append(node.attr)
+        node = node.value
+    if not isinstance(node, ast.Name) or node.id == 'None':
+        return None
+    names.append(node.id)
+    names.reverse()
+    return tuple(names)
+
+
 COMPILE_OP_MAP = {
     '__operator_Equal__': compile_simple,
     '__operator_ColonColon__': compile_notify,
@@ -343,6 +380,10 @@ COMPILE_OP_MAP = {
 }
 
 
+# The operators which evaluate attribute chains without tracing.
+CHAIN_OPS = frozenset(['__operator_LessLess__', '__operator_ColonEqual__'])
+
+
 #------------------------------------------------------------------------------
 # Node Visitor
 #------------------------------------------------------------------------------
@@ -504,6 +545,7 @@ class DeclarationCompiler(_NodeVisitor):
         op = node.binding.op
         op_compiler = COMPILE_OP_MAP[op]
         code = op_compiler(py_ast, self.filename)
+        chain = analyze_chain(py_ast) if op in CHAIN_OPS else None
         if isinstance(code, tuple): # operator `::`
             sub_code, upd_code = code
             self.extend_ops([
@@ -520,9 +562,6 @@ class DeclarationCompiler(_NodeVisitor):
                 (MAKE_FUNCTION, 0),
                 (ROT_TWO, None),
                 (STORE_ATTR, '_update'),            # sub_func._update = upd_func
-                (LOAD_FAST, 'identifiers'),
-                (CALL_FUNCTION, 0x0004),
-                (POP_TOP, None),
             ])
         else:
             self.extend_ops([
@@ -534,10 +573,19 @@ class DeclarationCompiler(_NodeVisitor):
                 (LOAD_CONST, node.name),
                 (LOAD_CONST, code),
                 (MAKE_FUNCTION, 0),
-                (LOAD_FAST, 'identifiers'),
-                (CALL_FUNCTION, 0x0004),
-                (POP_TOP, None),
             ])
+        if chain is not None:
+            self.extend_ops([
+                (DUP_TOP, None),
+                (LOAD_CONST, chain),
+                (ROT_TWO, None),
+                (STORE_ATTR, '_chain'),             # func._chain = chain
+            ])
+        self.extend_ops([
+            (LOAD_FAST, 'identifiers'),
+            (CALL_FUNCTION, 0x0004),
+            (POP_TOP, None),
+        ])
 
     def visit_Instantiation(self, node):
         """ Create the bytecode ops for a component instantiation.
@@ -0,0 +1,218 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import json
+
+
+#: The sort keys supported by `ExpressionProfiler.format_table`.
+SORT_KEYS = ('cumulative', 'count', 'max', 'mean', 'location')
+
+
+class BindingStats(object):
+    """ An object which accumulates the statistics of a single binding.
+
+    """
+    __slots__ = (
+        'location', 'operator', 'count', 'cumulative', 'max', 'deps_total',
+        'deps_max',
+    )
+
+    def __init__(self, location, operator):
+        """ Initialize a BindingStats.
+
+        Parameters
+        ----------
+        location : str
+            The 'filename:lineno' location of the binding.
+
+        operator : str
+            The operator of the binding, such as '<<' or '::'.
+
+        """
+        self.location = location
+        self.operator = operator
+        self.count = 0
+        self.cumulative = 0.0
+        self.max = 0.0
+        self.deps_total = 0
+        self.deps_max = 0
+
+    def record(self, elapsed, deps):
+        """ Record a call of the binding.
+
+        """
+        self.count += 1
+        self.cumulative += elapsed
+        if elapsed > self.max:
+            self.max = elapsed
+        if deps is not None:
+            self.deps_total += deps
+            if deps > self.deps_max:
+                self.deps_max = deps
+
+    def as_dict(self):
+        """ Get the statistics as a JSON serializable dict.
+
+        """
+        count = self.count
+        return {
+            'location': self.location,
+            'operator': self.operator,
+            'count': count,
+            'cumulative': self.cumulative,
+            'mean': self.cumulative / count if count else 0.0,
+            'max': self.max,
+            'mean_deps': float(self.deps_total) / count if count else 0.0,
+            'max_deps': self.deps_max,
+        }
+
+
+class ExpressionProfiler(object):
+    """ A profiler which records the cost of the bound expressions.
+
+    When enabled, every evaluation of a `=`, `<<` or `:=` expression and
+    every notification of a `::`, `>>` or `:=` expression records its
+    elapsed time against the location of the binding, which is the
+    'filename:lineno' of its compiled function. The size of the
+    dependency set is also recorded for `<<` and `:=` evaluations.
+
+    The profiler is disabled by default, in which case the expressions
+    only pay for a check of the `enabled` attribute. There is a single
+    instance of the profiler, `expression_profiler`.
+
+    """
+    def __init__(self):
+        """ Initialize an ExpressionProfiler.
+
+        """
+        #: Whether the profiler records the expression calls.
+        self.enabled = False
+
+        self._stats = {}
+        self._locations = {}
+
+    #--------------------------------------------------------------------------
+    # Public API
+    #--------------------------------------------------------------------------
+    def record(self, func, operator, elapsed, deps=None):
+        """ Record a call of a bound expression.
+
+        Parameters
+        ----------
+        func : types.FunctionType
+            The compiled function of the binding.
+
+        operator : str
+            The operator of the binding.
+
+        elapsed : float
+            The time taken by the call, in seconds.
+
+        deps : int or None, optional
+            The number of dependencies of the expression after the
+            call, or None if the call does not track dependencies.
+
+        """
+        code = func.func_code
+        location = self._locations.get(code)
+        if location is None:
+            location = '%s:%s' % (code.co_filename, code.co_firstlineno)
+            self._locations[code] = location
+        key = (location, operator)
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = BindingStats(location, operator)
+        stats.record(elapsed, deps)
+
+    def reset(self):
+        """ Discard the recorded statistics.
+
+        """
+        self._stats = {}
+        self._locations = {}
+
+    def snapshot(self):
+        """ Get a snapshot of the recorded statistics.
+
+        Returns
+        -------
+        result : list
+            A list of dicts, one per binding, sorted by decreasing
+            cumulative time. Each dict has the 'location' and the
+            'operator' of the binding, the call 'count', the
+            'cumulative', 'mean' and 'max' times in seconds, and the
+            'mean_deps' and 'max_deps' dependency set sizes.
+
+        """
+        rows = [stats.as_dict() for stats in self._stats.itervalues()]
+        rows.sort(key=lambda row: row['cumulative'], reverse=True)
+        return rows
+
+    def format_table(self, sort='cumulative', limit=None):
+        """ Format the recorded statistics as a text table.
+
+        Parameters
+        ----------
+        sort : str, optional
+            The column by which to sort the rows. One of 'cumulative',
+            'count', 'max', 'mean' or 'location'. The default is
+            'cumulative'.
+
+        limit : int or None, optional
+            The maximum number of rows to include. The default includes
+            all rows.
+
+        Returns
+        -------
+        result : str
+            The formatted table.
+
+        """
+        if sort not in SORT_KEYS:
+            raise ValueError('unknown sort key %r' % sort)
+        rows = self.snapshot()
+        rows.sort(key=lambda row: row[sort], reverse=sort != 'location')
+        if limit is not None:
+            rows = rows[:limit]
+        lines = ['%8s %12s %10s %10s %9s  %-2s %s' % (
+            'count', 'cum (ms)', 'mean (ms)', 'max (ms)', 'max deps', 'op',
+            'location',
+        )]
+        for row in rows:
+            lines.append('%8d %12.3f %10.3f %10.3f %9d  %-2s %s' % (
+                row['count'], row['cumulative'] * 1000, row['mean'] * 1000,
+                row['max'] * 1000, row['max_deps'], row['operator'],
+                row['location'],
+            ))
+        return '\n'.join(lines)
+
+    def dump(self, path, format='table', sort='cumulative'):
+        """ Write the recorded statistics to a file.
+
+        Parameters
+        ----------
+        path : str
+            The path of the file to write.
+
+        format : str, optional
+            Either 'table' to write the output of `format_table`, or
+            'json' to write the output of `snapshot`. The default is
+            'table'.
+
+        sort : str, optional
+            The sort key for the 'table' format.
+
+        """
+        if format == 'table':
+            data = self.format_table(sort) + '\n'
+        elif format == 'json':
+            data = json.dumps(self.snapshot(), indent=2)
+        else:
+            raise ValueError('unknown format %r' % format)
+        with open(path, 'w') as f:
+            f.write(data)
+
+
+#: The profiler used by all bound expressions.
+expression_profiler = ExpressionProfiler()
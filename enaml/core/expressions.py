@@ -2,14 +2,20 @@
 #  Copyright (c) 2012, Enthought, Inc.
 #  All rights reserved.
 #------------------------------------------------------------------------------
-from collections import namedtuple
+from collections import OrderedDict, namedtuple
+from time import time
 from weakref import ref
 
 from traits.api import HasTraits, Disallow, TraitListObject, TraitDictObject
 
+from enaml.application import Application
+
 from .abstract_expressions import AbstractExpression, AbstractListener
 from .code_tracing import CodeTracer, CodeInverter
-from .dynamic_scope import DynamicScope, AbstractScopeListener, Nonlocals
+from .dynamic_scope import (
+    DynamicScope, AbstractScopeListener, Nonlocals, ScopeCache
+)
+from .expression_profiler import expression_profiler
 from .funchelper import call_func
 
 
@@ -120,6 +126,37 @@ class TraitsTracer(CodeTracer):
 AbstractScopeListener.register(TraitsTracer)
 
 
+#------------------------------------------------------------------------------
+# Chain Recorder
+#------------------------------------------------------------------------------
+class ChainRecorder(object):
+    """ A scope listener which records the loads of an attribute chain.
+
+    This is used in place of a TraitsTracer when evaluating a statically
+    analyzed attribute chain. The (obj, name) pair of the dynamic load
+    of the root name, if any, is added to the `loads` list.
+
+    """
+    __slots__ = ('loads',)
+
+    def __init__(self):
+        """ Initialize a ChainRecorder.
+
+        """
+        self.loads = []
+
+    def dynamic_load(self, obj, attr, value):
+        """ Called when an object attribute is dynamically loaded.
+
+        See also: `AbstractScopeListener.dynamic_load`.
+
+        """
+        self.loads.append((obj, attr))
+
+
+AbstractScopeListener.register(ChainRecorder)
+
+
 #------------------------------------------------------------------------------
 # Standard Code Inverter
 #------------------------------------------------------------------------------
@@ -192,7 +229,7 @@ class BaseExpression(object):
     """ The base class of the standard Enaml expression classes.
 
     """
-    __slots__ = ('_func', '_f_locals')
+    __slots__ = ('_func', '_f_locals', '_scope_cache')
 
     def __init__(self, func, f_locals):
         """ Initialize a BaseExpression.
@@ -210,6 +247,7 @@ class BaseExpression(object):
         """
         self._func = func
         self._f_locals = f_locals
+        self._scope_cache = ScopeCache()
 
 
 #------------------------------------------------------------------------------
@@ -228,10 +266,15 @@ class SimpleExpression(BaseExpression):
         """ Evaluate and return the expression value.
 
         """
-        overrides = {'nonlocals': Nonlocals(owner, None)}
-        scope = DynamicScope(owner, self._f_locals, overrides, None)
+        start = time() if expression_profiler.enabled else None
+        cache = self._scope_cache.depths()
+        overrides = {'nonlocals': Nonlocals(owner, None, cache)}
+        scope = DynamicScope(owner, self._f_locals, overrides, None, cache)
         with owner.operators:
-            return call_func(self._func, (), {}, scope)
+            result = call_func(self._func, (), {}, scope)
+        if start is not None:
+            expression_profiler.record(self._func, '=', time() - start)
+        return result
 
 
 AbstractExpression.register(SimpleExpression)
@@ -256,13 +299,17 @@ class NotificationExpression(BaseExpression):
         """ Called when the attribute on the owner has changed.
 
         """
+        start = time() if expression_profiler.enabled else None
+        cache = self._scope_cache.depths()
         overrides = {
             'event': NotificationEvent(owner, name, old, new),
-            'nonlocals': Nonlocals(owner, None),
+            'nonlocals': Nonlocals(owner, None, cache),
         }
-        scope = DynamicScope(owner, self._f_locals, overrides, None)
+        scope = DynamicScope(owner, self._f_locals, overrides, None, cache)
         with owner.operators:
             call_func(self._func, (), {}, scope)
+        if start is not None:
+            expression_profiler.record(self._func, '::', time() - start)
 
 
 AbstractListener.register(NotificationExpression)
@@ -284,12 +331,16 @@ class UpdateExpression(BaseExpression):
         """ Called when the attribute on the owner has changed.
 
         """
-        nonlocals = Nonlocals(owner, None)
+        start = time() if expression_profiler.enabled else None
+        cache = self._scope_cache.depths()
+        nonlocals = Nonlocals(owner, None, cache)
         overrides = {'nonlocals': nonlocals}
         inverter = StandardInverter(nonlocals)
-        scope = DynamicScope(owner, self._f_locals, overrides, None)
+        scope = DynamicScope(owner, self._f_locals, overrides, None, cache)
         with owner.operators:
             call_func(self._func, (inverter, new), {}, scope)
+        if start is not None:
+            expression_profiler.record(self._func, '>>', time() - start)
 
 
 AbstractListener.register(UpdateExpression)
@@ -302,9 +353,9 @@ class SubscriptionNotifier(object):
     """ A simple object used for attaching notification handlers.
 
     """
-    __slots__ = ('owner', 'name', 'keyval', '__weakref__')
+    __slots__ = ('owner', 'name', 'items', 'chain', '__weakref__')
 
-    def __init__(self, owner, name, keyval):
+    def __init__(self, owner, name):
         """ Initialize a SubscriptionNotifier.
 
         Parameters
@@ -315,28 +366,267 @@ class SubscriptionNotifier(object):
         name : str
             The name to which the expression is bound.
 
-        keyval : object
-            An object to use for testing equivalency of notifiers.
-
         """
         self.owner = ref(owner)
         self.name = name
-        self.keyval = keyval
+        self.items = {}
+        self.chain = None
 
     def notify(self):
         """ Notify that the expression is invalid.
 
+        If the refresh scheduler is enabled, the expression is marked
+        dirty and refreshed later. Otherwise, it is refreshed now.
+
+        """
+        if refresh_scheduler.enabled:
+            refresh_scheduler.mark_dirty(self)
+        else:
+            self.refresh()
+
+    def refresh(self):
+        """ Refresh the expression on its owner.
+
         """
         owner = self.owner()
         if owner is not None:
             owner.refresh_expression(self.name)
 
+    def update(self, traced):
+        """ Update the handlers to match a new set of traced items.
+
+        Handlers are added for the items which were not previously
+        traced, and removed from the previously traced items which are
+        no longer traced. The items are tracked by a key which uses the
+        id of an object and a weak reference to the object, so strong
+        references to the object are not maintained by the notifier.
+
+        Parameters
+        ----------
+        traced : set
+            The set of (obj, name) pairs traced during evaluation.
+
+        """
+        handler = self.notify
+        old_items = self.items
+        new_items = {}
+        for obj, attr in traced:
+            key = (id(obj), attr)
+            item = old_items.pop(key, None)
+            # The id of a dead object may be reused by the new object,
+            # so the referent is checked before the handler is reused.
+            if item is None or item[0]() is not obj:
+                obj.on_trait_change(handler, attr)
+                item = (ref(obj), attr)
+            new_items[key] = item
+        for wr, attr in old_items.itervalues():
+            obj = wr()
+            if obj is not None:
+                obj.on_trait_change(handler, attr, remove=True)
+        self.items = new_items
+        self.chain = None
+
+    def update_chain(self, loads):
+        """ Update the handlers to match the loads of an attribute chain.
+
+        The handlers are only updated if an object along the chain is
+        not the same object as on the previous update. Weak references
+        to the HasTraits objects along the chain are kept in order to
+        make the comparison.
+
+        Parameters
+        ----------
+        loads : list
+            The list of (obj, name) pairs loaded while evaluating the
+            chain, in chain order.
+
+        """
+        chain = self.chain
+        if chain is not None and len(chain) == len(loads):
+            for wr, (obj, attr) in zip(chain, loads):
+                if wr is None:
+                    if isinstance(obj, HasTraits):
+                        break
+                elif wr() is not obj:
+                    break
+            else:
+                return
+        tracer = TraitsTracer()
+        for obj, attr in loads:
+            tracer.load_attr(obj, attr)
+        self.update(tracer.traced_items)
+        self.chain = tuple(
+            ref(obj) if isinstance(obj, HasTraits) else None
+            for obj, attr in loads
+        )
+
+
+class RefreshScheduler(object):
+    """ A scheduler which batches the refreshing of `<<` expressions.
+
+    When enabled, a subscription expression whose dependencies change
+    is marked dirty instead of being refreshed immediately. The dirty
+    expressions are refreshed in a single task posted with the
+    `schedule` method of the application, so each expression is
+    refreshed at most once per event loop cycle regardless of how many
+    of its dependencies changed. Expressions are refreshed in dependency
+    order, so an expression which depends on the target of another dirty
+    expression is refreshed after that expression. If no application
+    exists, expressions are refreshed immediately.
+
+    The scheduler is disabled by default. There is a single instance of
+    the scheduler, `refresh_scheduler`, which is enabled by setting its
+    `enabled` attribute to True.
+
+    """
+    def __init__(self):
+        """ Initialize a RefreshScheduler.
+
+        """
+        #: Whether the scheduler batches the expression refreshes.
+        self.enabled = False
+
+        #: The priority of the refresh task in the application queue.
+        self.priority = 0
+
+        self._dirty = OrderedDict()
+        self._current = set()
+        self._running = False
+        self._task = None
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _ordered(self, notifiers):
+        """ Sort the notifiers into dependency order.
+
+        Parameters
+        ----------
+        notifiers : iterable
+            The dirty subscription notifiers, in the order they were
+            marked dirty.
+
+        Returns
+        -------
+        result : list
+            The notifiers sorted so that a notifier comes after the
+            notifiers of the expressions it depends upon. Cycles are
+            broken by the order in which the notifiers were marked.
+
+        """
+        targets = {}
+        for notifier in notifiers:
+            owner = notifier.owner()
+            if owner is not None:
+                targets[(id(owner), notifier.name)] = notifier
+        ordered = []
+        visited = set()
+        for notifier in notifiers:
+            if notifier in visited:
+                continue
+            visited.add(notifier)
+            stack = [(notifier, iter(notifier.items))]
+            while stack:
+                current, keys = stack[-1]
+                for key in keys:
+                    dep = targets.get(key)
+                    if dep is not None and dep not in visited:
+                        visited.add(dep)
+                        stack.append((dep, iter(dep.items)))
+                        break
+                else:
+                    stack.pop()
+                    ordered.append(current)
+        return ordered
+
+    def _schedule(self):
+        """ Post the refresh task to the application queue.
+
+        """
+        app = Application.instance()
+        if app is not None:
+            self._task = app.schedule(self._refresh, priority=self.priority)
+
+    def _refresh(self):
+        """ Refresh the dirty expressions.
+
+        This is the task posted to the application queue. Expressions
+        which are marked dirty by the refreshing of other expressions
+        are refreshed in the same pass, unless they have already been
+        refreshed by the pass, in which case they are deferred to the
+        next task.
+
+        """
+        dirty = self._dirty
+        refreshed = set()
+        self._running = True
+        try:
+            while True:
+                batch = [n for n in dirty if n not in refreshed]
+                if not batch:
+                    break
+                for notifier in batch:
+                    del dirty[notifier]
+                ordered = self._ordered(batch)
+                current = self._current = set(ordered)
+                for notifier in ordered:
+                    current.discard(notifier)
+                    refreshed.add(notifier)
+                    notifier.refresh()
+        finally:
+            self._running = False
+            self._current = set()
+            self._task = None
+            if dirty:
+                self._schedule()
+
+    #--------------------------------------------------------------------------
+    # Public API
+    #--------------------------------------------------------------------------
+    def mark_dirty(self, notifier):
+        """ Mark the expression of a subscription notifier as dirty.
+
+        Parameters
+        ----------
+        notifier : SubscriptionNotifier
+            The notifier of the expression to refresh.
+
+        """
+        # An expression which is waiting to be refreshed by the running
+        # task will see the latest values when it is refreshed.
+        if notifier in self._current:
+            return
+        if Application.instance() is None:
+            notifier.refresh()
+            return
+        self._dirty[notifier] = None
+        if self._task is None and not self._running:
+            self._schedule()
+
+
+#: The refresh scheduler used by all subscription expressions.
+refresh_scheduler = RefreshScheduler()
+
+
+#: A sentinel returned when an attribute chain cannot be evaluated.
+_NO_CHAIN = object()
+
 
 class SubscriptionExpression(BaseExpression):
     """ An implementation of AbstractExpression for the `<<` operator.
 
+    If the compiler determined that the expression is a plain attribute
+    chain, the function has a `_chain` attribute which holds the names
+    of the chain. Such an expression is evaluated by walking the chain
+    directly instead of running the traced bytecode, and its handlers
+    are only updated when an object along the chain changes. Tracing
+    remains the general fallback.
+
     """
-    __slots__ = ('_notifier')
+    __slots__ = ('_notifier', '_chain')
+
+    #: The operator reported to the expression profiler.
+    _operator = '<<'
 
     def __init__(self, func, f_locals):
         """ Initialize a SubscriptionExpression.
@@ -344,42 +634,105 @@ class SubscriptionExpression(BaseExpression):
         """
         super(SubscriptionExpression, self).__init__(func, f_locals)
         self._notifier = None
+        self._chain = getattr(func, '_chain', None)
 
     #--------------------------------------------------------------------------
-    # AbstractExpression Interface
+    # Private API
     #--------------------------------------------------------------------------
-    def eval(self, owner, name):
+    def _eval(self, owner, name):
         """ Evaluate and return the expression value.
 
+        This is the implementation of `eval` without profiling.
+
         """
+        if self._chain is not None:
+            result = self._eval_chain(owner, name)
+            if result is not _NO_CHAIN:
+                return result
+
         tracer = TraitsTracer()
-        overrides = {'nonlocals': Nonlocals(owner, tracer)}
-        scope = DynamicScope(owner, self._f_locals, overrides, tracer)
+        cache = self._scope_cache.depths()
+        overrides = {'nonlocals': Nonlocals(owner, tracer, cache)}
+        scope = DynamicScope(owner, self._f_locals, overrides, tracer, cache)
         with owner.operators:
             result = call_func(self._func, (tracer,), {}, scope)
 
         # In most cases, the objects comprising the dependencies of an
         # expression will not change during subsequent evaluations of
-        # the expression. Rather than creating a new notifier on each
-        # pass and repeating the work of creating the change handlers,
-        # a key for the dependencies is computed and a new notifier is
-        # created only when the key changes. The key uses the id of an
-        # object instead of the object itself so strong references to
-        # the object are not maintained by the expression. A sorted
-        # tuple is used instead of a frozenset to reduced the memory
-        # footprint. It is slightly slower to compute but ~5x smaller.
-        traced = tracer.traced_items
-        keyval = tuple(sorted((id(obj), attr) for obj, attr in traced))
+        # the expression. A single notifier is kept for the lifetime of
+        # the expression, and it diffs the newly traced items against
+        # the previous ones. Only the handlers for the items which have
+        # changed are added or removed, so stale handlers do not pile
+        # up on objects which are no longer dependencies.
         notifier = self._notifier
-        if notifier is None or keyval != notifier.keyval:
-            notifier = SubscriptionNotifier(owner, name, keyval)
+        if notifier is None:
+            notifier = SubscriptionNotifier(owner, name)
             self._notifier = notifier
-            handler = notifier.notify
-            for obj, attr in traced:
-                obj.on_trait_change(handler, attr)
+        notifier.update(tracer.traced_items)
 
         return result
 
+    def _eval_chain(self, owner, name):
+        """ Evaluate the expression as a static attribute chain.
+
+        Returns
+        -------
+        result : object
+            The value of the expression, or `_NO_CHAIN` if the chain
+            could not be evaluated. In that case, the traced bytecode
+            is run instead, which reports any error with a traceback
+            which points to the expression.
+
+        """
+        chain = self._chain
+        root = chain[0]
+        recorder = ChainRecorder()
+        cache = self._scope_cache.depths()
+        overrides = {'nonlocals': Nonlocals(owner, recorder, cache)}
+        scope = DynamicScope(owner, self._f_locals, overrides, recorder, cache)
+        loads = recorder.loads
+        try:
+            with owner.operators:
+                try:
+                    value = scope[root]
+                except KeyError:
+                    dct = self._func.func_globals
+                    if root not in dct:
+                        # A builtin root is left to the bytecode.
+                        self._chain = None
+                        return _NO_CHAIN
+                    value = dct[root]
+                for attr in chain[1:]:
+                    loads.append((value, attr))
+                    value = getattr(value, attr)
+        except Exception:
+            return _NO_CHAIN
+
+        notifier = self._notifier
+        if notifier is None:
+            notifier = SubscriptionNotifier(owner, name)
+            self._notifier = notifier
+        notifier.update_chain(loads)
+
+        return value
+
+    #--------------------------------------------------------------------------
+    # AbstractExpression Interface
+    #--------------------------------------------------------------------------
+    def eval(self, owner, name):
+        """ Evaluate and return the expression value.
+
+        """
+        if expression_profiler.enabled:
+            start = time()
+            result = self._eval(owner, name)
+            expression_profiler.record(
+                self._func, self._operator, time() - start,
+                len(self._notifier.items),
+            )
+            return result
+        return self._eval(owner, name)
+
 
 AbstractExpression.register(SubscriptionExpression)
 
@@ -393,6 +746,10 @@ class DelegationExpression(SubscriptionExpression):
     """
     __slots__ = ()
 
+    #: The operator reported to the expression profiler. The updates
+    #: of the `:=` operator are reported as `>>`.
+    _operator = ':='
+
     #--------------------------------------------------------------------------
     # AbstractListener Interface
     #--------------------------------------------------------------------------
@@ -400,12 +757,16 @@ class DelegationExpression(SubscriptionExpression):
         """ Called when the attribute on the owner has changed.
 
         """
-        nonlocals = Nonlocals(owner, None)
+        start = time() if expression_profiler.enabled else None
+        cache = self._scope_cache.depths()
+        nonlocals = Nonlocals(owner, None, cache)
         inverter = StandardInverter(nonlocals)
         overrides = {'nonlocals': nonlocals}
-        scope = DynamicScope(owner, self._f_locals, overrides, None)
+        scope = DynamicScope(owner, self._f_locals, overrides, None, cache)
         with owner.operators:
             call_func(self._func._update, (inverter, new), {}, scope)
+        if start is not None:
+            expression_profiler.record(self._func, '>>', time() - start)
 
 
 AbstractListener.register(DelegationExpression)
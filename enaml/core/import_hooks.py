@@ -60,6 +60,57 @@ def make_file_info(src_path):
     return EnamlFileInfo(src_path, cache_path, cache_dir)
 
 
+class DirectoryCache(object):
+    """ A per-process cache of the entries of directories.
+
+    A listing is reused for as long as the modification time of its
+    directory is unchanged. Checking for a module in a directory costs
+    a single stat of the directory, instead of a stat of every path
+    which may hold the module.
+
+    """
+    #: Private storage for the listings, keyed by directory path.
+    _listings = {}
+
+    @classmethod
+    def entries(cls, path):
+        """ Get the names of the entries of a directory.
+
+        Parameters
+        ----------
+        path : string
+            The path of the directory.
+
+        Returns
+        -------
+        result : frozenset
+            The names of the entries of the directory. This is empty
+            if the path is not a readable directory.
+
+        """
+        try:
+            mtime = os.stat(path or os.curdir).st_mtime
+        except OSError:
+            cls._listings.pop(path, None)
+            return frozenset()
+        listing = cls._listings.get(path)
+        if listing is not None and listing[0] == mtime:
+            return listing[1]
+        try:
+            names = frozenset(os.listdir(path or os.curdir))
+        except OSError:
+            names = frozenset()
+        cls._listings[path] = (mtime, names)
+        return names
+
+    @classmethod
+    def clear(cls):
+        """ Clear the cached listings.
+
+        """
+        cls._listings.clear()
+
+
 #------------------------------------------------------------------------------
 # Abstract Enaml Importer
 #------------------------------------------------------------------------------
@@ -213,28 +264,34 @@ class EnamlImporter(AbstractEnamlImporter):
         # We're looking inside a package and 'path' the package path
         if path is not None:
             modname = fullname.rsplit('.', 1)[-1]
-            leaf = ''.join((modname, os.path.extsep, 'enaml'))
-            for stem in path:
-                enaml_path = os.path.join(stem, leaf)
-                file_info = make_file_info(enaml_path)  
-                if (os.path.exists(file_info.src_path) or
-                    os.path.exists(file_info.cache_path)):
-                    return cls(file_info)
+            stems = path
 
         # We're trying a load a package
         elif '.' in fullname:
             return
-        
+
         # We're doing a direct import
         else:
-            leaf = fullname + os.path.extsep + 'enaml'
-            for stem in sys.path:
-                enaml_path = os.path.join(stem, leaf)
-                file_info = make_file_info(enaml_path) 
-                if (os.path.exists(file_info.src_path) or
-                    os.path.exists(file_info.cache_path)):
-                    return cls(file_info)
-    
+            modname = fullname
+            stems = sys.path
+
+        # The directory listings are used instead of checking for the
+        # source and cache files of each stem, which is expensive on
+        # network file systems.
+        leaf = ''.join((modname, os.path.extsep, 'enaml'))
+        cache_leaf = ''.join(
+            (modname, '.', MAGIC_TAG, os.path.extsep, 'enamlc')
+        )
+        entries = DirectoryCache.entries
+        for stem in stems:
+            names = entries(stem)
+            if leaf in names:
+                return cls(make_file_info(os.path.join(stem, leaf)))
+            if CACHEDIR in names:
+                cache_dir = os.path.join(stem, CACHEDIR)
+                if cache_leaf in entries(cache_dir):
+                    return cls(make_file_info(os.path.join(stem, leaf)))
+
     def __init__(self, file_info):
         """ Initialize an importer object.
 
@@ -311,6 +368,37 @@ class EnamlImporter(AbstractEnamlImporter):
             timestamp = struct.unpack('i', cache_file.read(4))[0]
         return (magic, timestamp)
 
+    def _load_current_cache(self, file_info, src_mod_time):
+        """ Loads the code object for the given file info if the cache
+        file exists and is current.
+
+        The magic info and the code are read with a single open of the
+        cache file.
+
+        Parameters
+        ----------
+        file_info : EnamlFileInfo
+            The file info object for the file.
+
+        src_mod_time : int
+            The integer timestamp of the source file.
+
+        Returns
+        -------
+        result : types.CodeType or None
+            The code object for the file, or None if the cache file
+            does not exist or is out of date.
+
+        """
+        try:
+            with open(file_info.cache_path, 'rb') as cache_file:
+                magic = cache_file.read(4)
+                timestamp = struct.unpack('i', cache_file.read(4))[0]
+                if magic == MAGIC and src_mod_time <= timestamp:
+                    return marshal.load(cache_file)
+        except (IOError, struct.error):
+            pass
+
     def get_code(self):
         """ Loads and returns the code object for the Enaml module and
         the full path to the module for use as the __file__ attribute 
@@ -329,17 +417,16 @@ class EnamlImporter(AbstractEnamlImporter):
         # it was deleted between then and now, an IOError is more 
         # informative than an ImportError.
         file_info = self.file_info
-        if not os.path.exists(file_info.src_path):
+        try:
+            src_mod_time = int(os.stat(file_info.src_path).st_mtime)
+        except OSError:
             code = self._load_cache(file_info)
             return (code, file_info.src_path)
 
         # Use the cached file if it exists and is current
-        src_mod_time = int(os.path.getmtime(file_info.src_path))
-        if os.path.exists(file_info.cache_path):
-            magic, ts = self._get_magic_info(file_info)
-            if magic == MAGIC and src_mod_time <= ts:
-                code = self._load_cache(file_info)
-                return (code, file_info.src_path)
+        code = self._load_current_cache(file_info, src_mod_time)
+        if code is not None:
+            return (code, file_info.src_path)
 
         # Otherwise, compile from source and attempt to cache
         with open(file_info.src_path) as src_file:
@@ -350,6 +437,223 @@ class EnamlImporter(AbstractEnamlImporter):
         return (code, file_info.src_path)
 
 
+#------------------------------------------------------------------------------
+# Enaml Bundle Importer
+#------------------------------------------------------------------------------
+class EnamlBundle(object):
+    """ A single archive file of precompiled Enaml modules.
+
+    A bundle is written by `write` and has the layout:
+
+        MAGIC | header size | header | code data
+
+    The header is a marshalled (MAGIC_TAG, index) tuple, where the
+    index maps the fully qualified name of each module to its source
+    path relative to the bundle root, and to the offset and size of
+    its marshalled code in the code data. The whole bundle is read
+    with a single open of the file.
+
+    """
+    __slots__ = ('path', '_index', '_data')
+
+    @staticmethod
+    def write(path, modules):
+        """ Write a bundle file.
+
+        Parameters
+        ----------
+        path : string
+            The path of the bundle file to write.
+
+        modules : iterable
+            An iterable of (fullname, relpath, code) tuples for the
+            modules to include in the bundle.
+
+        """
+        index = {}
+        blobs = []
+        offset = 0
+        for fullname, relpath, code in modules:
+            blob = marshal.dumps(code)
+            index[fullname] = (relpath, offset, len(blob))
+            blobs.append(blob)
+            offset += len(blob)
+        header = marshal.dumps((MAGIC_TAG, index))
+        with open(path, 'wb') as bundle_file:
+            bundle_file.write(MAGIC)
+            bundle_file.write(struct.pack('<i', len(header)))
+            bundle_file.write(header)
+            for blob in blobs:
+                bundle_file.write(blob)
+
+    def __init__(self, path):
+        """ Initialize an EnamlBundle.
+
+        Parameters
+        ----------
+        path : string
+            The path of the bundle file.
+
+        Raises
+        ------
+        ImportError
+            If the bundle cannot be read or was not compiled for this
+            interpreter and Enaml compiler.
+
+        """
+        try:
+            with open(path, 'rb') as bundle_file:
+                data = bundle_file.read()
+            magic = data[:4]
+            size = struct.unpack('<i', data[4:8])[0]
+            tag, index = marshal.loads(data[8:8 + size])
+        except (IOError, struct.error, EOFError, ValueError, TypeError):
+            raise ImportError('Invalid Enaml bundle %s' % path)
+        if magic != MAGIC or tag != MAGIC_TAG:
+            msg = 'Enaml bundle %s was compiled for %s'
+            raise ImportError(msg % (path, tag))
+        self.path = path
+        self._index = index
+        self._data = buffer(data, 8 + size)
+
+    def __contains__(self, fullname):
+        """ Returns whether the bundle contains the given module.
+
+        """
+        return fullname in self._index
+
+    def names(self):
+        """ Get the names of the modules in the bundle.
+
+        Returns
+        -------
+        result : list
+            The fully qualified names of the modules in the bundle.
+
+        """
+        return self._index.keys()
+
+    def get_code(self, fullname):
+        """ Get the code object and path of a module in the bundle.
+
+        Parameters
+        ----------
+        fullname : string
+            The fully qualified name of the module.
+
+        Returns
+        -------
+        result : (code, path)
+            The code object for the module, and the path of its source
+            file, which is relative to the location of the bundle.
+
+        """
+        relpath, offset, size = self._index[fullname]
+        code = marshal.loads(self._data[offset:offset + size])
+        path = os.path.join(os.path.dirname(self.path), relpath)
+        return (code, path)
+
+
+class EnamlBundleImporter(AbstractEnamlImporter):
+    """ An importer which imports Enaml modules from precompiled bundle
+    archives.
+
+    Locating a module in a bundle does not touch the file system. The
+    bundles to search are added with `add_bundle`, and the importer is
+    enabled by adding it to the framework importers with
+    `imports.add_importer(EnamlBundleImporter)`. A bundle is created
+    with the `enaml-bundle` command.
+
+    """
+    #: The bundles searched by the importer, in order of precedence.
+    _bundles = []
+
+    @classmethod
+    def add_bundle(cls, path):
+        """ Add a bundle to the end of the bundles searched by the
+        importer. If the bundle has already been added, this is a
+        no-op.
+
+        Parameters
+        ----------
+        path : string
+            The path of the bundle file.
+
+        """
+        path = os.path.abspath(path)
+        if all(bundle.path != path for bundle in cls._bundles):
+            cls._bundles.append(EnamlBundle(path))
+
+    @classmethod
+    def remove_bundle(cls, path):
+        """ Remove a bundle from the bundles searched by the importer.
+        If the bundle has not been added, this is a no-op.
+
+        Parameters
+        ----------
+        path : string
+            The path of the bundle file.
+
+        """
+        path = os.path.abspath(path)
+        cls._bundles[:] = [b for b in cls._bundles if b.path != path]
+
+    @classmethod
+    def locate_module(cls, fullname, path=None):
+        """ Searches the bundles for the given Enaml module and returns
+        an instance of this class on success.
+
+        Paramters
+        ---------
+        fullname : string
+            The fully qualified name of the module.
+
+        path : list or None
+            The subpackage __path__ for submodules and subpackages
+            or None if a top-level module.
+
+        Returns
+        -------
+        results : Instance(AbstractEnamlImporter) or None
+            If the Enaml module is located an instance of the importer
+            that will perform the rest of the operations is returned.
+            Otherwise, returns None.
+
+        """
+        for bundle in cls._bundles:
+            if fullname in bundle:
+                return cls(bundle, fullname)
+
+    def __init__(self, bundle, fullname):
+        """ Initialize an importer object.
+
+        Parameters
+        ----------
+        bundle : EnamlBundle
+            The bundle which contains the module.
+
+        fullname : string
+            The fully qualified name of the module.
+
+        """
+        self.bundle = bundle
+        self.fullname = fullname
+
+    def get_code(self):
+        """ Loads and returns the code object for the Enaml module and
+        the full path to the module for use as the __file__ attribute
+        of the module.
+
+        Returns
+        -------
+        result : (code, path)
+            The Python code object for the .enaml module, and the full
+            path to the module as a string.
+
+        """
+        return self.bundle.get_code(self.fullname)
+
+
 #------------------------------------------------------------------------------
 # Enaml Imports Context
 #------------------------------------------------------------------------------
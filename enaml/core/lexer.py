@@ -455,9 +455,13 @@ class EnamlLexer(object):
     # Normal Class Items
     #--------------------------------------------------------------------------
     def __init__(self, filename='Enaml'):
-        self.lexer = lex.lex(
-            module=self, outputdir=_lex_dir, lextab=_lex_module, optimize=1,
-        )
+        # Ply's clone rebinds the rules of the state tables, but not
+        # those of the current state, so the state is entered anew.
+        # The clone is a shallow copy, so it is given its own state
+        # stack rather than sharing the list of the template.
+        self.lexer = self._template_lexer().clone(self)
+        self.lexer.lexstatestack = []
+        self.lexer.begin('INITIAL')
         self.token_stream = None
         self.filename = filename
 
@@ -471,6 +475,24 @@ class EnamlLexer(object):
         # that function, we add it as an attribute on both lexers.
         self.lexer.filename = filename
 
+    @classmethod
+    def _template_lexer(cls):
+        """ Get the Ply lexer which is cloned by the lexer instances.
+
+        The template is created on first use from the rules of a
+        throwaway instance. Cloning it rebinds its rules to a new
+        instance without repeating the table loading of `lex.lex`.
+
+        """
+        template = cls.__dict__.get('_template')
+        if template is None:
+            template = lex.lex(
+                module=cls.__new__(cls), outputdir=_lex_dir,
+                lextab=_lex_module, optimize=1,
+            )
+            cls._template = template
+        return template
+
     def input(self, txt):
         self.lexer.input(txt)
         self.next_token = self.make_token_stream().next
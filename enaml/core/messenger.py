@@ -2,7 +2,9 @@
 #  Copyright (c) 2012, Enthought, Inc.
 #  All rights reserved.
 #------------------------------------------------------------------------------
-from traits.api import Instance, Uninitialized
+from operator import attrgetter
+
+from traits.api import Bool, Instance, Uninitialized
 
 from enaml.utils import LoopbackGuard
 
@@ -32,6 +34,184 @@ class PublishAttributeNotifier(object):
 PublishAttributeNotifier = PublishAttributeNotifier()
 
 
+def children_edits(old_ids, new_ids):
+    """ Compute the edit script which turns one child order into another.
+
+    The script is a list of operations which are applied in sequence
+    to the list of children ids of the client object:
+
+        ['remove', index, count]
+            Remove `count` children starting at `index`.
+
+        ['move', index, count, to]
+            Move `count` children starting at `index` to position `to`,
+            where `to` is less than `index`.
+
+        ['insert', index, ids]
+            Insert the children with the given ids at `index`.
+
+    Parameters
+    ----------
+    old_ids : list
+        The list of object ids of the old children.
+
+    new_ids : list
+        The list of object ids of the new children.
+
+    Returns
+    -------
+    result : list
+        The list of edit operations.
+
+    """
+    edits = []
+    new_set = set(new_ids)
+    old_set = set(old_ids)
+
+    # Remove the old children which are not in the new order. This is
+    # done from the back so the indices of the ranges remain valid.
+    index = len(old_ids) - 1
+    while index >= 0:
+        if old_ids[index] in new_set:
+            index -= 1
+            continue
+        last = index
+        while index >= 0 and old_ids[index] not in new_set:
+            index -= 1
+        edits.append(['remove', index + 1, last - index])
+
+    # Walk the new order, moving or inserting the runs of children
+    # which are not already in place.
+    work = [oid for oid in old_ids if oid in new_set]
+    index = 0
+    count = len(new_ids)
+    while index < count:
+        target = new_ids[index]
+        if index < len(work) and work[index] == target:
+            index += 1
+            continue
+        if target not in old_set:
+            end = index + 1
+            while end < count and new_ids[end] not in old_set:
+                end += 1
+            run = new_ids[index:end]
+            work[index:index] = run
+            edits.append(['insert', index, run])
+            index = end
+            continue
+        source = work.index(target, index)
+        size = 1
+        while (source + size < len(work) and index + size < count and
+               work[source + size] == new_ids[index + size]):
+            size += 1
+        block = work[source:source + size]
+        del work[source:source + size]
+        work[index:index] = block
+        edits.append(['move', source, size, index])
+        index += size
+    return edits
+
+
+def _edits_size(edits):
+    """ Get the number of values carried by an edit script.
+
+    """
+    size = 0
+    for edit in edits:
+        if edit[0] == 'insert':
+            size += 2 + len(edit[2])
+        else:
+            size += len(edit)
+    return size
+
+
+class SnapshotPlan(object):
+    """ A cached plan for creating the snapshot of a Messenger class.
+
+    A plan is created once for a given class, the first time that an
+    instance of that class is snapshotted. It caches the class name and
+    the base class names, and collects the `snapshot_attributes` of the
+    class hierarchy into a single getter which reads all attributes in
+    one pass.
+
+    """
+    __slots__ = ('class_name', 'base_names', 'attributes', 'getter')
+
+    #: Private storage for the plans, keyed by class.
+    _plans = {}
+
+    @classmethod
+    def lookup(cls, klass):
+        """ Get the snapshot plan for a Messenger class.
+
+        Parameters
+        ----------
+        klass : type
+            The Messenger subclass for which to get the plan.
+
+        Returns
+        -------
+        result : SnapshotPlan
+            The cached snapshot plan for the class.
+
+        """
+        plans = cls._plans
+        if klass in plans:
+            return plans[klass]
+        plan = plans[klass] = cls(klass)
+        return plan
+
+    def __init__(self, klass):
+        """ Initialize a SnapshotPlan.
+
+        Parameters
+        ----------
+        klass : type
+            The Messenger subclass for which to create the plan.
+
+        """
+        mro = klass.mro()
+        names = []
+        for base in mro[1:]:
+            names.append(base.__name__)
+            if base is Object:
+                break
+        attrs = []
+        for base in reversed(mro):
+            for attr in base.__dict__.get('snapshot_attributes', ()):
+                if attr not in attrs:
+                    attrs.append(attr)
+        self.class_name = klass.__name__
+        self.base_names = names
+        self.attributes = tuple(attrs)
+        if len(attrs) > 1:
+            self.getter = attrgetter(*attrs)
+        elif attrs:
+            getter = attrgetter(attrs[0])
+            self.getter = lambda obj: (getter(obj),)
+        else:
+            self.getter = lambda obj: ()
+
+    def populate(self, obj, snap):
+        """ Add the class names and attributes of an object to a
+        snapshot dict.
+
+        Parameters
+        ----------
+        obj : Messenger
+            The object being snapshotted.
+
+        snap : dict
+            The snapshot dict to populate.
+
+        """
+        snap['class'] = self.class_name
+        # Each snapshot gets its own list so that a change made to one
+        # snapshot does not leak into the plan or other snapshots.
+        snap['bases'] = self.base_names[:]
+        snap.update(zip(self.attributes, self.getter(obj)))
+
+
 class Messenger(Declarative):
     """ A base class for creating messaging-enabled Enaml objects.
 
@@ -45,6 +225,21 @@ class Messenger(Declarative):
     #: cycle when setting attributes from within an action handler.
     loopback_guard = Instance(LoopbackGuard, ())
 
+    #: The names of the attributes whose values are included as-is in
+    #: the snapshot of the object. The attributes declared by a class
+    #: are combined with those declared by its base classes. Values
+    #: which require conversion should be added by reimplementing the
+    #: `snapshot` method instead.
+    snapshot_attributes = ()
+
+    #: Whether the children of this object are withheld from the client.
+    #: Deferred children are left out of the snapshot and are neither
+    #: activated nor able to message the client until they are sent
+    #: with `materialize_children`. This is set by containers such as
+    #: Notebook and Stack in `update_deferred` for children which are
+    #: not yet visible.
+    children_deferred = Bool(False)
+
     #--------------------------------------------------------------------------
     # Lifetime API
     #--------------------------------------------------------------------------
@@ -70,6 +265,15 @@ class Messenger(Declarative):
         super(Messenger, self).post_initialize()
         self.bind()
 
+    def activate_children(self, session):
+        """ A reimplemented children activation method.
+
+        The children are not activated if they are deferred.
+
+        """
+        if not self.children_deferred:
+            super(Messenger, self).activate_children(session)
+
     def bind(self):
         """ Called during initialization pass to bind change handlers.
 
@@ -100,11 +304,29 @@ class Messenger(Declarative):
         snap = {}
         snap['object_id'] = self.object_id
         snap['name'] = self.name
-        snap['class'] = self.class_name()
-        snap['bases'] = self.base_names()
-        snap['children'] = [c.snapshot() for c in self.snap_children()]
+        SnapshotPlan.lookup(type(self)).populate(self, snap)
+        if self.children_deferred:
+            snap['children'] = []
+            snap['children_deferred'] = True
+        else:
+            snap['children'] = [c.snapshot() for c in self.snap_children()]
         return snap
 
+    def update_deferred(self):
+        """ Update which children of the tree are withheld from the
+        client.
+
+        This is an explicit step which is run on a tree before it is
+        first sent to the client. Containers such as Notebook and Stack
+        reimplement this method to defer the children which are not
+        yet visible. The default implementation recurses into the
+        children, unless they are deferred.
+
+        """
+        if not self.children_deferred:
+            for child in self.snap_children():
+                child.update_deferred()
+
     def snap_children(self):
         """ Get an iterable of children to include in the snapshot.
 
@@ -142,12 +364,7 @@ class Messenger(Declarative):
             instance and terminates with Object.
 
         """
-        names = []
-        for base in type(self).mro()[1:]:
-            names.append(base.__name__)
-            if base is Object:
-                break
-        return names
+        return SnapshotPlan.lookup(type(self)).base_names[:]
 
     #--------------------------------------------------------------------------
     # Messaging Support
@@ -203,22 +420,91 @@ class Messenger(Declarative):
 
         """
         # Children events are fired all the time. Only pull for a new
-        # snapshot if the widget has been fully activated.
-        if self.is_active:
+        # snapshot if the widget has been fully activated. Deferred
+        # children are sent in full when they are materialized.
+        if self.is_active and not self.children_deferred:
             content = {}
             new_set = set(event.new)
             old_set = set(event.old)
             added = new_set - old_set
             removed = old_set - new_set
-            content['order'] = [
+            order = [
                 c.object_id for c in event.new if isinstance(c, Messenger)
             ]
+            edits = None
+            if 'children_edits' in self.session.client_features:
+                old_order = [
+                    c.object_id for c in event.old
+                    if isinstance(c, Messenger)
+                ]
+                edits = children_edits(old_order, order)
+                # A script which carries more values than the full
+                # order is sent as the full order instead.
+                if _edits_size(edits) < len(order):
+                    content['edits'] = edits
+                    content['size'] = len(old_order)
+                else:
+                    edits = None
+            if edits is None:
+                content['order'] = order
             content['removed'] = [
                 c.object_id for c in removed if isinstance(c, Messenger)
             ]
-            content['added'] = [
-                c.snapshot() for c in added if isinstance(c, Messenger)
-            ]
+            added = [c for c in added if isinstance(c, Messenger)]
+            for child in added:
+                child.update_deferred()
+            content['added'] = self.session.share_snapshots([
+                c.snapshot() for c in added
+            ])
             self.send_action('children_changed', content)
         super(Messenger, self).children_event(event)
 
+    def materialize_children(self):
+        """ Send the deferred children of this object to the client.
+
+        The children are sent with a `children_changed` action and are
+        then activated. This is a no-op if the children of the object
+        are not deferred or if the object is not active.
+
+        """
+        if not (self.children_deferred and self.is_active):
+            return
+        self.children_deferred = False
+        children = self.snap_children()
+        for child in children:
+            child.update_deferred()
+        content = {}
+        content['order'] = [c.object_id for c in children]
+        content['removed'] = []
+        content['added'] = self.session.share_snapshots(
+            [c.snapshot() for c in children]
+        )
+        self.send_action('children_changed', content)
+        session = self.session
+        for child in self.children:
+            if child.is_initialized:
+                child.activate(session)
+
+    #--------------------------------------------------------------------------
+    # Message Handling
+    #--------------------------------------------------------------------------
+    def on_action_materialize_children(self, content):
+        """ Handle the 'materialize_children' action from the client.
+
+        """
+        self.materialize_children()
+
+    def on_action_children_resync(self, content):
+        """ Handle the 'children_resync' action from the client.
+
+        The client sends this action when it cannot apply the edit
+        script of a `children_changed` action. The full order of the
+        children is sent in reply.
+
+        """
+        if not self.children_deferred:
+            content = {}
+            content['order'] = [c.object_id for c in self.snap_children()]
+            content['removed'] = []
+            content['added'] = []
+            self.send_action('children_changed', content)
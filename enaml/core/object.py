@@ -12,6 +12,7 @@ from traits.api import (
 
 from enaml.utils import make_dispatcher, id_generator
 
+from .dynamic_scope import invalidate_scope_caches
 from .trait_types import EnamlEvent
 
 
@@ -266,11 +267,27 @@ class Object(HasStrictTraits):
         self.pre_activate(session)
         self._session = session
         session.register(self)
-        for child in self._children:
-            child.activate(session)
+        self.activate_children(session)
         self.state = 'active'
         self.post_activate(session)
 
+    def activate_children(self, session):
+        """ Called during the activation pass to activate the children.
+
+        The default implementation activates all of the children. A
+        subclass may reimplement this method to defer the activation
+        of its children. It is then responsible for activating them
+        at a later time.
+
+        Parameters
+        ----------
+        session : Session
+            The session to use for messaging with this object tree.
+
+        """
+        for child in self._children:
+            child.activate(session)
+
     def pre_activate(self, session):
         """ Called during the activation pass before any children are
         activated.
@@ -384,6 +401,7 @@ class Object(HasStrictTraits):
         if parent is not None and not isinstance(parent, Object):
             raise TypeError('parent must be an Object or None')
         self._parent = parent
+        invalidate_scope_caches()
         self.parent_event(ParentEvent(old_parent, parent))
         if old_parent is not None:
             old_kids = old_parent._children
@@ -444,6 +462,7 @@ class Object(HasStrictTraits):
             old_parent = child._parent
             if old_parent is not self:
                 child._parent = self
+                invalidate_scope_caches()
                 child.parent_event(ParentEvent(old_parent, self))
                 if old_parent is not None:
                     old_kids = old_parent._children
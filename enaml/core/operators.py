@@ -83,7 +83,9 @@ def op_subscribe(obj, name, func, identifiers):
     attribute on the object. The function takes one argument: a code
     tracer, and returns the value of the expression. It is patched for
     dynamic scoping and code tracing and it should be invoked with
-    `funchelper.call_func(...)`.
+    `funchelper.call_func(...)`. If the expression is a plain attribute
+    chain, the function also has an attribute named `_chain` which is
+    the tuple of names in the chain.
 
     """
     expr = SubscriptionExpression(func, identifiers)
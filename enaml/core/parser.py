@@ -3169,10 +3169,48 @@ def p_error(t):
 # Get a save directory for the lex and parse tables
 _parse_dir = os.path.join(os.path.dirname(__file__), 'parse_tab')
 _parse_module = 'enaml.core.parse_tab.parsetab'
-_parser = yacc.yacc(
-    debug=0, outputdir=_parse_dir, tabmodule=_parse_module, optimize=1,
-    errorlog=yacc.NullLogger(),
-)
+
+
+#: The parser instance, which is created on the first call to `parse`.
+_parser = None
+
+
+def _make_parser():
+    """ Create the parser for the Enaml grammar.
+
+    The parser is built directly from the generated tables when they
+    can be loaded, which skips the reflection over the grammar rules
+    performed by `yacc.yacc`. That reflection only serves to validate
+    the tables against the grammar, which yacc also skips in optimized
+    mode. If the tables are missing or were written by a different
+    version of Ply, `yacc.yacc` is used to regenerate them.
+
+    """
+    try:
+        lr = yacc.LRTable()
+        lr.read_table(_parse_module)
+        lr.bind_callables(globals())
+        return yacc.LRParser(lr, p_error)
+    except Exception:
+        pass
+    return yacc.yacc(
+        debug=0, outputdir=_parse_dir, tabmodule=_parse_module, optimize=1,
+        errorlog=yacc.NullLogger(),
+    )
+
+
+def _get_parser():
+    """ Get the parser for the Enaml grammar, creating it if needed.
+
+    The parser is created lazily so that processes which load all of
+    their modules from the compiled caches never pay for it.
+
+    """
+    global _parser
+    parser = _parser
+    if parser is None:
+        parser = _parser = _make_parser()
+    return parser
 
 
 def parse(enaml_source, filename='Enaml'):
@@ -3185,8 +3223,9 @@ def parse(enaml_source, filename='Enaml'):
     # stop parsing immediately and then re-raise the errors outside
     # of the control of Ply.
     try:
+        parser = _get_parser()
         lexer = EnamlLexer(filename)
-        return _parser.parse(enaml_source, debug=0, lexer=lexer)
+        return parser.parse(enaml_source, debug=0, lexer=lexer)
     except ParsingError as parse_error:
         raise parse_error()
 
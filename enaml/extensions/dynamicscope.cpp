@@ -0,0 +1,772 @@
+/*-----------------------------------------------------------------------------
+|  Copyright (c) 2012, Enthought, Inc.
+|  All rights reserved.
+|----------------------------------------------------------------------------*/
+#include <iostream>
+#include <sstream>
+#include "pythonhelpers.h"
+
+
+using namespace PythonHelpers;
+
+extern "C" {
+
+// Type structure for DynamicScope instances
+typedef struct {
+    PyObject_HEAD
+    PyObject* obj;
+    PyObject* identifiers;
+    PyObject* overrides;
+    PyObject* listener;
+    PyObject* cache;
+} DynamicScope;
+
+
+// Type structure for Nonlocals instances
+typedef struct {
+    PyObject_HEAD
+    PyObject* obj;
+    PyObject* listener;
+    PyObject* cache;
+} Nonlocals;
+
+
+// The DynamicAttributeError class from enaml.core.dynamic_scope
+static PyObject* DynamicAttributeError;
+
+
+// The interned string 'parent'
+static PyObject* ParentStr;
+
+
+// The interned string 'dynamic_load'
+static PyObject* DynamicLoadStr;
+
+
+/*-----------------------------------------------------------------------------
+| Scope Lookup Helpers
+|----------------------------------------------------------------------------*/
+/* Notify the listener of a dynamic load, if the listener is not None.
+
+Returns 0 on success, -1 on failure.
+
+*/
+static int
+notify_listener( PyObject* listener, PyObject* obj, PyObject* name, PyObject* value )
+{
+    if( listener == Py_None )
+        return 0;
+    PyObjectPtr res(
+        PyObject_CallMethodObjArgs( listener, DynamicLoadStr, obj, name, value, 0 )
+    );
+    if( !res )
+        return -1;
+    return 0;
+}
+
+
+/* Classify the pending exception raised by a failed getattr.
+
+Returns 1 if the error is a plain AttributeError, which is cleared and
+means the lookup should continue with the next ancestor. Returns 0 if
+the error should propagate; this includes DynamicAttributeError.
+
+*/
+static int
+is_scope_miss( void )
+{
+    if( PyErr_ExceptionMatches( DynamicAttributeError ) )
+        return 0;
+    if( PyErr_ExceptionMatches( PyExc_AttributeError ) )
+    {
+        PyErr_Clear();
+        return 1;
+    }
+    return 0;
+}
+
+
+/* Try the ancestor which resolved the name on a previous lookup.
+
+The cache maps a name to the number of parent steps from the object to
+the ancestor which resolved it. Returns a new reference to the value on
+success. Returns null with no exception set if the cache cannot be used
+for the name, and null with an exception set on failure.
+
+*/
+static PyObject*
+cached_lookup( PyObject* obj, PyObject* name, PyObject* listener, PyObject* cache )
+{
+    PyObject* pydepth = PyDict_GetItem( cache, name );
+    if( !pydepth )
+        return 0;
+    Py_ssize_t depth = PyInt_AsSsize_t( pydepth );
+    if( depth < 0 )
+    {
+        PyErr_Clear();
+        return 0;
+    }
+    PyObjectPtr parent( obj, true );
+    for( Py_ssize_t i = 0; i < depth; ++i )
+    {
+        parent = PyObjectPtr( PyObject_GetAttr( parent.get(), ParentStr ) );
+        if( !parent )
+            return 0;
+        if( parent.is_None() )
+            return 0;
+    }
+    PyObjectPtr value( PyObject_GetAttr( parent.get(), name ) );
+    if( !value )
+    {
+        // The ancestor no longer resolves the name, so the cache entry
+        // is dropped and the full lookup is run.
+        if( is_scope_miss() )
+            PyDict_DelItem( cache, name );
+        return 0;
+    }
+    if( notify_listener( listener, parent.get(), name, value.get() ) < 0 )
+        return 0;
+    return value.release();
+}
+
+
+/* Walk the ancestors of the object to resolve the name.
+
+Returns a new reference to the value on success. Returns null with a
+KeyError set if no ancestor resolves the name, and null with another
+exception set on failure.
+
+*/
+static PyObject*
+ancestor_lookup( PyObject* obj, PyObject* name, PyObject* listener, PyObject* cache )
+{
+    if( cache != Py_None )
+    {
+        PyObject* value = cached_lookup( obj, name, listener, cache );
+        if( value || PyErr_Occurred() )
+            return value;
+    }
+    Py_ssize_t depth = 0;
+    PyObjectPtr parent( obj, true );
+    while( !parent.is_None() )
+    {
+        PyObjectPtr value( PyObject_GetAttr( parent.get(), name ) );
+        if( value )
+        {
+            if( cache != Py_None )
+            {
+                PyObjectPtr pydepth( PyInt_FromSsize_t( depth ) );
+                if( !pydepth )
+                    return 0;
+                if( PyDict_SetItem( cache, name, pydepth.get() ) < 0 )
+                    return 0;
+            }
+            if( notify_listener( listener, parent.get(), name, value.get() ) < 0 )
+                return 0;
+            return value.release();
+        }
+        if( !is_scope_miss() )
+            return 0;
+        parent = PyObjectPtr( PyObject_GetAttr( parent.get(), ParentStr ) );
+        if( !parent )
+            return 0;
+        ++depth;
+    }
+    PyErr_SetObject( PyExc_KeyError, name );
+    return 0;
+}
+
+
+/* Test whether a lookup function resolves a name, without notifying.
+
+Returns 1 if the name is resolved, 0 if not, and -1 on failure.
+
+*/
+static int
+lookup_contains( PyObject* obj, PyObject* name, PyObject* cache )
+{
+    if( !PyString_Check( name ) && !PyUnicode_Check( name ) )
+        return 0;
+    PyObjectPtr value( ancestor_lookup( obj, name, Py_None, cache ) );
+    if( value )
+        return 1;
+    if( PyErr_ExceptionMatches( PyExc_KeyError ) )
+    {
+        PyErr_Clear();
+        return 0;
+    }
+    return -1;
+}
+
+
+/*-----------------------------------------------------------------------------
+| DynamicScope
+|----------------------------------------------------------------------------*/
+static PyObject*
+DynamicScope_new( PyTypeObject* type, PyObject* args, PyObject* kwargs )
+{
+    PyObject* obj;
+    PyObject* identifiers;
+    PyObject* overrides;
+    PyObject* listener;
+    PyObject* cache = Py_None;
+    static char* kwlist[] = {
+        "obj", "identifiers", "overrides", "listener", "cache", 0
+    };
+    if( !PyArg_ParseTupleAndKeywords(
+        args, kwargs, "OOOO|O", kwlist,
+        &obj, &identifiers, &overrides, &listener, &cache ) )
+        return 0;
+    if( !PyDict_Check( identifiers ) )
+        return py_expected_type_fail( identifiers, "dict" );
+    if( !PyDict_Check( overrides ) )
+        return py_expected_type_fail( overrides, "dict" );
+    if( cache != Py_None && !PyDict_Check( cache ) )
+        return py_expected_type_fail( cache, "dict" );
+    PyObjectPtr scopeptr( PyType_GenericNew( type, args, kwargs ) );
+    if( !scopeptr )
+        return 0;
+    DynamicScope* scope = reinterpret_cast<DynamicScope*>( scopeptr.get() );
+    Py_INCREF( obj );
+    scope->obj = obj;
+    Py_INCREF( identifiers );
+    scope->identifiers = identifiers;
+    Py_INCREF( overrides );
+    scope->overrides = overrides;
+    Py_INCREF( listener );
+    scope->listener = listener;
+    Py_INCREF( cache );
+    scope->cache = cache;
+    return scopeptr.release();
+}
+
+
+static void
+DynamicScope_clear( DynamicScope* self )
+{
+    Py_CLEAR( self->obj );
+    Py_CLEAR( self->identifiers );
+    Py_CLEAR( self->overrides );
+    Py_CLEAR( self->listener );
+    Py_CLEAR( self->cache );
+}
+
+
+static int
+DynamicScope_traverse( DynamicScope* self, visitproc visit, void* arg )
+{
+    Py_VISIT( self->obj );
+    Py_VISIT( self->identifiers );
+    Py_VISIT( self->overrides );
+    Py_VISIT( self->listener );
+    Py_VISIT( self->cache );
+    return 0;
+}
+
+
+static void
+DynamicScope_dealloc( DynamicScope* self )
+{
+    PyObject_GC_UnTrack( self );
+    DynamicScope_clear( self );
+    self->ob_type->tp_free( reinterpret_cast<PyObject*>( self ) );
+}
+
+
+static PyObject*
+DynamicScope_getitem( DynamicScope* self, PyObject* name )
+{
+    PyObject* value = PyDict_GetItem( self->overrides, name );
+    if( value )
+    {
+        Py_INCREF( value );
+        return value;
+    }
+    value = PyDict_GetItem( self->identifiers, name );
+    if( value )
+    {
+        Py_INCREF( value );
+        return value;
+    }
+    return ancestor_lookup( self->obj, name, self->listener, self->cache );
+}
+
+
+static int
+DynamicScope_setitem( DynamicScope* self, PyObject* name, PyObject* value )
+{
+    // This method is required for pdb to function properly.
+    if( !value )
+        return PyDict_DelItem( self->overrides, name );
+    return PyDict_SetItem( self->overrides, name, value );
+}
+
+
+static int
+DynamicScope_contains( DynamicScope* self, PyObject* name )
+{
+    // This method is required for pdb to function properly.
+    if( !PyString_Check( name ) && !PyUnicode_Check( name ) )
+        return 0;
+    int res = PyDict_Contains( self->overrides, name );
+    if( res != 0 )
+        return res;
+    res = PyDict_Contains( self->identifiers, name );
+    if( res != 0 )
+        return res;
+    return lookup_contains( self->obj, name, self->cache );
+}
+
+
+PyDoc_STRVAR(DynamicScope__doc__,
+"DynamicScope(obj, identifiers, overrides, listener[, cache])\n\n"
+"A custom mapping object that implements Enaml's dynamic scope.\n\n"
+"Parameters\n"
+"----------\n"
+"obj : Declarative\n"
+"    The Declarative object which owns the executing code.\n\n"
+"identifiers : dict\n"
+"    The identifiers available to the executing code.\n\n"
+"overrides : dict\n"
+"    A dict of objects which should have higher precedence than\n"
+"    the identifiers.\n\n"
+"listener : DynamicScopeListener or None\n"
+"    A listener which should be notified when a name is loaded\n"
+"    via dynamic scoping.\n\n"
+"cache : dict or None, optional\n"
+"    A dict which maps a name to the number of parent steps to the\n"
+"    ancestor which resolved it. See `ScopeCache`.\n\n");
+
+
+static PyMappingMethods
+DynamicScope_as_mapping = {
+    (lenfunc)0,                             /* mp_length */
+    (binaryfunc)DynamicScope_getitem,       /* mp_subscript */
+    (objobjargproc)DynamicScope_setitem,    /* mp_ass_subscript */
+};
+
+
+static PySequenceMethods
+DynamicScope_as_sequence = {
+    (lenfunc)0,                             /* sq_length */
+    (binaryfunc)0,                          /* sq_concat */
+    (ssizeargfunc)0,                        /* sq_repeat */
+    (ssizeargfunc)0,                        /* sq_item */
+    (ssizessizeargfunc)0,                   /* sq_slice */
+    (ssizeobjargproc)0,                     /* sq_ass_item */
+    (ssizessizeobjargproc)0,                /* sq_ass_slice */
+    (objobjproc)DynamicScope_contains,      /* sq_contains */
+    (binaryfunc)0,                          /* sq_inplace_concat */
+    (ssizeargfunc)0,                        /* sq_inplace_repeat */
+};
+
+
+PyTypeObject DynamicScope_Type = {
+    PyObject_HEAD_INIT( 0 )
+    0,                                      /* ob_size */
+    "dynamicscope.DynamicScope",            /* tp_name */
+    sizeof( DynamicScope ),                 /* tp_basicsize */
+    0,                                      /* tp_itemsize */
+    (destructor)DynamicScope_dealloc,       /* tp_dealloc */
+    (printfunc)0,                           /* tp_print */
+    (getattrfunc)0,                         /* tp_getattr */
+    (setattrfunc)0,                         /* tp_setattr */
+    (cmpfunc)0,                             /* tp_compare */
+    (reprfunc)0,                            /* tp_repr */
+    (PyNumberMethods*)0,                    /* tp_as_number */
+    &DynamicScope_as_sequence,              /* tp_as_sequence */
+    &DynamicScope_as_mapping,               /* tp_as_mapping */
+    (hashfunc)0,                            /* tp_hash */
+    (ternaryfunc)0,                         /* tp_call */
+    (reprfunc)0,                            /* tp_str */
+    (getattrofunc)0,                        /* tp_getattro */
+    (setattrofunc)0,                        /* tp_setattro */
+    (PyBufferProcs*)0,                      /* tp_as_buffer */
+    Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC, /* tp_flags */
+    DynamicScope__doc__,                    /* Documentation string */
+    (traverseproc)DynamicScope_traverse,    /* tp_traverse */
+    (inquiry)DynamicScope_clear,            /* tp_clear */
+    (richcmpfunc)0,                         /* tp_richcompare */
+    0,                                      /* tp_weaklistoffset */
+    (getiterfunc)0,                         /* tp_iter */
+    (iternextfunc)0,                        /* tp_iternext */
+    (struct PyMethodDef*)0,                 /* tp_methods */
+    (struct PyMemberDef*)0,                 /* tp_members */
+    0,                                      /* tp_getset */
+    0,                                      /* tp_base */
+    0,                                      /* tp_dict */
+    (descrgetfunc)0,                        /* tp_descr_get */
+    (descrsetfunc)0,                        /* tp_descr_set */
+    0,                                      /* tp_dictoffset */
+    (initproc)0,                            /* tp_init */
+    (allocfunc)PyType_GenericAlloc,         /* tp_alloc */
+    (newfunc)DynamicScope_new,              /* tp_new */
+    (freefunc)0,                            /* tp_free */
+    (inquiry)0,                             /* tp_is_gc */
+    0,                                      /* tp_bases */
+    0,                                      /* tp_mro */
+    0,                                      /* tp_cache */
+    0,                                      /* tp_subclasses */
+    0,                                      /* tp_weaklist */
+    (destructor)0                           /* tp_del */
+};
+
+
+/*-----------------------------------------------------------------------------
+| Nonlocals
+|----------------------------------------------------------------------------*/
+static PyObject*
+Nonlocals_create( PyTypeObject* type, PyObject* obj, PyObject* listener, PyObject* cache )
+{
+    PyObjectPtr nlsptr( PyType_GenericAlloc( type, 0 ) );
+    if( !nlsptr )
+        return 0;
+    Nonlocals* nls = reinterpret_cast<Nonlocals*>( nlsptr.get() );
+    Py_INCREF( obj );
+    nls->obj = obj;
+    Py_INCREF( listener );
+    nls->listener = listener;
+    Py_INCREF( cache );
+    nls->cache = cache;
+    return nlsptr.release();
+}
+
+
+static PyObject*
+Nonlocals_new( PyTypeObject* type, PyObject* args, PyObject* kwargs )
+{
+    PyObject* obj;
+    PyObject* listener;
+    PyObject* cache = Py_None;
+    static char* kwlist[] = { "obj", "listener", "cache", 0 };
+    if( !PyArg_ParseTupleAndKeywords(
+        args, kwargs, "OO|O", kwlist, &obj, &listener, &cache ) )
+        return 0;
+    if( cache != Py_None && !PyDict_Check( cache ) )
+        return py_expected_type_fail( cache, "dict" );
+    return Nonlocals_create( type, obj, listener, cache );
+}
+
+
+static void
+Nonlocals_clear( Nonlocals* self )
+{
+    Py_CLEAR( self->obj );
+    Py_CLEAR( self->listener );
+    Py_CLEAR( self->cache );
+}
+
+
+static int
+Nonlocals_traverse( Nonlocals* self, visitproc visit, void* arg )
+{
+    Py_VISIT( self->obj );
+    Py_VISIT( self->listener );
+    Py_VISIT( self->cache );
+    return 0;
+}
+
+
+static void
+Nonlocals_dealloc( Nonlocals* self )
+{
+    PyObject_GC_UnTrack( self );
+    Nonlocals_clear( self );
+    self->ob_type->tp_free( reinterpret_cast<PyObject*>( self ) );
+}
+
+
+static PyObject*
+Nonlocals_repr( Nonlocals* self )
+{
+    PyObjectPtr objrepr( PyObject_Str( self->obj ) );
+    if( !objrepr )
+        return 0;
+    return PyString_FromFormat( "Nonlocals[%s]", PyString_AsString( objrepr.get() ) );
+}
+
+
+static PyObject*
+Nonlocals_call( Nonlocals* self, PyObject* args, PyObject* kwargs )
+{
+    PyObject* pylevel = 0;
+    static char* kwlist[] = { "level", 0 };
+    if( !PyArg_ParseTupleAndKeywords( args, kwargs, "|O", kwlist, &pylevel ) )
+        return 0;
+    Py_ssize_t level = 0;
+    if( pylevel )
+    {
+        if( !PyInt_Check( pylevel ) || PyInt_AS_LONG( pylevel ) < 0 )
+        {
+            PyObjectPtr levelrepr( PyObject_Repr( pylevel ) );
+            if( !levelrepr )
+                return 0;
+            PyErr_Format(
+                PyExc_ValueError,
+                "The nonlocal scope level must be an int >= 0. Got %s instead.",
+                PyString_AsString( levelrepr.get() )
+            );
+            return 0;
+        }
+        level = PyInt_AS_LONG( pylevel );
+    }
+    Py_ssize_t offset = 0;
+    PyObjectPtr target( self->obj, true );
+    while( !target.is_None() && offset != level )
+    {
+        target = PyObjectPtr( PyObject_GetAttr( target.get(), ParentStr ) );
+        if( !target )
+            return 0;
+        ++offset;
+    }
+    if( offset != level )
+    {
+        PyErr_Format(
+            PyExc_ValueError, "Scope level %zd is out of range", level
+        );
+        return 0;
+    }
+    // The cache is only valid for lookups which start at the object
+    // which owns the executing code.
+    PyObject* cache = level == 0 ? self->cache : Py_None;
+    return Nonlocals_create(
+        self->ob_type, target.get(), self->listener, cache
+    );
+}
+
+
+static PyObject*
+Nonlocals_getitem( Nonlocals* self, PyObject* name )
+{
+    return ancestor_lookup( self->obj, name, self->listener, self->cache );
+}
+
+
+static int
+Nonlocals_setitem( Nonlocals* self, PyObject* name, PyObject* value )
+{
+    if( !value )
+    {
+        PyErr_SetString( PyExc_TypeError, "cannot delete a nonlocal" );
+        return -1;
+    }
+    PyObjectPtr parent( self->obj, true );
+    while( !parent.is_None() )
+    {
+        // It's not sufficient to try to do setattr(...) here and
+        // catch the AttributeError, because HasStrictTraits raises
+        // a TraitError in these cases and it becomes impossible
+        // to distinguish that error from a trait typing error
+        // without checking the message of the exception.
+        PyObjectPtr current( PyObject_GetAttr( parent.get(), name ) );
+        if( !current )
+        {
+            if( PyErr_ExceptionMatches( DynamicAttributeError ) )
+                PyErr_Clear(); // ignore uninitialized attribute errors
+            else if( is_scope_miss() )
+            {
+                parent = PyObjectPtr( PyObject_GetAttr( parent.get(), ParentStr ) );
+                if( !parent )
+                    return -1;
+                continue;
+            }
+            else
+                return -1;
+        }
+        return PyObject_SetAttr( parent.get(), name, value );
+    }
+    PyErr_SetObject( PyExc_KeyError, name );
+    return -1;
+}
+
+
+static int
+Nonlocals_contains( Nonlocals* self, PyObject* name )
+{
+    return lookup_contains( self->obj, name, self->cache );
+}
+
+
+static PyObject*
+Nonlocals_getattro( Nonlocals* self, PyObject* name )
+{
+    PyObject* value = PyObject_GenericGetAttr(
+        reinterpret_cast<PyObject*>( self ), name
+    );
+    if( value || !PyErr_ExceptionMatches( PyExc_AttributeError ) )
+        return value;
+    PyErr_Clear();
+    value = Nonlocals_getitem( self, name );
+    if( !value && PyErr_ExceptionMatches( PyExc_KeyError ) )
+    {
+        PyErr_Clear();
+        PyObjectPtr selfrepr( Nonlocals_repr( self ) );
+        if( !selfrepr )
+            return 0;
+        PyErr_Format(
+            PyExc_AttributeError, "%s has no attribute '%s'",
+            PyString_AsString( selfrepr.get() ), PyString_AsString( name )
+        );
+    }
+    return value;
+}
+
+
+static int
+Nonlocals_setattro( Nonlocals* self, PyObject* name, PyObject* value )
+{
+    int res = Nonlocals_setitem( self, name, value );
+    if( res < 0 && PyErr_ExceptionMatches( PyExc_KeyError ) )
+    {
+        PyErr_Clear();
+        PyObjectPtr selfrepr( Nonlocals_repr( self ) );
+        if( !selfrepr )
+            return -1;
+        PyErr_Format(
+            PyExc_AttributeError, "%s has no attribute '%s'",
+            PyString_AsString( selfrepr.get() ), PyString_AsString( name )
+        );
+    }
+    return res;
+}
+
+
+PyDoc_STRVAR(Nonlocals__doc__,
+"Nonlocals(obj, listener[, cache])\n\n"
+"An object which implements userland dynamic scoping.\n\n"
+"Parameters\n"
+"----------\n"
+"obj : Declarative\n"
+"    The Declarative object which owns the executing code.\n\n"
+"listener : DynamicScopeListener or None\n"
+"    A listener which should be notified when a name is loaded\n"
+"    via dynamic scoping.\n\n"
+"cache : dict or None, optional\n"
+"    A dict which maps a name to the number of parent steps to the\n"
+"    ancestor which resolved it. See `ScopeCache`.\n\n");
+
+
+static PyMappingMethods
+Nonlocals_as_mapping = {
+    (lenfunc)0,                             /* mp_length */
+    (binaryfunc)Nonlocals_getitem,          /* mp_subscript */
+    (objobjargproc)Nonlocals_setitem,       /* mp_ass_subscript */
+};
+
+
+static PySequenceMethods
+Nonlocals_as_sequence = {
+    (lenfunc)0,                             /* sq_length */
+    (binaryfunc)0,                          /* sq_concat */
+    (ssizeargfunc)0,                        /* sq_repeat */
+    (ssizeargfunc)0,                        /* sq_item */
+    (ssizessizeargfunc)0,                   /* sq_slice */
+    (ssizeobjargproc)0,                     /* sq_ass_item */
+    (ssizessizeobjargproc)0,                /* sq_ass_slice */
+    (objobjproc)Nonlocals_contains,         /* sq_contains */
+    (binaryfunc)0,                          /* sq_inplace_concat */
+    (ssizeargfunc)0,                        /* sq_inplace_repeat */
+};
+
+
+PyTypeObject Nonlocals_Type = {
+    PyObject_HEAD_INIT( 0 )
+    0,                                      /* ob_size */
+    "dynamicscope.Nonlocals",               /* tp_name */
+    sizeof( Nonlocals ),                    /* tp_basicsize */
+    0,                                      /* tp_itemsize */
+    (destructor)Nonlocals_dealloc,          /* tp_dealloc */
+    (printfunc)0,                           /* tp_print */
+    (getattrfunc)0,                         /* tp_getattr */
+    (setattrfunc)0,                         /* tp_setattr */
+    (cmpfunc)0,                             /* tp_compare */
+    (reprfunc)Nonlocals_repr,               /* tp_repr */
+    (PyNumberMethods*)0,                    /* tp_as_number */
+    &Nonlocals_as_sequence,                 /* tp_as_sequence */
+    &Nonlocals_as_mapping,                  /* tp_as_mapping */
+    (hashfunc)0,                            /* tp_hash */
+    (ternaryfunc)Nonlocals_call,            /* tp_call */
+    (reprfunc)0,                            /* tp_str */
+    (getattrofunc)Nonlocals_getattro,       /* tp_getattro */
+    (setattrofunc)Nonlocals_setattro,       /* tp_setattro */
+    (PyBufferProcs*)0,                      /* tp_as_buffer */
+    Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC, /* tp_flags */
+    Nonlocals__doc__,                       /* Documentation string */
+    (traverseproc)Nonlocals_traverse,       /* tp_traverse */
+    (inquiry)Nonlocals_clear,               /* tp_clear */
+    (richcmpfunc)0,                         /* tp_richcompare */
+    0,                                      /* tp_weaklistoffset */
+    (getiterfunc)0,                         /* tp_iter */
+    (iternextfunc)0,                        /* tp_iternext */
+    (struct PyMethodDef*)0,                 /* tp_methods */
+    (struct PyMemberDef*)0,                 /* tp_members */
+    0,                                      /* tp_getset */
+    0,                                      /* tp_base */
+    0,                                      /* tp_dict */
+    (descrgetfunc)0,                        /* tp_descr_get */
+    (descrsetfunc)0,                        /* tp_descr_set */
+    0,                                      /* tp_dictoffset */
+    (initproc)0,                            /* tp_init */
+    (allocfunc)PyType_GenericAlloc,         /* tp_alloc */
+    (newfunc)Nonlocals_new,                 /* tp_new */
+    (freefunc)0,                            /* tp_free */
+    (inquiry)0,                             /* tp_is_gc */
+    0,                                      /* tp_bases */
+    0,                                      /* tp_mro */
+    0,                                      /* tp_cache */
+    0,                                      /* tp_subclasses */
+    0,                                      /* tp_weaklist */
+    (destructor)0                           /* tp_del */
+};
+
+
+/*-----------------------------------------------------------------------------
+| DynamicScope Module
+|----------------------------------------------------------------------------*/
+static PyMethodDef
+dynamicscope_methods[] = {
+    { 0 } // Sentinel
+};
+
+
+PyMODINIT_FUNC
+initdynamicscope( void )
+{
+    PyObject* mod = Py_InitModule( "dynamicscope", dynamicscope_methods );
+    if( !mod )
+        return;
+
+    PyObjectPtr parent_str( PyString_InternFromString( "parent" ) );
+    if( !parent_str )
+        return;
+    PyObjectPtr dynamic_load_str( PyString_InternFromString( "dynamic_load" ) );
+    if( !dynamic_load_str )
+        return;
+
+    if( PyType_Ready( &DynamicScope_Type ) )
+        return;
+    if( PyType_Ready( &Nonlocals_Type ) )
+        return;
+
+    // The types are added before importing the dynamic_scope module,
+    // since that module imports them from this one on load.
+    PyObjectPtr ds_type( reinterpret_cast<PyObject*>( &DynamicScope_Type ), true );
+    if( PyModule_AddObject( mod, "DynamicScope", ds_type.release() ) == -1 )
+        return;
+    PyObjectPtr nls_type( reinterpret_cast<PyObject*>( &Nonlocals_Type ), true );
+    if( PyModule_AddObject( mod, "Nonlocals", nls_type.release() ) == -1 )
+        return;
+
+    PyObjectPtr ds_mod( PyImport_ImportModule( "enaml.core.dynamic_scope" ) );
+    if( !ds_mod )
+        return;
+    PyObjectPtr dae_cls( ds_mod.get_attr( "DynamicAttributeError" ) );
+    if( !dae_cls )
+        return;
+
+    ParentStr = parent_str.release();
+    DynamicLoadStr = dynamic_load_str.release();
+    DynamicAttributeError = dae_cls.release();
+}
+
+} // extern "C"
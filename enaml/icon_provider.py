@@ -27,14 +27,15 @@ class IconImage(HasTraits):
     #: The image to use for this icon.
     image = Instance(Image)
 
-    def snapshot(self):
+    def snapshot(self, frames=None):
         """ Get a snapshot dictionary for this icon image.
 
         """
         snap = {}
         snap['mode'] = self.mode
         snap['state'] = self.state
-        snap['image'] = self.image.snapshot() if self.image else None
+        image = self.image
+        snap['image'] = image.snapshot(frames) if image else None
         return snap
 
 
@@ -49,12 +50,12 @@ class Icon(Resource):
     #: The list of icon images which compose this icon.
     images = List(IconImage)
 
-    def snapshot(self):
+    def snapshot(self, frames=None):
         """ Get a snapshot dictionary for this icon.
 
         """
-        snap = super(Icon, self).snapshot()
-        snap['images'] = [image.snapshot() for image in self.images]
+        snap = super(Icon, self).snapshot(frames)
+        snap['images'] = [image.snapshot(frames) for image in self.images]
         return snap
 
 
@@ -42,14 +42,18 @@ class Image(Resource):
     #: The bytestring holding the data for the image.
     data = Str
 
-    def snapshot(self):
+    def snapshot(self, frames=None):
         """ Get a snapshot dictionary for this image.
 
         """
-        snap = super(Image, self).snapshot()
+        snap = super(Image, self).snapshot(frames)
         snap['format'] = self.format
         snap['size'] = self.size
-        snap['data'] = self.data
+        if frames is None:
+            snap['data'] = self.data
+        else:
+            snap['data'] = {'frame': len(frames)}
+            frames.append(self.data)
         return snap
 
 
@@ -0,0 +1,336 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import json
+
+
+#: The layout manager operations which are timed by the instrumentation.
+OPERATIONS = (
+    'initialize', 'replace_constraints', 'layout', 'get_min_size',
+    'get_max_size',
+)
+
+
+def owner_label(widget):
+    """ Get the label under which the statistics of a layout owning
+    toolkit container are recorded.
+
+    Parameters
+    ----------
+    widget : object
+        A toolkit widget with an `object_id` method.
+
+    Returns
+    -------
+    result : str
+        A 'ClassName:object_id' label for the widget.
+
+    """
+    return '%s:%s' % (type(widget).__name__, widget.object_id())
+
+
+def count_variables(constraints):
+    """ Count the distinct variables referenced by constraints.
+
+    Parameters
+    ----------
+    constraints : iterable
+        An iterable of casuarius LinearConstraint objects.
+
+    Returns
+    -------
+    result : int
+        The number of distinct constraint variables.
+
+    """
+    variables = set()
+    add = variables.add
+    for cn in constraints:
+        for term in cn.lhs.terms:
+            add(term.var)
+        for term in cn.rhs.terms:
+            add(term.var)
+    return len(variables)
+
+
+class TimingStats(object):
+    """ An object which accumulates the timings of an operation.
+
+    """
+    __slots__ = ('count', 'cumulative', 'max')
+
+    def __init__(self):
+        self.count = 0
+        self.cumulative = 0.0
+        self.max = 0.0
+
+    def record(self, elapsed):
+        """ Record a timing of the operation.
+
+        """
+        self.count += 1
+        self.cumulative += elapsed
+        if elapsed > self.max:
+            self.max = elapsed
+
+    def as_dict(self):
+        """ Get the timings as a JSON serializable dict.
+
+        """
+        count = self.count
+        return {
+            'count': count,
+            'cumulative': self.cumulative,
+            'mean': self.cumulative / count if count else 0.0,
+            'max': self.max,
+        }
+
+
+class ContainerLayoutStats(object):
+    """ An object which accumulates the statistics of a layout owner.
+
+    """
+    __slots__ = (
+        'owner', 'constraints', 'variables', 'timings', 'relayouts',
+        'resize_latency',
+    )
+
+    def __init__(self, owner):
+        """ Initialize a ContainerLayoutStats.
+
+        Parameters
+        ----------
+        owner : str
+            The label of the layout owner.
+
+        """
+        self.owner = owner
+        self.constraints = 0
+        self.variables = 0
+        self.timings = {}
+        self.relayouts = {}
+        self.resize_latency = TimingStats()
+
+    def as_dict(self):
+        """ Get the statistics as a JSON serializable dict.
+
+        """
+        timings = {}
+        for operation, stats in self.timings.iteritems():
+            timings[operation] = stats.as_dict()
+        return {
+            'owner': self.owner,
+            'constraints': self.constraints,
+            'variables': self.variables,
+            'timings': timings,
+            'relayouts': dict(self.relayouts),
+            'resize_latency': self.resize_latency.as_dict(),
+        }
+
+
+class LayoutInstrumentation(object):
+    """ An object which records the statistics of the layout system.
+
+    When enabled, the statistics are recorded per layout owner:
+
+        - The size of the constraint system, updated whenever the
+          constraints of the layout manager are initialized or
+          replaced.
+
+        - The time spent in the `initialize`, `replace_constraints`,
+          `layout`, `get_min_size` and `get_max_size` methods of the
+          layout manager.
+
+        - The number of relayouts, keyed on their trigger. A trigger is
+          'relayout' for a rebuild of the layout table and constraints,
+          and 'replace_constraints' for an update of a subset of the
+          constraints, such as the size hint constraints of a child.
+
+        - The resize latency, which is the time from a resize event to
+          the end of the layout pass which precedes the next paint.
+
+    The instrumentation is disabled by default, in which case the
+    layout code only pays for a check of the `enabled` attribute.
+    There is a single instance of the instrumentation,
+    `layout_instrumentation`.
+
+    """
+    def __init__(self):
+        """ Initialize a LayoutInstrumentation.
+
+        """
+        #: Whether the instrumentation records the layout statistics.
+        self.enabled = False
+
+        self._stats = {}
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _owner_stats(self, owner):
+        """ Get the statistics object for a layout owner.
+
+        """
+        stats = self._stats.get(owner)
+        if stats is None:
+            stats = self._stats[owner] = ContainerLayoutStats(owner)
+        return stats
+
+    #--------------------------------------------------------------------------
+    # Recording API
+    #--------------------------------------------------------------------------
+    def record_time(self, owner, operation, elapsed):
+        """ Record the time taken by a layout manager operation.
+
+        Parameters
+        ----------
+        owner : str
+            The label of the layout owner.
+
+        operation : str
+            The name of the operation. One of `OPERATIONS`.
+
+        elapsed : float
+            The time taken by the operation, in seconds.
+
+        """
+        timings = self._owner_stats(owner).timings
+        stats = timings.get(operation)
+        if stats is None:
+            stats = timings[operation] = TimingStats()
+        stats.record(elapsed)
+
+    def record_system(self, owner, constraints):
+        """ Record the size of the constraint system of a layout owner.
+
+        Parameters
+        ----------
+        owner : str
+            The label of the layout owner.
+
+        constraints : set
+            The current set of constraints of the layout manager.
+
+        """
+        stats = self._owner_stats(owner)
+        stats.constraints = len(constraints)
+        stats.variables = count_variables(constraints)
+
+    def record_relayout(self, owner, trigger):
+        """ Record a relayout of a layout owner.
+
+        Parameters
+        ----------
+        owner : str
+            The label of the layout owner.
+
+        trigger : str
+            The trigger of the relayout.
+
+        """
+        relayouts = self._owner_stats(owner).relayouts
+        relayouts[trigger] = relayouts.get(trigger, 0) + 1
+
+    def record_resize_latency(self, owner, elapsed):
+        """ Record the latency of a resize of a layout owner.
+
+        Parameters
+        ----------
+        owner : str
+            The label of the layout owner.
+
+        elapsed : float
+            The time from the resize event to the end of the layout
+            pass, in seconds.
+
+        """
+        self._owner_stats(owner).resize_latency.record(elapsed)
+
+    #--------------------------------------------------------------------------
+    # Public API
+    #--------------------------------------------------------------------------
+    def reset(self):
+        """ Discard the recorded statistics.
+
+        """
+        self._stats = {}
+
+    def snapshot(self):
+        """ Get a snapshot of the recorded statistics.
+
+        Returns
+        -------
+        result : list
+            A list of dicts, one per layout owner, sorted by owner.
+            Each dict has the 'owner' label, the number of
+            'constraints' and 'variables' of the system, the
+            'timings' dict of the timed operations, the 'relayouts'
+            dict of counts keyed on trigger and the 'resize_latency'.
+            The timings have a 'count' and the 'cumulative', 'mean'
+            and 'max' times in seconds.
+
+        """
+        rows = [stats.as_dict() for stats in self._stats.itervalues()]
+        rows.sort(key=lambda row: row['owner'])
+        return rows
+
+    def format_table(self):
+        """ Format the recorded statistics as a text table.
+
+        The table has a row per layout owner with the size of its
+        constraint system, its relayout count, the cumulative time of
+        each timed operation and its mean and max resize latency.
+
+        Returns
+        -------
+        result : str
+            The formatted table.
+
+        """
+        header = ['%6s %6s %9s' % ('cns', 'vars', 'relayouts')]
+        header.extend('%12s' % op[:12] for op in OPERATIONS)
+        header.append('%11s %11s  %s' % ('resize mean', 'resize max', 'owner'))
+        lines = [' '.join(header)]
+        for row in self.snapshot():
+            relayouts = sum(row['relayouts'].itervalues())
+            line = ['%6d %6d %9d' % (
+                row['constraints'], row['variables'], relayouts,
+            )]
+            timings = row['timings']
+            for op in OPERATIONS:
+                cumulative = timings[op]['cumulative'] if op in timings else 0
+                line.append('%12.3f' % (cumulative * 1000))
+            latency = row['resize_latency']
+            line.append('%11.3f %11.3f  %s' % (
+                latency['mean'] * 1000, latency['max'] * 1000, row['owner'],
+            ))
+            lines.append(' '.join(line))
+        return '\n'.join(lines)
+
+    def dump(self, path, format='table'):
+        """ Write the recorded statistics to a file.
+
+        Parameters
+        ----------
+        path : str
+            The path of the file to write.
+
+        format : str, optional
+            Either 'table' to write the output of `format_table`, with
+            times in milliseconds, or 'json' to write the output of
+            `snapshot`. The default is 'table'.
+
+        """
+        if format == 'table':
+            data = self.format_table() + '\n'
+        elif format == 'json':
+            data = json.dumps(self.snapshot(), indent=2)
+        else:
+            raise ValueError('unknown format %r' % format)
+        with open(path, 'w') as f:
+            f.write(data)
+
+
+#: The instrumentation used by the layout managers and containers.
+layout_instrumentation = LayoutInstrumentation()
@@ -2,18 +2,38 @@
 #  Copyright (c) 2011, Enthought, Inc.
 #  All rights reserved.
 #------------------------------------------------------------------------------
+from time import time
+
 from casuarius import Solver, medium
 
+from .layout_instrumentation import layout_instrumentation
+
 
 class LayoutManager(object):
     """ A class which uses a casuarius solver to manage a system
     of constraints.
 
+    The min and max sizes computed by the manager are cached until
+    the constraints of the solver are next changed.
+
     """
-    def __init__(self):
+    def __init__(self, owner='LayoutManager'):
+        """ Initialize a LayoutManager.
+
+        Parameters
+        ----------
+        owner : str, optional
+            The label under which the layout instrumentation records
+            the statistics of this manager. The toolkit containers use
+            the label returned by `layout_instrumentation.owner_label`.
+
+        """
+        self._owner = owner
         self._solver = Solver(autosolve=False)
+        self._constraints = set()
         self._initialized = False
         self._running = False
+        self._size_cache = {}
 
     def initialize(self, constraints):
         """ Initialize the solver with the given constraints.
@@ -27,12 +47,18 @@ class LayoutManager(object):
         """
         if self._initialized:
             raise RuntimeError('Solver already initialized')
+        start = time() if layout_instrumentation.enabled else None
         solver = self._solver
         solver.autosolve = False
+        add = self._constraints.add
         for cn in constraints:
             solver.add_constraint(cn)
+            add(cn)
         solver.autosolve = True
         self._initialized = True
+        self._size_cache = {}
+        if start is not None:
+            self._record('initialize', start)
 
     def replace_constraints(self, old_cns, new_cns):
         """ Replace constraints in the solver.
@@ -49,13 +75,50 @@ class LayoutManager(object):
         """
         if not self._initialized:
             raise RuntimeError('Solver not yet initialized')
+        start = time() if layout_instrumentation.enabled else None
         solver = self._solver
+        current = self._constraints
         solver.autosolve = False
         for cn in old_cns:
             solver.remove_constraint(cn)
+            current.discard(cn)
         for cn in new_cns:
             solver.add_constraint(cn)
+            current.add(cn)
         solver.autosolve = True
+        self._size_cache = {}
+        if start is not None:
+            self._record('replace_constraints', start)
+
+    def update_constraints(self, constraints):
+        """ Update the solver so that it holds the given constraints.
+
+        Only the difference between the current constraints and the
+        given constraints is applied to the solver. Constraints which
+        are present in both sets are left untouched, which makes this
+        much cheaper than initializing a new solver when only a small
+        part of a large system has changed.
+
+        Parameters
+        ----------
+        constraints : Iterable
+            An iterable that yields the full set of constraints which
+            should be held by the solver.
+
+        """
+        if not self._initialized:
+            raise RuntimeError('Solver not yet initialized')
+        current = self._constraints
+        new_cns = []
+        new_set = set()
+        for cn in constraints:
+            if cn not in new_set:
+                new_set.add(cn)
+                if cn not in current:
+                    new_cns.append(cn)
+        old_cns = [cn for cn in current if cn not in new_set]
+        if old_cns or new_cns:
+            self.replace_constraints(old_cns, new_cns)
 
     def layout(self, cb, width, height, size, strength=medium, weight=1.0):
         """ Perform an iteration of the solver for the new width and
@@ -95,6 +158,7 @@ class LayoutManager(object):
             raise RuntimeError('Layout with uninitialized solver')
         if self._running:
             return
+        start = time() if layout_instrumentation.enabled else None
         try:
             self._running = True
             w, h = size
@@ -103,6 +167,10 @@ class LayoutManager(object):
                 cb()
         finally:
             self._running = False
+        if start is not None:
+            layout_instrumentation.record_time(
+                self._owner, 'layout', time() - start
+            )
 
     def get_min_size(self, width, height, strength=medium, weight=0.1):
         """ Run an iteration of the solver with the suggested size of the
@@ -139,11 +207,14 @@ class LayoutManager(object):
         """
         if not self._initialized:
             raise RuntimeError('Get min size on uninitialized solver')
-        values = [(width, 0.0), (height, 0.0)]
-        with self._solver.suggest_values(values, strength, weight):
-            min_width = width.value
-            min_height = height.value
-        return (min_width, min_height)
+        if layout_instrumentation.enabled:
+            start = time()
+            result = self._min_size(width, height, strength, weight)
+            layout_instrumentation.record_time(
+                self._owner, 'get_min_size', time() - start
+            )
+            return result
+        return self._min_size(width, height, strength, weight)
 
     def get_max_size(self, width, height, strength=medium, weight=0.1):
         """ Run an iteration of the solver with the suggested size of
@@ -182,6 +253,48 @@ class LayoutManager(object):
         """
         if not self._initialized:
             raise RuntimeError('Get max size on uninitialized solver')
+        if layout_instrumentation.enabled:
+            start = time()
+            result = self._max_size(width, height, strength, weight)
+            layout_instrumentation.record_time(
+                self._owner, 'get_max_size', time() - start
+            )
+            return result
+        return self._max_size(width, height, strength, weight)
+
+    def _record(self, operation, start):
+        """ Record the time of a constraints operation, along with the
+        new size of the constraint system.
+
+        """
+        owner = self._owner
+        layout_instrumentation.record_time(owner, operation, time() - start)
+        layout_instrumentation.record_system(owner, self._constraints)
+
+    def _min_size(self, width, height, strength, weight):
+        """ Compute the min size for `get_min_size`.
+
+        """
+        key = ('min', id(width), id(height), strength, weight)
+        result = self._cached_size(key, width, height)
+        if result is not None:
+            return result
+        values = [(width, 0.0), (height, 0.0)]
+        with self._solver.suggest_values(values, strength, weight):
+            min_width = width.value
+            min_height = height.value
+        result = (min_width, min_height)
+        self._size_cache[key] = (width, height, result)
+        return result
+
+    def _max_size(self, width, height, strength, weight):
+        """ Compute the max size for `get_max_size`.
+
+        """
+        key = ('max', id(width), id(height), strength, weight)
+        result = self._cached_size(key, width, height)
+        if result is not None:
+            return result
         max_val = 2**24 - 1 # Arbitrary, but the max allowed by Qt.
         values = [(width, max_val), (height, max_val)]
         with self._solver.suggest_values(values, strength, weight):
@@ -193,5 +306,26 @@ class LayoutManager(object):
             max_width = -1
         if height_diff <= 1:
             max_height = -1
-        return (max_width, max_height)
+        result = (max_width, max_height)
+        self._size_cache[key] = (width, height, result)
+        return result
+
+    def _cached_size(self, key, width, height):
+        """ Get a size computed since the constraints last changed.
+
+        The cache is keyed on the ids of the variables, so the cached
+        variables are checked by identity to guard against the reuse
+        of an id by a new variable.
+
+        Returns
+        -------
+        result : tuple or None
+            The cached size, or None if there is no cached size.
+
+        """
+        entry = self._size_cache.get(key)
+        if entry is not None:
+            if entry[0] is width and entry[1] is height:
+                return entry[2]
+        return None
 
@@ -0,0 +1,159 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+""" The message object and wire format used by remote Enaml transports.
+
+A message is a 4-tuple of dicts: the header, the parent header, the
+metadata, and the content. On the wire, a message is a list of frames:
+the name of the codec, followed by the four encoded parts, followed by
+any raw binary frames which were carried in the 'frames' key of the
+content.
+
+"""
+from operator import itemgetter
+from uuid import uuid4
+
+from enaml.message_codec import CodecRegistry
+
+
+#: The version of the message protocol.
+PROTOCOL_VERSION = '1.0'
+
+
+class Message(tuple):
+    """ A tuple subclass representing a message in the Enaml protocol.
+
+    """
+    __slots__ = ()
+
+    def __new__(cls, parts):
+        """ Create a new Message.
+
+        Parameters
+        ----------
+        parts : iterable
+            An iterable which yields the header, parent_header,
+            metadata, and content dicts of the message.
+
+        """
+        self = super(Message, cls).__new__(cls, parts)
+        if len(self) != 4:
+            msg = 'A message must have 4 parts. Got %d instead.'
+            raise ValueError(msg % len(self))
+        return self
+
+    #: The header dict of the message.
+    header = property(itemgetter(0))
+
+    #: The header dict of the message to which this message replies.
+    parent_header = property(itemgetter(1))
+
+    #: The metadata dict of the message.
+    metadata = property(itemgetter(2))
+
+    #: The content dict of the message.
+    content = property(itemgetter(3))
+
+
+def create_message(msg_type, content, parent_header=None, metadata=None,
+                   **header_items):
+    """ Create a new Message with a unique message id.
+
+    Parameters
+    ----------
+    msg_type : str
+        The type of the message.
+
+    content : dict
+        The content dict of the message.
+
+    parent_header : dict, optional
+        The header of the message to which this message is a reply.
+
+    metadata : dict, optional
+        The metadata dict of the message.
+
+    **header_items
+        Additional items to include in the header of the message.
+
+    Returns
+    -------
+    result : Message
+        The new message object.
+
+    """
+    header = {
+        'msg_id': uuid4().hex,
+        'msg_type': msg_type,
+        'version': PROTOCOL_VERSION,
+    }
+    header.update(header_items)
+    return Message((header, parent_header or {}, metadata or {}, content))
+
+
+def serialize_message(message, codec):
+    """ Serialize a Message into a list of wire frames.
+
+    If the content of the message contains a list of binary 'frames',
+    those frames are removed from the content and appended to the end
+    of the list as raw frames. This allows large binary payloads, such
+    as image data, to be sent without being copied by the codec.
+
+    Parameters
+    ----------
+    message : Message
+        The Message object to serialize.
+
+    codec : AbstractCodec
+        The codec to use for serializing the parts of the message.
+        The name of the codec is sent as the first frame.
+
+    Returns
+    -------
+    result : list
+        The list of bytestring frames for the message.
+
+    """
+    header, parent_header, metadata, content = message
+    frames = ()
+    if isinstance(content, dict) and 'frames' in content:
+        content = content.copy()
+        frames = content.pop('frames')
+    encode = codec.encode
+    wire = [codec.name]
+    wire.extend(
+        encode(part) for part in (header, parent_header, metadata, content)
+    )
+    wire.extend(frames)
+    return wire
+
+
+def deserialize_message(wire):
+    """ Deserialize a list of wire frames into a Message.
+
+    Parameters
+    ----------
+    wire : list
+        The list of frames created by `serialize_message`. Any raw
+        frames which follow the message parts are placed in the
+        'frames' key of the content.
+
+    Returns
+    -------
+    message, codec : Message, AbstractCodec
+        The deserialized Message object and the codec with which the
+        message was serialized.
+
+    """
+    if len(wire) < 5:
+        raise TypeError('Invalid wire message: %s' % wire)
+    codec = CodecRegistry.lookup(wire[0])
+    if codec is None:
+        raise TypeError('Invalid wire codec: %s' % wire[0])
+    decode = codec.decode
+    parts = [decode(part) for part in wire[1:5]]
+    frames = wire[5:]
+    if frames and isinstance(parts[3], dict):
+        parts[3]['frames'] = list(frames)
+    return Message(parts), codec
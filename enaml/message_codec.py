@@ -0,0 +1,442 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+""" Codecs for serializing Enaml messages for transport over the wire.
+
+A codec converts a message part (any combination of dicts, lists,
+tuples, strings, numbers, bools and None) into a bytestring and back.
+Codecs are registered by name with the `CodecRegistry`, which is also
+used to negotiate the codec to use for a given connection. The JSON
+codec is always available and is the fallback when negotiation fails.
+
+"""
+from abc import ABCMeta, abstractmethod
+import json
+from struct import Struct
+
+
+class AbstractCodec(object):
+    """ An abstract base class which defines the codec interface.
+
+    """
+    __metaclass__ = ABCMeta
+
+    #: The unique name of the codec. This is the name which is used
+    #: for registration and negotiation.
+    name = ''
+
+    @abstractmethod
+    def encode(self, obj):
+        """ Encode an object into a bytestring.
+
+        Parameters
+        ----------
+        obj : object
+            The message part to encode.
+
+        Returns
+        -------
+        result : str
+            The bytestring representation of the object.
+
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def decode(self, data):
+        """ Decode a bytestring into an object.
+
+        Parameters
+        ----------
+        data : str
+            A bytestring created by the `encode` method of a codec of
+            the same type.
+
+        Returns
+        -------
+        result : object
+            The decoded message part.
+
+        """
+        raise NotImplementedError
+
+
+class JSONCodec(AbstractCodec):
+    """ A codec which serializes messages as JSON.
+
+    JSON cannot carry arbitrary binary data, so bytestrings must be
+    valid UTF-8 and are decoded as unicode.
+
+    """
+    name = 'json'
+
+    def encode(self, obj):
+        """ Encode an object into a JSON bytestring.
+
+        """
+        return json.dumps(obj, separators=(',', ':'))
+
+    def decode(self, data):
+        """ Decode a JSON bytestring into an object.
+
+        """
+        return json.loads(data)
+
+
+#------------------------------------------------------------------------------
+# Binary Codec
+#------------------------------------------------------------------------------
+_B = Struct('>B')
+_H = Struct('>H')
+_I = Struct('>I')
+_b = Struct('>b')
+_h = Struct('>h')
+_i = Struct('>i')
+_q = Struct('>q')
+_Q = Struct('>Q')
+_d = Struct('>d')
+
+
+def _pack(obj, push):
+    """ Pack an object into msgpack tagged format.
+
+    Parameters
+    ----------
+    obj : object
+        The object to pack.
+
+    push : callable
+        A callable which accepts a bytestring chunk of output.
+
+    """
+    # The type checks are ordered by how often the types occur in a
+    # typical Enaml message. Exact type checks are used since they
+    # are significantly faster than isinstance checks.
+    kind = type(obj)
+    if kind is str:
+        # A bytestring is passed through untouched as a `bin` item.
+        n = len(obj)
+        if n < 0x100:
+            push('\xc4' + _B.pack(n))
+        elif n < 0x10000:
+            push('\xc5' + _H.pack(n))
+        else:
+            push('\xc6' + _I.pack(n))
+        push(obj)
+    elif kind is unicode:
+        data = obj.encode('utf-8')
+        n = len(data)
+        if n < 0x20:
+            push(chr(0xa0 | n))
+        elif n < 0x100:
+            push('\xd9' + _B.pack(n))
+        elif n < 0x10000:
+            push('\xda' + _H.pack(n))
+        else:
+            push('\xdb' + _I.pack(n))
+        push(data)
+    elif kind is dict:
+        n = len(obj)
+        if n < 0x10:
+            push(chr(0x80 | n))
+        elif n < 0x10000:
+            push('\xde' + _H.pack(n))
+        else:
+            push('\xdf' + _I.pack(n))
+        for key, value in obj.iteritems():
+            _pack(key, push)
+            _pack(value, push)
+    elif kind is list or kind is tuple:
+        n = len(obj)
+        if n < 0x10:
+            push(chr(0x90 | n))
+        elif n < 0x10000:
+            push('\xdc' + _H.pack(n))
+        else:
+            push('\xdd' + _I.pack(n))
+        for item in obj:
+            _pack(item, push)
+    elif obj is None:
+        push('\xc0')
+    elif obj is True:
+        push('\xc3')
+    elif obj is False:
+        push('\xc2')
+    elif kind is int or kind is long:
+        if 0 <= obj < 0x80:
+            push(chr(obj))
+        elif -0x20 <= obj < 0:
+            push(_b.pack(obj))
+        elif -0x8000000000000000 <= obj < 0x8000000000000000:
+            push('\xd3' + _q.pack(obj))
+        elif 0 <= obj < 0x10000000000000000:
+            push('\xcf' + _Q.pack(obj))
+        else:
+            raise OverflowError('integer out of range: %r' % obj)
+    elif kind is float:
+        push('\xcb' + _d.pack(obj))
+    elif isinstance(obj, basestring):
+        _pack(str(obj) if isinstance(obj, str) else unicode(obj), push)
+    elif isinstance(obj, dict):
+        _pack(dict(obj), push)
+    elif isinstance(obj, (list, tuple)):
+        _pack(list(obj), push)
+    else:
+        msg = "object of type '%s' is not serializable"
+        raise TypeError(msg % type(obj).__name__)
+
+
+def _unpack(data, idx):
+    """ Unpack the msgpack item in the data at the given index.
+
+    Parameters
+    ----------
+    data : str
+        The bytestring holding the packed data.
+
+    idx : int
+        The index of the item to unpack.
+
+    Returns
+    -------
+    result : (object, int)
+        The unpacked object and the index of the next item.
+
+    """
+    tag = ord(data[idx])
+    idx += 1
+    if tag < 0x80:
+        return tag, idx
+    if tag >= 0xe0:
+        return tag - 0x100, idx
+    if tag < 0x90:
+        return _unpack_map(data, idx, tag & 0x0f)
+    if tag < 0xa0:
+        return _unpack_array(data, idx, tag & 0x0f)
+    if tag < 0xc0:
+        end = idx + (tag & 0x1f)
+        return data[idx:end].decode('utf-8'), end
+    if tag == 0xc0:
+        return None, idx
+    if tag == 0xc2:
+        return False, idx
+    if tag == 0xc3:
+        return True, idx
+    if tag in _BIN_TAGS:
+        size = _BIN_TAGS[tag]
+        n = size.unpack_from(data, idx)[0]
+        idx += size.size
+        end = idx + n
+        return data[idx:end], end
+    if tag in _STR_TAGS:
+        size = _STR_TAGS[tag]
+        n = size.unpack_from(data, idx)[0]
+        idx += size.size
+        end = idx + n
+        return data[idx:end].decode('utf-8'), end
+    if tag in _NUM_TAGS:
+        fmt = _NUM_TAGS[tag]
+        return fmt.unpack_from(data, idx)[0], idx + fmt.size
+    if tag in _ARRAY_TAGS:
+        size = _ARRAY_TAGS[tag]
+        n = size.unpack_from(data, idx)[0]
+        return _unpack_array(data, idx + size.size, n)
+    if tag in _MAP_TAGS:
+        size = _MAP_TAGS[tag]
+        n = size.unpack_from(data, idx)[0]
+        return _unpack_map(data, idx + size.size, n)
+    raise ValueError('invalid type tag 0x%02x at index %d' % (tag, idx - 1))
+
+
+def _unpack_array(data, idx, n):
+    """ Unpack an array of `n` items starting at the given index.
+
+    """
+    items = []
+    push = items.append
+    unpack = _unpack
+    for ignored in xrange(n):
+        item, idx = unpack(data, idx)
+        push(item)
+    return items, idx
+
+
+def _unpack_map(data, idx, n):
+    """ Unpack a map of `n` items starting at the given index.
+
+    """
+    items = {}
+    unpack = _unpack
+    for ignored in xrange(n):
+        key, idx = unpack(data, idx)
+        value, idx = unpack(data, idx)
+        items[key] = value
+    return items, idx
+
+
+_BIN_TAGS = {0xc4: _B, 0xc5: _H, 0xc6: _I}
+_STR_TAGS = {0xd9: _B, 0xda: _H, 0xdb: _I}
+_ARRAY_TAGS = {0xdc: _H, 0xdd: _I}
+_MAP_TAGS = {0xde: _H, 0xdf: _I}
+_NUM_TAGS = {
+    0xca: Struct('>f'), 0xcb: _d, 0xcc: _B, 0xcd: _H, 0xce: _I, 0xcf: _Q,
+    0xd0: _b, 0xd1: _h, 0xd2: _i, 0xd3: _q,
+}
+
+
+def _encode(obj):
+    """ Encode an object into a msgpack bytestring.
+
+    """
+    chunks = []
+    _pack(obj, chunks.append)
+    return ''.join(chunks)
+
+
+def _decode(data):
+    """ Decode a msgpack bytestring into an object.
+
+    """
+    obj, idx = _unpack(data, 0)
+    if idx != len(data):
+        raise ValueError('extra data after packed object')
+    return obj
+
+
+# Use the faster msgpack implementation if it's available. The wire
+# format is identical. Versions of msgpack which cannot distinguish
+# between bin and str items are not used.
+try:
+    import msgpack
+    msgpack.unpackb(msgpack.packb(u'', use_bin_type=True), raw=False)
+except (ImportError, TypeError):
+    pass
+else:
+    def _encode(obj, packb=msgpack.packb):
+        return packb(obj, use_bin_type=True)
+    def _decode(data, unpackb=msgpack.unpackb):
+        return unpackb(data, raw=False)
+
+
+class BinaryCodec(AbstractCodec):
+    """ A compact binary codec using the msgpack tagged encoding.
+
+    Bytestrings are passed through as raw binary items and unicode
+    strings are encoded as UTF-8 text items, so both round trip with
+    their original type. Tuples are decoded as lists. Binary payloads
+    such as image data are therefore carried without any escaping.
+
+    """
+    name = 'binary'
+
+    def encode(self, obj):
+        """ Encode an object into a msgpack bytestring.
+
+        """
+        return _encode(obj)
+
+    def decode(self, data):
+        """ Decode a msgpack bytestring into an object.
+
+        """
+        return _decode(data)
+
+
+#------------------------------------------------------------------------------
+# Codec Registry
+#------------------------------------------------------------------------------
+class CodecRegistry(object):
+    """ A class for registering message codecs.
+
+    This is a process-wide registry class. Interaction is done through
+    the classmethods `register`, `lookup`, `names` and `negotiate`.
+    Codecs which are registered later are preferred during negotiation.
+
+    """
+    #: Private storage for the codecs, keyed by codec name.
+    _codecs = {}
+
+    #: Private storage for the codec names in order of preference.
+    _preference = []
+
+    #: The name of the codec to use when negotiation fails.
+    fallback = JSONCodec.name
+
+    @classmethod
+    def register(cls, codec):
+        """ Register a codec instance.
+
+        If a codec with the same name is already registered, it will
+        be replaced and its preference will be updated.
+
+        Parameters
+        ----------
+        codec : AbstractCodec
+            The codec instance to register.
+
+        """
+        if not isinstance(codec, AbstractCodec):
+            msg = 'codec must be an AbstractCodec instance. Got %r instead.'
+            raise TypeError(msg % codec)
+        name = codec.name
+        preference = cls._preference
+        if name in preference:
+            preference.remove(name)
+        preference.insert(0, name)
+        cls._codecs[name] = codec
+
+    @classmethod
+    def lookup(cls, name):
+        """ Lookup a codec by name.
+
+        Parameters
+        ----------
+        name : str
+            The name of the codec.
+
+        Returns
+        -------
+        result : AbstractCodec or None
+            The registered codec or None if no such codec exists.
+
+        """
+        return cls._codecs.get(name)
+
+    @classmethod
+    def names(cls):
+        """ Get the names of the registered codecs.
+
+        Returns
+        -------
+        result : list
+            The list of codec names in order of preference.
+
+        """
+        return cls._preference[:]
+
+    @classmethod
+    def negotiate(cls, offered):
+        """ Negotiate the codec to use for a connection.
+
+        Parameters
+        ----------
+        offered : iterable
+            The names of the codecs supported by the peer.
+
+        Returns
+        -------
+        result : AbstractCodec
+            The most preferred registered codec which is supported by
+            the peer, or the fallback codec if there is none.
+
+        """
+        offered = set(offered)
+        for name in cls._preference:
+            if name in offered:
+                return cls._codecs[name]
+        return cls._codecs[cls.fallback]
+
+
+CodecRegistry.register(JSONCodec())
+CodecRegistry.register(BinaryCodec())
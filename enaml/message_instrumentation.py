@@ -0,0 +1,417 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+""" Instrumentation of the messages sent between sessions and clients.
+
+The server `Session` and the Qt client `QtSession` report the messages
+they send and receive, the batches they send and the time taken to
+dispatch the received actions to the `message_instrumentation` hub.
+The hub forwards these events to the monitors added to it. Two monitors
+are provided: `MessageCounters`, which keeps in-process counters, and
+`MessageLog`, which writes the events to a rolling log file.
+
+The hub is disabled until a monitor is added, in which case the
+sessions only pay for a check of its `enabled` attribute.
+
+The 'message_batch' messages are not reported as messages themselves.
+Instead, each of the messages in the batch is reported individually.
+
+"""
+from collections import defaultdict
+import logging
+from logging.handlers import RotatingFileHandler
+import time
+
+from .message_codec import CodecRegistry
+
+
+def payload_size(codec, content):
+    """ Compute the serialized size of a message content.
+
+    Parameters
+    ----------
+    codec : AbstractCodec
+        The codec with which to serialize the content.
+
+    content : object
+        The content of the message.
+
+    Returns
+    -------
+    result : int or None
+        The size of the serialized content in bytes, or None if the
+        content cannot be serialized by the codec.
+
+    """
+    try:
+        return len(codec.encode(content))
+    except Exception:
+        return None
+
+
+class MessageMonitor(object):
+    """ The base class for message monitors.
+
+    The `side` argument of the methods is either 'server' or 'client'.
+    The `class_name` argument is the class name of the object which
+    sends or receives the message, or an empty string if the object is
+    not known to the session. The default implementations do nothing.
+
+    """
+    def message_sent(self, side, class_name, object_id, action, content):
+        """ Called when a session sends a message.
+
+        """
+        pass
+
+    def message_received(self, side, class_name, object_id, action, content):
+        """ Called when a session receives a message.
+
+        """
+        pass
+
+    def batch_sent(self, side, kind, messages):
+        """ Called when a session sends a batch of messages.
+
+        Parameters
+        ----------
+        kind : str
+            Either 'deferred' for the batch of layout related messages
+            of a `DeferredMessageBatch`, or 'coalesced' for the batch of
+            attribute updates of a `CoalescingMessageBatch`.
+
+        messages : list
+            The list of (object_id, action, content) messages.
+
+        """
+        pass
+
+    def action_dispatched(self, side, class_name, action, elapsed):
+        """ Called when a session has dispatched a received action.
+
+        Parameters
+        ----------
+        elapsed : float
+            The time taken by the handler of the action, in seconds.
+
+        """
+        pass
+
+
+class MessageCounters(MessageMonitor):
+    """ A message monitor which keeps in-process counters.
+
+    """
+    def __init__(self, codec='binary'):
+        """ Initialize a MessageCounters.
+
+        Parameters
+        ----------
+        codec : str, optional
+            The name of the registered codec used to compute the
+            payload sizes. The default is 'binary'.
+
+        """
+        self._codec = CodecRegistry.lookup(codec)
+        self.reset()
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _count(self, direction, side, class_name, action, content):
+        """ Update the counters for a sent or received message.
+
+        """
+        size = payload_size(self._codec, content) or 0
+        for key in ((side, direction, 'action', action),
+                    (side, direction, 'class', class_name)):
+            counter = self._messages[key]
+            counter[0] += 1
+            counter[1] += size
+
+    #--------------------------------------------------------------------------
+    # MessageMonitor Interface
+    #--------------------------------------------------------------------------
+    def message_sent(self, side, class_name, object_id, action, content):
+        """ Count a sent message.
+
+        """
+        self._count('sent', side, class_name, action, content)
+
+    def message_received(self, side, class_name, object_id, action, content):
+        """ Count a received message.
+
+        """
+        self._count('received', side, class_name, action, content)
+
+    def batch_sent(self, side, kind, messages):
+        """ Count a sent batch.
+
+        """
+        counter = self._batches[(side, kind)]
+        size = len(messages)
+        counter[0] += 1
+        counter[1] += size
+        if size > counter[2]:
+            counter[2] = size
+
+    def action_dispatched(self, side, class_name, action, elapsed):
+        """ Count the dispatch time of an action.
+
+        """
+        counter = self._dispatch[(side, action)]
+        counter[0] += 1
+        counter[1] += elapsed
+        if elapsed > counter[2]:
+            counter[2] = elapsed
+
+    #--------------------------------------------------------------------------
+    # Public API
+    #--------------------------------------------------------------------------
+    def reset(self):
+        """ Reset the counters.
+
+        """
+        self._messages = defaultdict(lambda: [0, 0])
+        self._batches = defaultdict(lambda: [0, 0, 0])
+        self._dispatch = defaultdict(lambda: [0, 0.0, 0.0])
+
+    def snapshot(self):
+        """ Get a snapshot of the counters.
+
+        Returns
+        -------
+        result : dict
+            A JSON serializable dict with the following keys:
+
+            'actions', 'classes'
+                Nested dicts keyed on side, then 'sent' or 'received',
+                then action or class name, with the 'count' and the
+                total 'bytes' of the messages.
+
+            'batches'
+                Nested dicts keyed on side, then batch kind, with the
+                'count', 'mean_size' and 'max_size' of the batches.
+
+            'dispatch'
+                Nested dicts keyed on side, then action, with the
+                'count', 'mean' and 'max' dispatch time in seconds.
+
+        """
+        result = {'actions': {}, 'classes': {}, 'batches': {}, 'dispatch': {}}
+        for (side, direction, group, name), counter in self._messages.items():
+            dct = result[group + 'es' if group == 'class' else group + 's']
+            dct = dct.setdefault(side, {}).setdefault(direction, {})
+            dct[name] = {'count': counter[0], 'bytes': counter[1]}
+        for (side, kind), counter in self._batches.items():
+            count, total, largest = counter
+            result['batches'].setdefault(side, {})[kind] = {
+                'count': count,
+                'mean_size': float(total) / count if count else 0.0,
+                'max_size': largest,
+            }
+        for (side, action), counter in self._dispatch.items():
+            count, total, slowest = counter
+            result['dispatch'].setdefault(side, {})[action] = {
+                'count': count,
+                'mean': total / count if count else 0.0,
+                'max': slowest,
+            }
+        return result
+
+
+class MessageLog(MessageMonitor):
+    """ A message monitor which writes the events to a rolling log file.
+
+    Each event is written as a single tab separated line which begins
+    with a timestamp, the side and the kind of the event.
+
+    """
+    def __init__(self, path, max_bytes=10 * 1024 * 1024, backup_count=3,
+                 codec=None):
+        """ Initialize a MessageLog.
+
+        Parameters
+        ----------
+        path : str
+            The path of the log file.
+
+        max_bytes : int, optional
+            The size at which the log file is rolled over. The default
+            is 10MB.
+
+        backup_count : int, optional
+            The number of rolled over log files to keep. The default
+            is 3.
+
+        codec : str or None, optional
+            The name of the registered codec used to compute payload
+            sizes for the log, or None to not log the sizes.
+
+        """
+        handler = RotatingFileHandler(
+            path, maxBytes=max_bytes, backupCount=backup_count
+        )
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        logger = logging.Logger('enaml.message_log')
+        logger.addHandler(handler)
+        self._handler = handler
+        self._logger = logger
+        self._codec = CodecRegistry.lookup(codec) if codec else None
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _write(self, *fields):
+        """ Write a line to the log file.
+
+        """
+        line = '\t'.join(str(field) for field in fields)
+        self._logger.info('%.6f\t%s', time.time(), line)
+
+    def _size(self, content):
+        """ Get the payload size to log for a message content.
+
+        """
+        codec = self._codec
+        if codec is None:
+            return '-'
+        size = payload_size(codec, content)
+        return '-' if size is None else size
+
+    #--------------------------------------------------------------------------
+    # MessageMonitor Interface
+    #--------------------------------------------------------------------------
+    def message_sent(self, side, class_name, object_id, action, content):
+        """ Log a sent message.
+
+        """
+        self._write(
+            side, 'sent', class_name, object_id, action, self._size(content)
+        )
+
+    def message_received(self, side, class_name, object_id, action, content):
+        """ Log a received message.
+
+        """
+        self._write(
+            side, 'received', class_name, object_id, action,
+            self._size(content),
+        )
+
+    def batch_sent(self, side, kind, messages):
+        """ Log a sent batch.
+
+        """
+        self._write(side, 'batch', kind, len(messages))
+
+    def action_dispatched(self, side, class_name, action, elapsed):
+        """ Log the dispatch time of an action.
+
+        """
+        self._write(side, 'dispatch', class_name, action, '%.6f' % elapsed)
+
+    #--------------------------------------------------------------------------
+    # Public API
+    #--------------------------------------------------------------------------
+    def close(self):
+        """ Close the log file.
+
+        """
+        self._logger.removeHandler(self._handler)
+        self._handler.close()
+
+
+class MessageInstrumentation(object):
+    """ The hub which forwards the message events to the monitors.
+
+    There is a single instance of the hub, `message_instrumentation`.
+
+    """
+    def __init__(self):
+        """ Initialize a MessageInstrumentation.
+
+        """
+        #: Whether any monitors are installed. This is checked by the
+        #: sessions before reporting an event. It should not be set
+        #: directly by user code.
+        self.enabled = False
+
+        self._monitors = ()
+
+    #--------------------------------------------------------------------------
+    # Monitor API
+    #--------------------------------------------------------------------------
+    def add_monitor(self, monitor):
+        """ Add a monitor to the hub.
+
+        Parameters
+        ----------
+        monitor : MessageMonitor
+            The monitor which should receive the message events.
+
+        """
+        if monitor not in self._monitors:
+            self._monitors += (monitor,)
+        self.enabled = True
+
+    def remove_monitor(self, monitor):
+        """ Remove a monitor from the hub.
+
+        Parameters
+        ----------
+        monitor : MessageMonitor
+            The monitor to remove. If it was not added, this is a no-op.
+
+        """
+        self._monitors = tuple(m for m in self._monitors if m is not monitor)
+        self.enabled = len(self._monitors) > 0
+
+    def monitors(self):
+        """ Get the monitors added to the hub.
+
+        Returns
+        -------
+        result : tuple
+            The tuple of installed monitors.
+
+        """
+        return self._monitors
+
+    #--------------------------------------------------------------------------
+    # Session API
+    #--------------------------------------------------------------------------
+    def message_sent(self, side, class_name, object_id, action, content):
+        """ Report a sent message to the monitors.
+
+        """
+        for monitor in self._monitors:
+            monitor.message_sent(side, class_name, object_id, action, content)
+
+    def message_received(self, side, class_name, object_id, action, content):
+        """ Report a received message to the monitors.
+
+        """
+        for monitor in self._monitors:
+            monitor.message_received(
+                side, class_name, object_id, action, content
+            )
+
+    def batch_sent(self, side, kind, messages):
+        """ Report a sent batch to the monitors.
+
+        """
+        for monitor in self._monitors:
+            monitor.batch_sent(side, kind, messages)
+
+    def action_dispatched(self, side, class_name, action, elapsed):
+        """ Report the dispatch time of an action to the monitors.
+
+        """
+        for monitor in self._monitors:
+            monitor.action_dispatched(side, class_name, action, elapsed)
+
+
+#: The hub to which the sessions report their message events.
+message_instrumentation = MessageInstrumentation()
@@ -0,0 +1,344 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from .qt.QtCore import QAbstractTableModel, Qt
+from .q_deferred_caller import deferredCall
+from .qt_control import QtControl
+
+
+class QRemoteItemModel(QAbstractTableModel):
+    """ A QAbstractTableModel which displays the items of a remote
+    AbstractItemModel.
+
+    The model holds only the window of items most recently sent by the
+    server. When the view asks for an item outside of that window, the
+    miss is recorded and the missing range, plus a prefetch margin, is
+    requested from the server on the next cycle of the event loop. All
+    of the misses of a single paint are coalesced into one request.
+
+    """
+    def __init__(self, parent=None):
+        """ Initialize a QRemoteItemModel.
+
+        Parameters
+        ----------
+        parent : QObject, optional
+            The parent object of the model.
+
+        """
+        super(QRemoteItemModel, self).__init__(parent)
+        self._row_count = 0
+        self._column_count = 0
+        self._prefetch_rows = 0
+        self._prefetch_columns = 0
+        self._items = {}
+        self._vertical_headers = {}
+        self._horizontal_headers = {}
+        self._missing = None
+        self._requested = None
+        self._flush_pending = False
+        self._requester = None
+
+    #--------------------------------------------------------------------------
+    # QAbstractTableModel Interface
+    #--------------------------------------------------------------------------
+    def rowCount(self, parent=None):
+        """ Get the number of rows in the model.
+
+        """
+        if parent is not None and parent.isValid():
+            return 0
+        return self._row_count
+
+    def columnCount(self, parent=None):
+        """ Get the number of columns in the model.
+
+        """
+        if parent is not None and parent.isValid():
+            return 0
+        return self._column_count
+
+    def data(self, index, role=Qt.DisplayRole):
+        """ Get the data for an item in the model.
+
+        """
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        row = index.row()
+        column = index.column()
+        try:
+            return self._items[(row, column)]
+        except KeyError:
+            self._miss(row, column)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        """ Get the data for a header section of the model.
+
+        """
+        if role == Qt.DisplayRole:
+            if orientation == Qt.Horizontal:
+                headers = self._horizontal_headers
+            else:
+                headers = self._vertical_headers
+            if section in headers:
+                return headers[section]
+        return super(QRemoteItemModel, self).headerData(
+            section, orientation, role
+        )
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _miss(self, row, column):
+        """ Record a miss on an item which is not held by the model.
+
+        """
+        requested = self._requested
+        if requested is not None:
+            if (requested[0] <= row <= requested[1] and
+                requested[2] <= column <= requested[3]):
+                return
+        missing = self._missing
+        if missing is None:
+            self._missing = (row, row, column, column)
+        else:
+            self._missing = (
+                min(missing[0], row), max(missing[1], row),
+                min(missing[2], column), max(missing[3], column),
+            )
+        if not self._flush_pending and self._requester is not None:
+            self._flush_pending = True
+            deferredCall(self._flush)
+
+    def _flush(self):
+        """ Request the missing range of items from the server.
+
+        """
+        self._flush_pending = False
+        missing = self._missing
+        if missing is None or self._requester is None:
+            return
+        self._missing = None
+        rows = self._prefetch_rows
+        columns = self._prefetch_columns
+        window = (
+            max(missing[0] - rows, 0),
+            min(missing[1] + rows, self._row_count - 1),
+            max(missing[2] - columns, 0),
+            min(missing[3] + columns, self._column_count - 1),
+        )
+        self._requested = window
+        self._requester(window)
+
+    #--------------------------------------------------------------------------
+    # Public API
+    #--------------------------------------------------------------------------
+    def setRequester(self, requester):
+        """ Set the callable used to request items from the server.
+
+        Any items missed before the requester was set are requested.
+
+        Parameters
+        ----------
+        requester : callable
+            A callable which accepts a (first_row, last_row,
+            first_column, last_column) tuple of the inclusive range
+            of items to request.
+
+        """
+        self._requester = requester
+        if self._missing is not None and not self._flush_pending:
+            self._flush_pending = True
+            deferredCall(self._flush)
+
+    def setPrefetch(self, rows, columns):
+        """ Set the number of rows and columns to request beyond the
+        items which are missed by the view.
+
+        """
+        self._prefetch_rows = rows
+        self._prefetch_columns = columns
+
+    def resetModel(self, row_count, column_count):
+        """ Reset the model to the given shape and discard its items.
+
+        """
+        self.beginResetModel()
+        self._row_count = row_count
+        self._column_count = column_count
+        self._items = {}
+        self._vertical_headers = {}
+        self._horizontal_headers = {}
+        self._missing = None
+        self._requested = None
+        self.endResetModel()
+
+    def setItems(self, row, column, data, vertical, horizontal):
+        """ Replace the items of the model with a window of items.
+
+        Parameters
+        ----------
+        row : int
+            The first row of the window.
+
+        column : int
+            The first column of the window.
+
+        data : list
+            The row-major list of lists of item data.
+
+        vertical : list
+            The vertical header data for the rows of the window.
+
+        horizontal : list
+            The horizontal header data for the columns of the window.
+
+        """
+        items = {}
+        for row_offset, values in enumerate(data):
+            for column_offset, value in enumerate(values):
+                items[(row + row_offset, column + column_offset)] = value
+        self._items = items
+        self._vertical_headers = dict(enumerate(vertical, row))
+        self._horizontal_headers = dict(enumerate(horizontal, column))
+        self._requested = None
+        if data and data[0]:
+            last_row = row + len(data) - 1
+            last_column = column + len(data[0]) - 1
+            self.dataChanged.emit(
+                self.index(row, column), self.index(last_row, last_column)
+            )
+            self.headerDataChanged.emit(Qt.Vertical, row, last_row)
+            self.headerDataChanged.emit(Qt.Horizontal, column, last_column)
+
+    def updateItems(self, row, column, data):
+        """ Update the items of the model which are currently held.
+
+        """
+        items = self._items
+        for row_offset, values in enumerate(data):
+            for column_offset, value in enumerate(values):
+                key = (row + row_offset, column + column_offset)
+                if key in items:
+                    items[key] = value
+        if data and data[0]:
+            last_row = row + len(data) - 1
+            last_column = column + len(data[0]) - 1
+            self.dataChanged.emit(
+                self.index(row, column), self.index(last_row, last_column)
+            )
+
+    def updateHeaders(self, orientation, first, data):
+        """ Update the header data for a range of sections.
+
+        """
+        if orientation == Qt.Horizontal:
+            headers = self._horizontal_headers
+        else:
+            headers = self._vertical_headers
+        for section, value in enumerate(data, first):
+            if section in headers:
+                headers[section] = value
+        if data:
+            last = first + len(data) - 1
+            self.headerDataChanged.emit(orientation, first, last)
+
+
+class QtAbstractItemView(QtControl):
+    """ A Qt implementation of an Enaml AbstractItemView.
+
+    Subclasses must implement the `create_widget` method to create a
+    QAbstractItemView subclass.
+
+    """
+    #--------------------------------------------------------------------------
+    # Setup Methods
+    #--------------------------------------------------------------------------
+    def create(self, tree):
+        """ Create and initialize the underlying widget.
+
+        """
+        super(QtAbstractItemView, self).create(tree)
+        model = QRemoteItemModel(self.widget())
+        model.setPrefetch(tree['prefetch_rows'], tree['prefetch_columns'])
+        model.resetModel(tree['row_count'], tree['column_count'])
+        self.widget().setModel(model)
+        self._model = model
+
+    def activate(self):
+        """ Activate the item view.
+
+        Items are requested from the server once the view is active.
+
+        """
+        super(QtAbstractItemView, self).activate()
+        self._model.setRequester(self._request_items)
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _request_items(self, window):
+        """ Request a window of items from the server.
+
+        """
+        content = {
+            'rows': [window[0], window[1]],
+            'columns': [window[2], window[3]],
+        }
+        self.send_action('request_items', content)
+
+    #--------------------------------------------------------------------------
+    # Message Handlers
+    #--------------------------------------------------------------------------
+    def on_action_items(self, content):
+        """ Handle the 'items' action from the Enaml widget.
+
+        """
+        self._model.setItems(
+            content['row'], content['column'], content['data'],
+            content['vertical_headers'], content['horizontal_headers'],
+        )
+
+    def on_action_data_changed(self, content):
+        """ Handle the 'data_changed' action from the Enaml widget.
+
+        """
+        self._model.updateItems(
+            content['row'], content['column'], content['data']
+        )
+
+    def on_action_headers_changed(self, content):
+        """ Handle the 'headers_changed' action from the Enaml widget.
+
+        """
+        if content['orientation'] == 'horizontal':
+            orientation = Qt.Horizontal
+        else:
+            orientation = Qt.Vertical
+        self._model.updateHeaders(
+            orientation, content['first'], content['data']
+        )
+
+    def on_action_model_reset(self, content):
+        """ Handle the 'model_reset' action from the Enaml widget.
+
+        """
+        self._model.resetModel(content['row_count'], content['column_count'])
+
+    def on_action_set_prefetch_rows(self, content):
+        """ Handle the 'set_prefetch_rows' action from the Enaml widget.
+
+        """
+        model = self._model
+        model.setPrefetch(content['prefetch_rows'], model._prefetch_columns)
+
+    def on_action_set_prefetch_columns(self, content):
+        """ Handle the 'set_prefetch_columns' action from the Enaml
+        widget.
+
+        """
+        model = self._model
+        model.setPrefetch(model._prefetch_rows, content['prefetch_columns'])
+
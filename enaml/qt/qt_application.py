@@ -11,7 +11,7 @@ from .qt.QtCore import Qt, QThread
 from .qt.QtGui import QApplication
 from .q_action_socket import QActionSocket
 from .q_deferred_caller import deferredCall, timedCall
-from .qt_session import QtSession
+from .qt_session import CLIENT_FEATURES, QtSession
 from .qt_factories import register_default
 
 
@@ -76,7 +76,10 @@ class QtApplication(Application):
         session.open(session_id)
         self._sessions[session_id] = session
 
-        # Create and open a new client-side session.
+        # Create and open a new client-side session. The features of
+        # the client are known up front, so they apply to the initial
+        # snapshot of the session.
+        session.client_features = set(CLIENT_FEATURES)
         groups = session.widget_groups[:]
         qt_session = QtSession(session_id, groups)
         self._qt_sessions[session_id] = qt_session
@@ -3,12 +3,18 @@
 #  All rights reserved.
 #------------------------------------------------------------------------------
 from collections import deque
+from itertools import chain
+from time import time
 
 from casuarius import weak
+from enaml.layout.layout_instrumentation import (
+    layout_instrumentation, owner_label,
+)
 from enaml.layout.layout_manager import LayoutManager
 
 from .qt.QtCore import QSize, Signal
 from .qt.QtGui import QFrame
+from .q_deferred_caller import deferredCall
 from .qt_constraints_widget import (
     QtConstraintsWidget, LayoutBox, size_hint_guard,
 )
@@ -42,6 +48,27 @@ def _convert_cn_info(info, owners):
     return res
 
 
+def _cn_info_owners(info):
+    """ A generator which yields the owner ids referenced by a linear
+    constraint info dict, or any part thereof.
+
+    """
+    cn_type = info['type']
+    if cn_type == 'linear_constraint':
+        for item in (info['lhs'], info['rhs']):
+            for owner_id in _cn_info_owners(item):
+                yield owner_id
+    elif cn_type == 'linear_expression':
+        for term in info['terms']:
+            for owner_id in _cn_info_owners(term):
+                yield owner_id
+    elif cn_type == 'term':
+        for owner_id in _cn_info_owners(info['var']):
+            yield owner_id
+    elif cn_type == 'linear_symbolic':
+        yield info['owner']
+
+
 def as_linear_constraint(info, owners):
     """ Converts a constraint info dict into a casuarius linear
     constraint.
@@ -164,12 +191,26 @@ class QtContainer(QtConstraintsWidget):
     #: A dict mapping constraint owner id to associated LayoutBox
     _cn_owners = {}
 
+    #: A dict mapping constraint owner id to a tuple of the list of
+    #: user constraint dicts for that owner, the list of casuarius
+    #: constraints which were converted from those dicts, and the set
+    #: of owner ids for which virtual layout boxes were synthesized.
+    _user_cns_cache = {}
+
     #: A list of the current contents constraints for the widget.
     _contents_cns = []
 
     #: A list of the current size hint constraints for the widget.
     _size_hint_cns = []
 
+    #: Whether or not a refresh for a resize event has been posted to
+    #: the event queue but has not yet run.
+    _resize_pending = False
+
+    #: The time of the resize event which posted the pending refresh,
+    #: if the layout instrumentation was enabled at the time.
+    _resize_time = None
+
     #--------------------------------------------------------------------------
     # Setup Methods
     #--------------------------------------------------------------------------
@@ -187,9 +228,7 @@ class QtContainer(QtConstraintsWidget):
         layout = tree['layout']
         self._share_layout = layout['share_layout']
         self._padding = layout['padding']
-        # The resized signal is connected directly to the refresh
-        # method to save the overhead of the extra function call.
-        self.widget().resized.connect(self.refresh)
+        self.widget().resized.connect(self._on_resized)
 
     def init_layout(self):
         """ Initializes the layout for the container.
@@ -206,7 +245,7 @@ class QtContainer(QtConstraintsWidget):
             # Initializing the layout manager can fail if the objective
             # function is unbounded. We let that failure occur so it can
             # be logged. Nothing is stored until it succeeds.
-            manager = LayoutManager()
+            manager = LayoutManager(owner_label(self))
             manager.initialize(cns)
             self._offset_table = offset_table
             self._layout_table = layout_table
@@ -214,6 +253,36 @@ class QtContainer(QtConstraintsWidget):
             self._refresh = self._build_refresher(manager)
             self.refresh_sizes()
 
+    def update_layout(self):
+        """ Incrementally updates the layout for the container.
+
+        The layout table and constraints are regenerated, but only the
+        difference between the old and new constraints is applied to
+        the existing layout manager. The converted user constraints of
+        owners whose constraints have not changed are reused. If the
+        container does not yet have a layout manager, this method is
+        equivalent to `init_layout`.
+
+        """
+        manager = self._layout_manager
+        if manager is None:
+            self.init_layout()
+            return
+        offset_table, layout_table = self._build_layout_table()
+        cns = self._generate_constraints(layout_table, incremental=True)
+        try:
+            manager.update_constraints(cns)
+        except Exception:
+            # A failed update leaves the solver in an indeterminate
+            # state, so fall back to building a fresh layout manager.
+            # That path will reraise if the new system is unsolvable.
+            self._layout_manager = None
+            self.init_layout()
+            return
+        self._offset_table = offset_table
+        self._layout_table = layout_table
+        self.refresh_sizes()
+
     #--------------------------------------------------------------------------
     # Public Layout Handling
     #--------------------------------------------------------------------------
@@ -223,9 +292,13 @@ class QtContainer(QtConstraintsWidget):
 
         """
         if self._owns_layout:
+            if layout_instrumentation.enabled:
+                layout_instrumentation.record_relayout(
+                    owner_label(self), 'relayout'
+                )
             item = self.widget_item()
             old_hint = item.sizeHint()
-            self.init_layout()
+            self.update_layout()
             self.refresh()
             new_hint = item.sizeHint()
             # If the size hint constraints are empty, it indicates that
@@ -280,6 +353,10 @@ class QtContainer(QtConstraintsWidget):
         if self._owns_layout:
             manager = self._layout_manager
             if manager is not None:
+                if layout_instrumentation.enabled:
+                    layout_instrumentation.record_relayout(
+                        owner_label(self), 'replace_constraints'
+                    )
                 with size_hint_guard(self):
                     manager.replace_constraints(old_cns, new_cns)
                     self.refresh_sizes()
@@ -391,6 +468,35 @@ class QtContainer(QtConstraintsWidget):
     #--------------------------------------------------------------------------
     # Private Layout Handling
     #--------------------------------------------------------------------------
+    def _on_resized(self):
+        """ The signal handler for the 'resized' signal of the widget.
+
+        The refresh is posted to the event queue, so a burst of resize
+        events is coalesced into a single solve for the latest size.
+        Qt posts its paint requests at a low priority, so the refresh
+        is run before the widget is next painted.
+
+        """
+        if not self._resize_pending:
+            self._resize_pending = True
+            if layout_instrumentation.enabled:
+                self._resize_time = time()
+            deferredCall(self._flush_resize)
+
+    def _flush_resize(self):
+        """ Run the refresh which was posted for a resize event.
+
+        """
+        self._resize_pending = False
+        if self._widget is not None:
+            self._refresh()
+            resize_time = self._resize_time
+            if resize_time is not None:
+                self._resize_time = None
+                layout_instrumentation.record_resize_latency(
+                    owner_label(self), time() - resize_time
+                )
+
     def _build_refresher(self, manager):
         """ A private method which will build a function which, when
         called, will refresh the layout for the container.
@@ -485,7 +591,7 @@ class QtContainer(QtConstraintsWidget):
 
         return offset_table, layout_table
 
-    def _generate_constraints(self, layout_table):
+    def _generate_constraints(self, layout_table, incremental=False):
         """ Creates the list of casuarius LinearConstraint objects for
         the widgets for which this container owns the layout.
 
@@ -499,6 +605,12 @@ class QtContainer(QtConstraintsWidget):
         layout_table : list
             The layout table created by a call to _build_layout_table.
 
+        incremental : bool, optional
+            If True, the casuarius constraints converted during the
+            previous call are reused for the owners whose list of user
+            constraint dicts has not been replaced. The default is
+            False and converts all user constraints anew.
+
         Returns
         -------
         result : list
@@ -509,9 +621,10 @@ class QtContainer(QtConstraintsWidget):
         # The mapping of constraint owners and the list of constraint
         # info dictionaries provided by the Enaml widgets.
         box = self.layout_box
-        cn_owners = {self.object_id(): box}
-        cn_dicts = list(self.user_constraints())
-        cn_dicts_extend = cn_dicts.extend
+        object_id = self.object_id()
+        cn_owners = {object_id: box}
+        cn_dicts = [(object_id, self.user_constraints())]
+        add_dicts = cn_dicts.append
 
         # The list of raw casuarius constraints which will be returned
         # from this method to be added to the casuarius solver.
@@ -524,30 +637,60 @@ class QtContainer(QtConstraintsWidget):
         QtContainer_ = QtContainer
         for _, updater in layout_table:
             child = updater.item
-            cn_owners[child.object_id()] = child.layout_box
+            child_id = child.object_id()
+            cn_owners[child_id] = child.layout_box
             raw_cns_extend(child.hard_constraints())
             if isinst(child, QtContainer_):
                 if child.transfer_layout_ownership(self):
-                    cn_dicts_extend(child.user_constraints())
+                    add_dicts((child_id, child.user_constraints()))
                     raw_cns_extend(child.contents_constraints())
                 else:
                     raw_cns_extend(child.size_hint_constraints())
             else:
                 raw_cns_extend(child.size_hint_constraints())
-                cn_dicts_extend(child.user_constraints())
-
-        # Convert the list of Enaml constraints info dicts to actual
-        # casuarius LinearConstraint objects for the solver.
-        add_cn = raw_cns.append
+                add_dicts((child_id, child.user_constraints()))
+
+        # Convert the lists of Enaml constraints info dicts to actual
+        # casuarius LinearConstraint objects for the solver. A list of
+        # user constraints is replaced wholesale when a widget receives
+        # a relayout action, so an identity check against the cached
+        # list determines whether its converted constraints can be
+        # reused. A cached entry is also invalidated if one of the ids
+        # it referenced as a virtual owner now belongs to a widget. The
+        # reused constraints hold strong references to their variables.
+        old_cache = self._user_cns_cache if incremental else {}
+        new_cache = {}
+        converted = []
+        real_ids = set(cn_owners)
         as_cn = as_linear_constraint
-        for info in cn_dicts:
-            add_cn(as_cn(info, cn_owners))
+        for owner_id, infos in cn_dicts:
+            if not infos:
+                continue
+            cached = old_cache.get(owner_id)
+            if (cached is not None and cached[0] is infos and
+                    real_ids.isdisjoint(cached[2])):
+                cns = cached[1]
+                new_cache[owner_id] = cached
+            else:
+                cns = [as_cn(info, cn_owners) for info in infos]
+                converted.append((owner_id, infos, cns))
+            raw_cns_extend(cns)
+
+        virtual_ids = set(cn_owners).difference(real_ids)
+        for owner_id, infos, cns in converted:
+            if virtual_ids:
+                owner_ids = (_cn_info_owners(info) for info in infos)
+                missing = virtual_ids.intersection(chain(*owner_ids))
+            else:
+                missing = ()
+            new_cache[owner_id] = (infos, cns, frozenset(missing))
 
         # We keep a strong reference to the constraint owners dict,
         # since it may include instances of LayoutBox which were
         # created on-the-fly and hold constraint variables which
         # should not be deleted.
         self._cn_owners = cn_owners
+        self._user_cns_cache = new_cache
 
         return raw_cns
 
@@ -585,6 +728,7 @@ class QtContainer(QtConstraintsWidget):
         self._offset_table = []
         self._layout_table = []
         self._cn_owners = {}
+        self._user_cns_cache = {}
         return True
 
     def will_transfer(self):
@@ -102,6 +102,11 @@ def label_factory():
     return QtLabel
 
 
+def list_view_factory():
+    from .qt_list_view import QtListView
+    return QtListView
+
+
 def main_window_factory():
     from .qt_main_window import QtMainWindow
     return QtMainWindow
@@ -197,6 +202,11 @@ def stack_item_factory():
     return QtStackItem
 
 
+def table_view_factory():
+    from .qt_table_view import QtTableView
+    return QtTableView
+
+
 #def text_editor_factory():
 #    from .qt_text_editor import QtTextEditor
 #    return QtTextEditor
@@ -251,6 +261,7 @@ def register_default():
     register('Image', image_factory)
     register('ImageView', image_view_factory)
     register('Label', label_factory)
+    register('ListView', list_view_factory)
     register('MainWindow', main_window_factory)
     register('MdiArea', mdi_area_factory)
     register('MdiWindow', mdi_window_factory)
@@ -270,6 +281,7 @@ def register_default():
     register('Splitter', splitter_factory)
     register('Stack', stack_factory)
     register('StackItem', stack_item_factory)
+    register('TableView', table_view_factory)
     register('TimeSelector', time_selector_factory)
     register('ToolBar', tool_bar_factory)
     register('TraitsItem', traits_item_factory)
@@ -0,0 +1,26 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from .qt.QtGui import QListView
+from .qt_abstract_item_view import QtAbstractItemView
+
+
+class QtListView(QtAbstractItemView):
+    """ A Qt implementation of an Enaml ListView.
+
+    """
+    #--------------------------------------------------------------------------
+    # Setup Methods
+    #--------------------------------------------------------------------------
+    def create_widget(self, parent, tree):
+        """ Create the underlying list view widget.
+
+        Uniform item sizes let the view lay out its rows without
+        asking the model for the data of every row.
+
+        """
+        widget = QListView(parent)
+        widget.setUniformItemSizes(True)
+        return widget
+
@@ -7,6 +7,7 @@ from weakref import WeakKeyDictionary
 
 from .qt.QtCore import Qt, QEvent, Signal
 from .qt.QtGui import QTabWidget, QTabBar, QResizeEvent, QApplication
+from .q_deferred_caller import timedCall
 from .qt_constraints_widget import QtConstraintsWidget
 from .qt_page import QtPage
 
@@ -257,6 +258,14 @@ class QtNotebook(QtConstraintsWidget):
     """ A Qt implementation of an Enaml Notebook.
 
     """
+    #: The number of pages on each side of the current page for which
+    #: deferred contents are requested in the background.
+    prewarm_count = 1
+
+    #: The delay, in milliseconds, before the deferred contents of the
+    #: neighboring pages are requested.
+    prewarm_delay = 250
+
     #--------------------------------------------------------------------------
     # Setup methods
     #--------------------------------------------------------------------------
@@ -293,6 +302,49 @@ class QtNotebook(QtConstraintsWidget):
                 widget.addPage(child.widget())
         widget.layoutRequested.connect(self.on_layout_requested)
 
+    def activate(self):
+        """ Activate the notebook.
+
+        The deferred contents of the current page are requested once
+        the notebook is active, and whenever the current page changes.
+
+        """
+        super(QtNotebook, self).activate()
+        self.widget().currentChanged.connect(self.on_current_changed)
+        self.on_current_changed()
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _page_at(self, index):
+        """ Get the QtPage for the tab at the given index.
+
+        Returns
+        -------
+        result : QtPage or None
+            The page for the tab, or None if the index is invalid.
+
+        """
+        widget = self.widget().widget(index)
+        if widget is not None:
+            for child in self.children():
+                if isinstance(child, QtPage) and child.widget() is widget:
+                    return child
+
+    def _prewarm(self):
+        """ Request the deferred contents of the neighboring pages.
+
+        """
+        widget = self.widget()
+        if widget is None:
+            return
+        current = widget.currentIndex()
+        for offset in xrange(1, self.prewarm_count + 1):
+            for index in (current - offset, current + offset):
+                page = self._page_at(index)
+                if page is not None:
+                    page.materialize_children()
+
     #--------------------------------------------------------------------------
     # Child Events
     #--------------------------------------------------------------------------
@@ -321,6 +373,16 @@ class QtNotebook(QtConstraintsWidget):
         """
         self.size_hint_updated()
 
+    def on_current_changed(self, index=None):
+        """ Handle the `currentChanged` signal from the QNotebook.
+
+        """
+        page = self._page_at(self.widget().currentIndex())
+        if page is not None:
+            page.materialize_children()
+        if self.prewarm_count > 0:
+            timedCall(self.prewarm_delay, self._prewarm)
+
     #--------------------------------------------------------------------------
     # Message Handlers
     #--------------------------------------------------------------------------
@@ -118,6 +118,7 @@ class QtObject(object):
         self._children = []
         self._widget = None
         self._initialized = False
+        self._children_deferred = False
         self.set_parent(parent)
 
     #--------------------------------------------------------------------------
@@ -217,6 +218,7 @@ class QtObject(object):
         parent = self._parent
         parent_widget = parent.widget() if parent else None
         self._widget = self.create_widget(parent_widget, tree)
+        self._children_deferred = tree.get('children_deferred', False)
 
     def initialized(self):
         """ Get whether or not this object is initialized.
@@ -423,6 +425,30 @@ class QtObject(object):
         if widget is not None:
             widget.setParent(self._widget)
 
+    def children_deferred(self):
+        """ Get whether the children of this object are deferred.
+
+        Returns
+        -------
+        result : bool
+            True if the server has withheld the children of this
+            object until they are requested, False otherwise.
+
+        """
+        return self._children_deferred
+
+    def materialize_children(self):
+        """ Request the deferred children of this object.
+
+        The server will send the children with a `children_changed`
+        action. This is a no-op if the children are not deferred. It
+        should only be called once the session has been activated.
+
+        """
+        if self._children_deferred:
+            self._children_deferred = False
+            self.send_action('materialize_children', {})
+
     def index_of(self, child):
         """ Return the index of the given child.
 
@@ -491,15 +517,28 @@ class QtObject(object):
 
         This method will unparent the removed children and add the new
         children to this object. If a given new child does not exist, it
-        will be built. Subclasses that need more control may reimplement
-        this method. The default implementation disables updates on the
-        widget while adding children and reenables them on the next cyle
-        of the event loop.
+        will be built, initialized and activated. Subclasses that need
+        more control may reimplement this method. The default
+        implementation disables updates on the widget while adding
+        children and reenables them on the next cyle of the event loop.
 
         """
+        # The message carries any deferred children of this object.
+        self._children_deferred = False
+
+        # The edit script is applied to the order of the children as
+        # it was before they were unparented. If that order has gone
+        # out of sync with the server, the full order is requested.
+        lookup = self._session.lookup
+        edits = content.get('edits')
+        if edits is not None:
+            ordered = list(self._children)
+            if len(ordered) != content['size']:
+                edits = None
+                self.send_action('children_resync', {})
+
         # Unparent the children being removed. Destroying a widget is
         # handled through a separate message.
-        lookup = self._session.lookup
         for object_id in content['removed']:
             child = lookup(object_id)
             if child is not None and child._parent is self:
@@ -514,11 +553,35 @@ class QtObject(object):
             else:
                 child = self._session.build(tree, self)
                 child.initialize()
+                child.activate()
+
+        # Apply the edit script. Its cost scales with the number of
+        # changes rather than the number of children.
+        if edits is not None:
+            for edit in edits:
+                op = edit[0]
+                if op == 'remove':
+                    del ordered[edit[1]:edit[1] + edit[2]]
+                elif op == 'move':
+                    block = ordered[edit[1]:edit[1] + edit[2]]
+                    del ordered[edit[1]:edit[1] + edit[2]]
+                    ordered[edit[3]:edit[3]] = block
+                else:
+                    inserted = []
+                    for object_id in edit[2]:
+                        child = lookup(object_id)
+                        if child is not None and child._parent is self:
+                            inserted.append(child)
+                    ordered[edit[1]:edit[1]] = inserted
+            self._children = ordered
+            return
 
         # Update the ordering of the children based on the order given
         # in the message. If the given order does not include all of
         # the current children, then the ones not included will be
         # appended to the end of the new list in an undefined order.
+        if 'order' not in content:
+            return
         ordered = []
         curr_set = set(self._children)
         for object_id in content['order']:
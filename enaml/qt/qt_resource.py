@@ -24,7 +24,31 @@ _ICON_STATE_MAP = {
 }
 
 
-def convert_from_Image(image):
+def _frame_data(data, frames):
+    """ Resolve a binary payload which may reference an out-of-band
+    frame.
+
+    Parameters
+    ----------
+    data : str or dict
+        The inline payload, or a `{'frame': index}` reference to one
+        of the given frames.
+
+    frames : sequence
+        The out-of-band frames sent along with the resource.
+
+    Returns
+    -------
+    result : str or buffer
+        The binary payload.
+
+    """
+    if isinstance(data, dict):
+        return frames[data['frame']]
+    return data
+
+
+def convert_from_Image(image, frames=()):
     """ Convert the given resource dict into a QImage.
 
     Parameters
@@ -32,6 +56,9 @@ def convert_from_Image(image):
     image : dict
         A dictionary representation of an Enaml Image.
 
+    frames : sequence, optional
+        The out-of-band frames referenced by the image data.
+
     Returns
     -------
     result : QImage
@@ -41,10 +68,11 @@ def convert_from_Image(image):
     format = image['format']
     if format == 'auto':
         format = ''
-    return QImage.fromData(image['data'], format)
+    data = _frame_data(image['data'], frames)
+    return QImage.fromData(data, format)
 
 
-def convert_from_Icon(icon):
+def convert_from_Icon(icon, frames=()):
     """ Convert the given resource dict into a QIcon.
 
     Parameters
@@ -52,6 +80,9 @@ def convert_from_Icon(icon):
     image : dict
         A dictionary representation of an Enaml Icon.
 
+    frames : sequence, optional
+        The out-of-band frames referenced by the icon images.
+
     Returns
     -------
     result : QIcon
@@ -62,12 +93,12 @@ def convert_from_Icon(icon):
     for img in icon['images']:
         mode = _ICON_MODE_MAP[img['mode']]
         state = _ICON_STATE_MAP[img['state']]
-        image = convert_resource(img['image'])
+        image = convert_resource(img['image'], frames)
         qicon.addPixmap(QPixmap.fromImage(image), mode, state)
     return qicon
 
 
-def convert_resource(resource):
+def convert_resource(resource, frames=()):
     """ Convert a resource dict into a Qt resource handle.
 
     Parameters
@@ -75,6 +106,9 @@ def convert_resource(resource):
     resource : dict
         A dictionary representation of the Qt resource to create.
 
+    frames : sequence, optional
+        The out-of-band binary frames referenced by the resource.
+
     Returns
     -------
     result : QObject or None
@@ -94,5 +128,4 @@ def convert_resource(resource):
             msg = 'failed to create resource `%s:%s`'
             logger.error(msg % (resource['class'], resource['bases']))
             return
-    return handler(resource)
-
+    return handler(resource, frames)
@@ -5,9 +5,10 @@
 import logging
 from urlparse import urlparse
 
-from enaml.utils import id_generator
+from enaml.utils import LRUCache, id_generator
 
 from .q_deferred_caller import deferredCall
+from .qt.QtGui import QIcon, QImage, QPixmap
 from .qt_resource import convert_resource
 
 
@@ -18,6 +19,45 @@ logger = logging.getLogger(__name__)
 req_id_generator = id_generator('r_')
 
 
+#: A sentinel for a cache limit which is left unchanged.
+_UNCHANGED = object()
+
+
+#: The icon modes and states used to compute the size of an icon.
+_ICON_MODES = (QIcon.Normal, QIcon.Disabled, QIcon.Active, QIcon.Selected)
+_ICON_STATES = (QIcon.Off, QIcon.On)
+
+
+def resource_nbytes(resource):
+    """ Compute the approximate memory size of a Qt resource handle.
+
+    Parameters
+    ----------
+    resource : QImage, QPixmap, or QIcon
+        The resource handle created by the resource manager.
+
+    Returns
+    -------
+    result : int
+        The approximate number of bytes used by the resource pixels.
+
+    """
+    if isinstance(resource, QImage):
+        return resource.byteCount()
+    if isinstance(resource, QPixmap):
+        return resource.width() * resource.height() * resource.depth() // 8
+    if isinstance(resource, QIcon):
+        # An icon holds pixmaps for the sizes added for each mode and
+        # state. The pixmaps are assumed to have a depth of 32 bits.
+        nbytes = 0
+        for mode in _ICON_MODES:
+            for state in _ICON_STATES:
+                for size in resource.availableSizes(mode, state):
+                    nbytes += size.width() * size.height() * 4
+        return nbytes
+    return 0
+
+
 class DeferredResource(object):
     """ An deferred resource object returned by a `QtURLRequestManager`.
 
@@ -75,13 +115,75 @@ class QtResourceManager(object):
     """ An object which manages requesting urls from the server session.
 
     """
-    def __init__(self):
+    #: The default maximum number of cached resource handles.
+    default_max_entries = 512
+
+    #: The default maximum size in bytes of the cached handles.
+    default_max_bytes = 64 * 1024 * 1024
+
+    def __init__(self, max_entries=None, max_bytes=None):
         """ Initialize a QtResourceManager.
 
+        Parameters
+        ----------
+        max_entries : int, optional
+            The maximum number of resource handles to cache. If not
+            given, `default_max_entries` is used.
+
+        max_bytes : int, optional
+            The maximum total size in bytes of the cached resource
+            handles, as computed from the pixel dimensions and depth.
+            If not given, `default_max_bytes` is used.
+
         """
-        self._handles = {}
+        if max_entries is None:
+            max_entries = self.default_max_entries
+        if max_bytes is None:
+            max_bytes = self.default_max_bytes
+        self._handles = LRUCache(max_entries, max_bytes, resource_nbytes)
         self._pending = {}
 
+    #--------------------------------------------------------------------------
+    # Public API
+    #--------------------------------------------------------------------------
+    def cache_stats(self):
+        """ Get the statistics for the resource handle cache.
+
+        Returns
+        -------
+        result : dict
+            A dict with the keys 'entries', 'bytes', 'hits', 'misses'
+            and 'evictions'.
+
+        """
+        return self._handles.stats()
+
+    def set_cache_limits(self, max_entries=_UNCHANGED, max_bytes=_UNCHANGED):
+        """ Set the limits of the resource handle cache.
+
+        Entries are evicted immediately if the cache exceeds the new
+        limits.
+
+        Parameters
+        ----------
+        max_entries : int, optional
+            The maximum number of resource handles to cache. None
+            indicates no limit. If not given, the current limit is
+            kept.
+
+        max_bytes : int, optional
+            The maximum total size in bytes of the cached handles.
+            None indicates no limit. If not given, the current limit
+            is kept.
+
+        """
+        handles = self._handles
+        if max_entries is _UNCHANGED:
+            max_entries = handles.max_entries
+        if max_bytes is _UNCHANGED:
+            max_bytes = handles.max_bytes
+        handles.set_limits(max_entries, max_bytes)
+
     def load(self, url, metadata, request):
         """ Load the resource handle for the given url.
 
@@ -118,9 +220,9 @@ class QtResourceManager(object):
             return loader
         keyval = key_handler(metadata)
         key = (url, keyval)
-        handles = self._handles
-        if key in handles:
-            deferredCall(loader._notify, handles[key])
+        handle = self._handles.get(key)
+        if handle is not None:
+            deferredCall(loader._notify, handle)
             return loader
         pending = self._pending
         if key in pending:
@@ -132,7 +234,7 @@ class QtResourceManager(object):
         request(req_id, url, metadata)
         return loader
 
-    def on_load(self, req_id, url, resource):
+    def on_load(self, req_id, url, resource, frames=()):
         """ Handle the loading of a requested resource.
 
         This method is called by the QtSession object when it receives
@@ -149,6 +251,9 @@ class QtResourceManager(object):
         resource : dict
             The dictionary representation of the loaded resource.
 
+        frames : sequence, optional
+            The out-of-band binary frames referenced by the resource.
+
         """
         pending = self._pending
         if req_id in pending:
@@ -157,9 +262,9 @@ class QtResourceManager(object):
                 loaders = pending.pop(key)
             else:
                 loaders = ()
-            qt_resource = convert_resource(resource)
+            qt_resource = convert_resource(resource, frames)
             if qt_resource is not None:
-                self._handles[key] = qt_resource
+                self._handles.set(key, qt_resource)
                 for loader in loaders:
                     loader._notify(qt_resource)
 
@@ -4,7 +4,9 @@
 #------------------------------------------------------------------------------
 from collections import defaultdict
 import logging
+from time import time
 
+from enaml.message_instrumentation import message_instrumentation
 from enaml.utils import make_dispatcher
 
 from .qt_resource_manager import QtResourceManager
@@ -18,6 +20,11 @@ logger = logging.getLogger(__name__)
 dispatch_action = make_dispatcher('on_action_', logger)
 
 
+#: The protocol features supported by the client. These are announced
+#: to the server session when the client session is activated.
+CLIENT_FEATURES = ('children_edits', 'snapshot_templates')
+
+
 class URLRequest(object):
     """ A simple object for making url requests.
 
@@ -82,6 +89,7 @@ class QtSession(object):
         self._widget_groups = widget_groups
         self._resource_manager = QtResourceManager()
         self._registered_objects = {}
+        self._templates = {}
         self._windows = []
         self._socket = None
 
@@ -118,6 +126,8 @@ class QtSession(object):
         # request resources from the server for startup purposes.
         self._socket = socket
         socket.on_message(self.on_message)
+        content = {'features': list(CLIENT_FEATURES)}
+        self.send(self._session_id, 'client_features', content)
         for window in self._windows:
             window.activate()
 
@@ -141,6 +151,14 @@ class QtSession(object):
             the building errors will be sent to the error logger.
 
         """
+        # Expand a snapshot which shares its values with a template.
+        if 'template' in tree:
+            templates = self._templates
+            if 'template_def' in tree:
+                templates[tree['template']] = tree['template_def']
+            expanded = templates[tree['template']].copy()
+            expanded.update(tree)
+            tree = expanded
         groups = self._widget_groups
         factory = QtWidgetRegistry.lookup(tree['class'], groups)
         if factory is None:
@@ -249,6 +267,12 @@ class QtSession(object):
         """
         socket = self._socket
         if socket is not None:
+            if message_instrumentation.enabled:
+                obj = self._registered_objects.get(object_id)
+                class_name = type(obj).__name__ if obj is not None else ''
+                message_instrumentation.message_sent(
+                    'client', class_name, object_id, action, content
+                )
             socket.send(object_id, action, content)
 
     def on_message(self, object_id, action, content):
@@ -271,7 +295,7 @@ class QtSession(object):
 
         """
         if object_id == self._session_id:
-            dispatch_action(self, action, content)
+            obj = self
         else:
             try:
                 obj = self._registered_objects[object_id]
@@ -279,8 +303,25 @@ class QtSession(object):
                 msg = "Invalid object id sent to QtSession: %s:%s"
                 logger.warn(msg % (object_id, action))
                 return
-            else:
-                obj.receive_action(action, content)
+        # The messages of a batch are reported individually by the
+        # 'message_batch' handler.
+        instrument = (
+            message_instrumentation.enabled and action != 'message_batch'
+        )
+        if instrument:
+            class_name = type(obj).__name__
+            message_instrumentation.message_received(
+                'client', class_name, object_id, action, content
+            )
+            start = time()
+        if obj is self:
+            dispatch_action(self, action, content)
+        else:
+            obj.receive_action(action, content)
+        if instrument:
+            message_instrumentation.action_dispatched(
+                'client', class_name, action, time() - start
+            )
 
     #--------------------------------------------------------------------------
     # Action Handlers
@@ -295,7 +336,8 @@ class QtSession(object):
         manager = self._resource_manager
         if status == 'ok':
             resource = content['resource']
-            manager.on_load(req_id, url, resource)
+            frames = content.get('frames', ())
+            manager.on_load(req_id, url, resource, frames)
         else:
             manager.on_fail(req_id, url)
 
@@ -317,6 +359,7 @@ class QtSession(object):
         for value in actions.itervalues():
             ordered.extend(value)
         objects = self._registered_objects
+        instrument = message_instrumentation.enabled
         for object_id, action, msg_content in ordered:
             try:
                 obj = objects[object_id]
@@ -324,7 +367,17 @@ class QtSession(object):
                 msg = "Invalid object id sent to QtSession %s:%s"
                 logger.warn(msg % (object_id, action))
             else:
+                if instrument:
+                    class_name = type(obj).__name__
+                    message_instrumentation.message_received(
+                        'client', class_name, object_id, action, msg_content
+                    )
+                    start = time()
                 dispatch_action(obj, action, msg_content)
+                if instrument:
+                    message_instrumentation.action_dispatched(
+                        'client', class_name, action, time() - start
+                    )
 
     def on_action_close(self, content):
         """ Handle the 'close' action sent by the Enaml session.
@@ -4,6 +4,7 @@
 #------------------------------------------------------------------------------
 from .qt.QtCore import QTimer, QEvent, Signal
 from .qt.QtGui import QStackedWidget, QPixmap
+from .q_deferred_caller import timedCall
 from .qt_constraints_widget import QtConstraintsWidget
 from .qt_stack_item import QtStackItem
 from .q_pixmap_painter import QPixmapPainter
@@ -221,6 +222,14 @@ class QtStack(QtConstraintsWidget):
     """ A Qt implementation of an Enaml Stack.
 
     """
+    #: The number of items on each side of the current item for which
+    #: deferred contents are requested in the background.
+    prewarm_count = 1
+
+    #: The delay, in milliseconds, before the deferred contents of the
+    #: neighboring items are requested.
+    prewarm_delay = 250
+
     #: The initial selected index in the stack.
     _initial_index = 0
 
@@ -252,6 +261,61 @@ class QtStack(QtConstraintsWidget):
         widget.layoutRequested.connect(self.on_layout_requested)
         widget.currentChanged.connect(self.on_current_changed)
 
+    def activate(self):
+        """ Activate the stack.
+
+        The deferred contents of the current item are requested once
+        the stack is active, and whenever the current item changes.
+
+        """
+        super(QtStack, self).activate()
+        self.widget().currentChanged.connect(self._materialize_current)
+        self._materialize_current()
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _item_at(self, index):
+        """ Get the QtStackItem at the given index of the stack.
+
+        Returns
+        -------
+        result : QtStackItem or None
+            The stack item, or None if the index is invalid.
+
+        """
+        widget = self.widget().widget(index)
+        if widget is not None:
+            for child in self.children():
+                if isinstance(child, QtStackItem):
+                    if child.widget() is widget:
+                        return child
+
+    def _materialize_current(self, index=None):
+        """ Request the deferred contents of the current item and
+        schedule the request for the neighboring items.
+
+        """
+        item = self._item_at(self.widget().currentIndex())
+        if item is not None:
+            item.materialize_children()
+        if self.prewarm_count > 0:
+            timedCall(self.prewarm_delay, self._prewarm)
+
+    def _prewarm(self):
+        """ Request the deferred contents of the neighboring items.
+
+        """
+        widget = self.widget()
+        if widget is None:
+            return
+        current = widget.currentIndex()
+        for offset in xrange(1, self.prewarm_count + 1):
+            for index in (current - offset, current + offset):
+                item = self._item_at(index)
+                if item is not None:
+                    item.materialize_children()
+
     #--------------------------------------------------------------------------
     # Child Events
     #--------------------------------------------------------------------------
@@ -0,0 +1,21 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from .qt.QtGui import QTableView
+from .qt_abstract_item_view import QtAbstractItemView
+
+
+class QtTableView(QtAbstractItemView):
+    """ A Qt implementation of an Enaml TableView.
+
+    """
+    #--------------------------------------------------------------------------
+    # Setup Methods
+    #--------------------------------------------------------------------------
+    def create_widget(self, parent, tree):
+        """ Create the underlying table view widget.
+
+        """
+        return QTableView(parent)
+
@@ -0,0 +1,452 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+""" A transport agnostic application which serves remote clients.
+
+The `RemoteApplication` multiplexes any number of sessions over the
+requests delivered by a server transport. The messages exchanged with
+a client are:
+
+    'discover' {}
+        Reply with the list of available sessions.
+
+    'start_session' {'name', 'window', 'features'}
+        Start a session and reply with its id, widget groups and
+        snapshot. The optional features are the protocol features
+        supported by the client. Messages for the session are then
+        pushed to the client as 'session_message'.
+
+    'end_session' {'session_id'}
+        End the session and reply with its id.
+
+    'session_message' {'session_id', 'object_id', 'action', 'content'}
+        A message for a session object. Sent in both directions.
+
+    'session_ack' {'session_id', 'count'}
+        Sent by the client after it has processed `count` session
+        messages. This returns credits to the flow control window.
+
+    'session_closed' {'session_id'}
+        Pushed to the client when a session has been ended.
+
+"""
+from collections import deque
+import logging
+import types
+import uuid
+
+from enaml.application import Application
+from enaml.socket_interface import ActionSocketInterface
+from enaml.weakmethod import WeakMethod
+
+
+logger = logging.getLogger(__name__)
+
+
+class RemoteActionSocket(object):
+    """ A concrete implementation of ActionSocketInterface for a
+    remote client.
+
+    The socket pushes 'session_message' messages to a client through
+    a push handler. Flow control is credit based: each pushed message
+    consumes a credit and the credits are returned by the client with
+    'session_ack' messages. While the socket has no credits, messages
+    are queued in order. If the queue grows beyond `max_pending`, the
+    client is considered stalled and the `on_stall` callback is run.
+
+    """
+    def __init__(self, session_id, push_handler, window, max_pending=None,
+                 on_stall=None):
+        """ Initialize a RemoteActionSocket.
+
+        Parameters
+        ----------
+        session_id : str
+            The unique identifier of the session using the socket.
+
+        push_handler : BasePushHandler
+            The push handler for the client of the session.
+
+        window : int
+            The number of messages which may be pushed to the client
+            before an acknowledgement is required.
+
+        max_pending : int, optional
+            The maximum number of queued messages before the client is
+            considered stalled. The default of None does not limit
+            the queue.
+
+        on_stall : callable, optional
+            A callable which is invoked with the session id the first
+            time the queue grows beyond `max_pending`.
+
+        """
+        self._session_id = session_id
+        self._push_handler = push_handler
+        self._credits = window
+        self._max_pending = max_pending
+        self._on_stall = on_stall
+        self._pending = deque()
+        self._callback = None
+        self._stalled = False
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _push(self, content):
+        """ Push a session message to the client and consume a credit.
+
+        """
+        self._credits -= 1
+        self._push_handler.push('session_message', content)
+
+    #--------------------------------------------------------------------------
+    # ActionSocketInterface
+    #--------------------------------------------------------------------------
+    def on_message(self, callback):
+        """ Register a callback for receiving messages sent by a client
+        object.
+
+        Parameters
+        ----------
+        callback : callable
+            A callable with an argument signature that is equivalent to
+            the `send` method. If the callback is a bound method, then
+            the lifetime of the callback will be bound to lifetime of
+            the method owner object.
+
+        """
+        if isinstance(callback, types.MethodType):
+            callback = WeakMethod(callback)
+        self._callback = callback
+
+    def send(self, object_id, action, content):
+        """ Send the action to the client of the session.
+
+        Any binary 'frames' in the content are moved to the top level
+        of the message so that the transport can send them raw.
+
+        Parameters
+        ----------
+        object_id : str
+            The object id of the target object.
+
+        action : str
+            The action that should be performed by the object.
+
+        content : dict
+            The content dictionary for the action.
+
+        """
+        if self._push_handler is None:
+            return
+        msg = {
+            'session_id': self._session_id,
+            'object_id': object_id,
+            'action': action,
+        }
+        if 'frames' in content:
+            content = content.copy()
+            msg['frames'] = content.pop('frames')
+        msg['content'] = content
+        pending = self._pending
+        if self._credits > 0 and not pending:
+            self._push(msg)
+            return
+        pending.append(msg)
+        max_pending = self._max_pending
+        if max_pending is not None and len(pending) > max_pending:
+            if not self._stalled:
+                self._stalled = True
+                if self._on_stall is not None:
+                    self._on_stall(self._session_id)
+
+    #--------------------------------------------------------------------------
+    # Public API
+    #--------------------------------------------------------------------------
+    def receive(self, object_id, action, content):
+        """ Receive a message sent by the client.
+
+        The message will be routed to the registered callback, if one
+        exists.
+
+        Parameters
+        ----------
+        object_id : str
+            The object id of the target object.
+
+        action : str
+            The action that should be performed by the object.
+
+        content : dict
+            The content dictionary for the action.
+
+        """
+        callback = self._callback
+        if callback is not None:
+            callback(object_id, action, content)
+
+    def ack(self, count):
+        """ Return credits to the socket and push queued messages.
+
+        Parameters
+        ----------
+        count : int
+            The number of messages processed by the client.
+
+        """
+        self._credits += count
+        pending = self._pending
+        while pending and self._credits > 0:
+            self._push(pending.popleft())
+        max_pending = self._max_pending
+        if max_pending is None or len(pending) <= max_pending:
+            self._stalled = False
+
+    def pending(self):
+        """ Get the number of messages waiting for credits.
+
+        """
+        return len(self._pending)
+
+    def close(self):
+        """ Close the socket.
+
+        Queued messages are discarded and the client is notified with
+        a 'session_closed' message, after which the push handler is
+        closed. Once closed, messages sent on the socket are dropped.
+
+        """
+        handler = self._push_handler
+        if handler is not None:
+            self._pending.clear()
+            self._push_handler = None
+            self._callback = None
+            handler.push('session_closed', {'session_id': self._session_id})
+            handler.close()
+
+
+ActionSocketInterface.register(RemoteActionSocket)
+
+
+class RemoteApplication(Application):
+    """ An application which serves its sessions to remote clients.
+
+    This class implements the session management and the message
+    routing for any number of clients. A subclass must provide the
+    event loop by implementing `start`, `stop`, `deferred_call`,
+    `timed_call` and `is_main_thread`, and must deliver the messages
+    received by its server transport to `handle_request`.
+
+    """
+    #: The default flow control window for a session. This is the
+    #: number of messages pushed before an acknowledgement is needed.
+    default_window = 256
+
+    #: The maximum number of queued messages for a session before the
+    #: client is considered stalled and the session is ended. None
+    #: will allow the queue to grow without bound.
+    max_pending = 8192
+
+    def __init__(self, factories):
+        """ Initialize a RemoteApplication.
+
+        Parameters
+        ----------
+        factories : iterable
+            An iterable of SessionFactory instances to pass to the
+            superclass constructor.
+
+        """
+        super(RemoteApplication, self).__init__(factories)
+        self._sessions = {}
+        self._sockets = {}
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _on_stall(self, session_id):
+        """ Handle a stalled client for the given session.
+
+        The session is ended on the next cycle of the event loop since
+        this is invoked while the session is sending a message.
+
+        """
+        msg = 'Ending session %s: client is not consuming messages'
+        logger.warn(msg % session_id)
+        self.deferred_call(self._end_stalled, session_id)
+
+    def _end_stalled(self, session_id):
+        """ End a stalled session if it is still running.
+
+        """
+        if session_id in self._sessions:
+            self.end_session(session_id)
+
+    def _handle_discover(self, request, content):
+        """ Handle the 'discover' message type.
+
+        """
+        request.reply({'status': 'ok', 'sessions': self.discover()})
+
+    def _handle_start_session(self, request, content):
+        """ Handle the 'start_session' message type.
+
+        """
+        try:
+            session_id = self.start_session(content.get('name'))
+        except ValueError as e:
+            request.reply({'status': 'error', 'message': str(e)})
+            return
+        session = self._sessions[session_id]
+        session.client_features = set(content.get('features', ()))
+        request.reply({
+            'status': 'ok',
+            'session_id': session_id,
+            'widget_groups': session.widget_groups[:],
+            'snapshot': session.snapshot(),
+        })
+        window = content.get('window') or self.default_window
+        socket = RemoteActionSocket(
+            session_id, request.push_handler(), window, self.max_pending,
+            self._on_stall,
+        )
+        self._sockets[session_id] = socket
+        session.activate(socket)
+
+    def _handle_end_session(self, request, content):
+        """ Handle the 'end_session' message type.
+
+        """
+        session_id = content.get('session_id')
+        try:
+            self.end_session(session_id)
+        except ValueError as e:
+            request.reply({'status': 'error', 'message': str(e)})
+            return
+        request.reply({'status': 'ok', 'session_id': session_id})
+
+    def _handle_session_message(self, request, content):
+        """ Handle the 'session_message' message type.
+
+        """
+        socket = self._sockets.get(content.get('session_id'))
+        if socket is None:
+            msg = 'Message sent to invalid session id %s'
+            logger.warn(msg % content.get('session_id'))
+            return
+        msg_content = content.get('content', {})
+        if 'frames' in content:
+            msg_content['frames'] = content['frames']
+        socket.receive(content['object_id'], content['action'], msg_content)
+
+    def _handle_session_ack(self, request, content):
+        """ Handle the 'session_ack' message type.
+
+        """
+        socket = self._sockets.get(content.get('session_id'))
+        if socket is not None:
+            socket.ack(content.get('count', 0))
+
+    #--------------------------------------------------------------------------
+    # Abstract API Implementation
+    #--------------------------------------------------------------------------
+    def start_session(self, name):
+        """ Start a new session of the given name.
+
+        The session is opened but not activated. It is activated when
+        a client requests it with a 'start_session' message.
+
+        Parameters
+        ----------
+        name : str
+            The name of the session to start.
+
+        Returns
+        -------
+        result : str
+            The unique identifier for the created session.
+
+        """
+        if name not in self._named_factories:
+            raise ValueError('Invalid session name')
+        factory = self._named_factories[name]
+        session = factory()
+        session_id = uuid.uuid4().hex
+        session.open(session_id)
+        self._sessions[session_id] = session
+        return session_id
+
+    def end_session(self, session_id):
+        """ End the session with the given session id.
+
+        This method will close down the existing session. If the session
+        id is not valid, an exception will be raised.
+
+        Parameters
+        ----------
+        session_id : str
+            The unique identifier for the session to close.
+
+        """
+        if session_id not in self._sessions:
+            raise ValueError('Invalid session id')
+        session = self._sessions.pop(session_id)
+        socket = self._sockets.pop(session_id, None)
+        if socket is not None:
+            session.close()
+            socket.close()
+
+    def session(self, session_id):
+        """ Get the session for the given session id.
+
+        Parameters
+        ----------
+        session_id : str
+            The unique identifier for the session to retrieve.
+
+        Returns
+        -------
+        result : Session or None
+            The session object with the given id, or None if the id
+            does not correspond to an active session.
+
+        """
+        return self._sessions.get(session_id)
+
+    def sessions(self):
+        """ Get the currently active sessions for the application.
+
+        Returns
+        -------
+        result : list
+            The list of currently active sessions for the application.
+
+        """
+        return self._sessions.values()
+
+    #--------------------------------------------------------------------------
+    # Public API
+    #--------------------------------------------------------------------------
+    def handle_request(self, request):
+        """ Handle a request from a remote client.
+
+        The request is dispatched to a handler method based on the
+        type of its message. Requests of an unknown type are answered
+        with an error reply.
+
+        Parameters
+        ----------
+        request : BaseRequest
+            The request object created by the server transport.
+
+        """
+        message = request.message
+        msg_type = message.header.get('msg_type', '')
+        handler = getattr(self, '_handle_' + msg_type, None)
+        if handler is None:
+            msg = 'Unhandled message type `%s`' % msg_type
+            request.reply({'status': 'error', 'message': msg})
+            return
+        handler(request, message.content)
@@ -0,0 +1,147 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from abc import ABCMeta, abstractmethod, abstractproperty
+
+from enaml.message import create_message
+
+
+class BaseRequest(object):
+    """ An abstract base class which defines a client request.
+
+    Concrete implementations of this class are created by a server
+    transport for each message received from a client, and are passed
+    to the `handle_request` method of the Application.
+
+    """
+    __metaclass__ = ABCMeta
+
+    @abstractproperty
+    def message(self):
+        """ The Message object for this request.
+
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def add_callback(self, callback):
+        """ Add a callback to the event queue to be called later.
+
+        Parameters
+        ----------
+        callback : callable
+            A callable which should be invoked by the event loop at
+            some future time. This method will return immediately.
+
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def send_reply(self, message):
+        """ Send the given message to the client as a reply.
+
+        Parameters
+        ----------
+        message : Message
+            A Message instance to send to the client as a reply to
+            this particular request.
+
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def push_handler(self):
+        """ Get an object which can push unsolicited messages to the
+        client which made this request.
+
+        Returns
+        -------
+        result : BasePushHandler
+            A push handler for the client of this request.
+
+        """
+        raise NotImplementedError
+
+    def reply(self, content, metadata=None):
+        """ Send a reply to the client for this request.
+
+        The type of the reply message is the type of the request
+        message with a '_reply' suffix.
+
+        Parameters
+        ----------
+        content : dict
+            The content dict for the reply.
+
+        metadata : dict, optional
+            The metadata dict for the reply.
+
+        """
+        header = self.message.header
+        msg_type = header.get('msg_type', '') + '_reply'
+        message = create_message(msg_type, content, header, metadata)
+        self.send_reply(message)
+
+
+class BasePushHandler(object):
+    """ An abstract base class which defines a push handler.
+
+    A push handler is used to send unsolicited messages to a client
+    for as long as the client is connected.
+
+    """
+    __metaclass__ = ABCMeta
+
+    @abstractmethod
+    def push_message(self, message):
+        """ Push the given message to the client.
+
+        Parameters
+        ----------
+        message : Message
+            The Message instance that should be pushed to the client.
+
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def add_callback(self, callback):
+        """ Add a callback to the event queue to be called later.
+
+        Parameters
+        ----------
+        callback : callable
+            A callable which should be invoked by the event loop at
+            some future time. This method returns immediately.
+
+        """
+        raise NotImplementedError
+
+    def push(self, msg_type, content, metadata=None):
+        """ Create a new message and push it to the client.
+
+        Parameters
+        ----------
+        msg_type : str
+            The type of the message to push.
+
+        content : dict
+            The content dict for the message.
+
+        metadata : dict, optional
+            The metadata dict for the message.
+
+        """
+        message = create_message(msg_type, content, metadata=metadata)
+        self.push_message(message)
+
+    def close(self):
+        """ Release the handler once no more messages will be pushed.
+
+        This is called when the session which pushes to the client has
+        ended, so that the transport can release any state it keeps for
+        the client. The default implementation does nothing.
+
+        """
+        pass
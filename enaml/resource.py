@@ -27,12 +27,20 @@ class Resource(HasTraits):
             names.append(base.__name__)
         return names
 
-    def snapshot(self):
+    def snapshot(self, frames=None):
         """ Get a snapshot dictionary for this resource.
 
         Subclass should reimplement this method to add more metadata
         to the snapshot dictionary.
 
+        Parameters
+        ----------
+        frames : list, optional
+            If provided, binary payloads of the resource are appended
+            to this list as out-of-band frames, and the snapshot holds
+            a `{'frame': index}` reference to the frame instead of the
+            payload. The default is None and inlines the payloads.
+
         """
         return {'class': self.class_name(), 'bases': self.base_names()}
 
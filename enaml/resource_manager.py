@@ -3,17 +3,260 @@
 #  All rights reserved.
 #------------------------------------------------------------------------------
 import logging
+from threading import Lock
+from time import time
 from urlparse import urlparse
 
-from traits.api import HasTraits, Dict, Str
+from traits.api import HasTraits, Any, Dict, Instance, Str
 
+from .application import deferred_call
 from .icon_provider import IconProvider
 from .image_provider import ImageProvider
+from .utils import LRUCache
 
 
 logger = logging.getLogger(__name__)
 
 
+def resource_nbytes(resource):
+    """ Compute the size of the binary payloads of a resource.
+
+    Parameters
+    ----------
+    resource : Resource
+        The resource object loaded by a provider.
+
+    Returns
+    -------
+    result : int
+        The total number of bytes in the binary payloads which are
+        sent to a client along with the resource.
+
+    """
+    frames = []
+    resource.snapshot(frames)
+    return sum(len(frame) for frame in frames)
+
+
+class CacheReply(object):
+    """ A reply object which delivers a loaded resource to a cache.
+
+    Instances of this class are given to the resource providers in
+    place of the url reply of the originating request when the loaded
+    resource is stored in a `ResourceCache`.
+
+    """
+    __slots__ = ('_cache', '_key')
+
+    def __init__(self, cache, key):
+        """ Initialize a CacheReply.
+
+        Parameters
+        ----------
+        cache : ResourceCache
+            The cache which will receive the loaded resource.
+
+        key : tuple
+            The cache key for the loaded resource.
+
+        """
+        self._cache = cache
+        self._key = key
+
+    def __call__(self, resource):
+        """ Deliver the loaded resource to the cache.
+
+        Parameters
+        ----------
+        resource : Resource
+            The loaded resource object, or None if the resource failed
+            to load.
+
+        """
+        self._cache._on_loaded(self._key, resource)
+
+
+class DeferredReply(object):
+    """ A reply object which delivers a loaded resource on the main
+    event loop thread.
+
+    Instances of this class are given to the resource providers in
+    place of the url reply of the originating request when the
+    providers are invoked on a worker pool and the loaded resource is
+    not stored in a `ResourceCache`.
+
+    """
+    __slots__ = ('_reply',)
+
+    def __init__(self, reply):
+        """ Initialize a DeferredReply.
+
+        Parameters
+        ----------
+        reply : URLReply
+            The url reply of the originating request.
+
+        """
+        self._reply = reply
+
+    def __call__(self, resource):
+        """ Deliver the loaded resource to the url reply.
+
+        Parameters
+        ----------
+        resource : Resource
+            The loaded resource object, or None if the resource failed
+            to load.
+
+        """
+        deferred_call(self._reply, resource)
+
+
+class ResourceCache(object):
+    """ A thread-safe, size-bounded cache of loaded resources.
+
+    A resource cache is keyed on the url and the loading metadata of a
+    resource. Requests for a resource which is already being loaded are
+    coalesced with the in-flight request, so the provider is invoked
+    only once. All replies are invoked on the main event loop thread
+    via `deferred_call`.
+
+    An in-flight request which has not been answered within the pending
+    timeout is considered lost, and the next request for the resource
+    invokes the provider again. The replies which were waiting on the
+    lost request are answered by whichever load completes first.
+
+    """
+    #: The default maximum number of cached resources.
+    default_max_entries = 256
+
+    #: The default maximum size in bytes of the cached resources.
+    default_max_bytes = 64 * 1024 * 1024
+
+    #: The default number of seconds after which an in-flight request
+    #: is considered lost.
+    default_pending_timeout = 30.0
+
+    def __init__(self, max_entries=None, max_bytes=None,
+                 pending_timeout=None):
+        """ Initialize a ResourceCache.
+
+        Parameters
+        ----------
+        max_entries : int, optional
+            The maximum number of resources to cache. If not given,
+            `default_max_entries` is used.
+
+        max_bytes : int, optional
+            The maximum total size in bytes of the binary payloads of
+            the cached resources. If not given, `default_max_bytes` is
+            used.
+
+        pending_timeout : float, optional
+            The number of seconds after which an in-flight request is
+            considered lost. If not given, `default_pending_timeout` is
+            used.
+
+        """
+        if max_entries is None:
+            max_entries = self.default_max_entries
+        if max_bytes is None:
+            max_bytes = self.default_max_bytes
+        if pending_timeout is None:
+            pending_timeout = self.default_pending_timeout
+        self._resources = LRUCache(max_entries, max_bytes, resource_nbytes)
+        self._pending_timeout = pending_timeout
+        self._pending = {}
+        self._lock = Lock()
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _on_loaded(self, key, resource):
+        """ Handle the loading of a resource by a provider.
+
+        This method is invoked by a `CacheReply` and may be called from
+        any thread.
+
+        """
+        with self._lock:
+            entry = self._pending.pop(key, None)
+            replies = entry[1] if entry is not None else ()
+            if resource is not None:
+                self._resources.set(key, resource)
+        for reply in replies:
+            deferred_call(reply, resource)
+
+    #--------------------------------------------------------------------------
+    # Public API
+    #--------------------------------------------------------------------------
+    def request(self, key, reply):
+        """ Request a resource from the cache.
+
+        Parameters
+        ----------
+        key : tuple
+            The cache key for the resource.
+
+        reply : callable
+            The reply to invoke with the resource once it is available.
+
+        Returns
+        -------
+        result : CacheReply or None
+            If the resource must be loaded by a provider, a reply to
+            which the loaded resource should be given. Otherwise, None
+            is returned and the given reply will be invoked with the
+            cached or in-flight resource.
+
+        """
+        with self._lock:
+            resource = self._resources.get(key)
+            if resource is None:
+                pending = self._pending
+                now = time()
+                entry = pending.get(key)
+                if entry is not None:
+                    entry[1].append(reply)
+                    if now - entry[0] < self._pending_timeout:
+                        return None
+                    # The in-flight request is lost. The provider is
+                    # invoked again on behalf of all of the waiters.
+                    entry[0] = now
+                    return CacheReply(self, key)
+                pending[key] = [now, [reply]]
+                return CacheReply(self, key)
+        deferred_call(reply, resource)
+
+    def stats(self):
+        """ Get the statistics for the resource cache.
+
+        Returns
+        -------
+        result : dict
+            A dict with the keys 'entries', 'bytes', 'hits', 'misses',
+            'evictions' and 'pending'.
+
+        """
+        with self._lock:
+            stats = self._resources.stats()
+            stats['pending'] = len(self._pending)
+        return stats
+
+    def clear(self):
+        """ Remove all of the cached resources.
+
+        Requests which are in-flight are not affected.
+
+        """
+        with self._lock:
+            self._resources.clear()
+
+
+#: The resource cache which is shared by the managers of all sessions.
+shared_resource_cache = ResourceCache()
+
+
 class ResourceManager(HasTraits):
     """ A class which manages resource loading for a `Session`.
 
@@ -33,6 +276,24 @@ class ResourceManager(HasTraits):
     #: A dict of icon providers for the `icon://...` scheme.
     icon_providers = Dict(Str, IconProvider)
 
+    #: The cache used to store loaded resources. By default, the cache
+    #: is shared by the resource managers of all sessions and is keyed
+    #: on the resource url, the provider object and the metadata. The
+    #: sessions which register the same provider object therefore share
+    #: its resources, and that provider must serve the same resource for
+    #: a given path in every session. Sessions which register their own
+    #: provider objects under the same location do not share resources.
+    #: A session can assign a private cache, or None to disable caching.
+    cache = Instance(ResourceCache)
+
+    #: An optional pool of worker threads used to invoke the providers
+    #: off of the main event loop thread. This can be any object with
+    #: an `apply_async(func, args)` method, such as an instance of
+    #: `multiprocessing.pool.ThreadPool`. The default is None and the
+    #: providers are invoked on the calling thread. When a pool is used,
+    #: the replies are still invoked on the main event loop thread.
+    worker_pool = Any
+
     def load(self, url, metadata, reply):
         """ Load a resource from the manager.
 
@@ -48,22 +309,94 @@ class ResourceManager(HasTraits):
 
         reply : URLReply
             A url reply which will be invoked with the loaded resource
-            object, or None if the loading fails. It must be safe to
-            invoke this reply from a thread.
+            object, or None if the loading fails.
 
         """
-        scheme = urlparse(url).scheme
+        spec = urlparse(url)
+        scheme = spec.scheme
         handler = getattr(self, '_load_' + scheme, None)
         if handler is None:
             msg = 'unhandled url resource scheme: `%s`'
             logger.error(msg % url)
             reply(None)
             return
-        handler(url, metadata, reply)
+        cache = self.cache
+        if cache is not None:
+            # The provider is part of the key so that sessions which
+            # register different providers under the same location do
+            # not receive each other's resources.
+            provider = getattr(self, scheme + '_providers').get(spec.netloc)
+            key_handler = getattr(self, '_make_%s_key' % scheme)
+            key = (url, provider, key_handler(metadata))
+            reply = cache.request(key, reply)
+            if reply is None:
+                return
+        pool = self.worker_pool
+        if pool is not None:
+            # A cache reply already delivers its resource on the main
+            # thread. Any other reply must be marshalled to it.
+            if cache is None:
+                reply = DeferredReply(reply)
+            args = (handler, url, metadata, reply)
+            pool.apply_async(self._run_handler, args)
+        else:
+            self._run_handler(handler, url, metadata, reply)
 
     #--------------------------------------------------------------------------
     # Private API
     #--------------------------------------------------------------------------
+    def _cache_default(self):
+        """ The default value for the 'cache' trait.
+
+        """
+        return shared_resource_cache
+
+    def _run_handler(self, handler, url, metadata, reply):
+        """ Run a load handler on the calling or a worker thread.
+
+        If the handler raises an exception, the exception is logged and
+        the reply is invoked with None so that the request is answered.
+
+        """
+        try:
+            handler(url, metadata, reply)
+        except Exception:
+            logger.exception('failed to load url resource: `%s`' % url)
+            reply(None)
+
+    def _make_image_key(self, metadata):
+        """ Make a cache key value for the image metadata.
+
+        Parameters
+        ----------
+        metadata : dict
+            The image metadata given to the `load` method.
+
+        Returns
+        -------
+        result : tuple
+            The size with which to load the image.
+
+        """
+        return tuple(metadata.get('size', (-1, -1)))
+
+    def _make_icon_key(self, metadata):
+        """ Make a cache key value for the icon metadata.
+
+        Parameters
+        ----------
+        metadata : dict
+            The icon metadata given to the `load` method, which is
+            ignored.
+
+        Returns
+        -------
+        result : None
+            This method always returns None.
+
+        """
+        return None
+
     def _load_image(self, url, metadata, reply):
         """ Load an image resource.
 
@@ -83,8 +416,7 @@ class ResourceManager(HasTraits):
 
         reply : URLReply
             A url reply which will be invoked with the loaded image
-            object, or None if the loading fails. It must be safe to
-            invoke this reply from a thread.
+            object, or None if the loading fails.
 
         """
         spec = urlparse(url)
@@ -114,8 +446,7 @@ class ResourceManager(HasTraits):
 
         reply : URLReply
             A url reply which will be invoked with the loaded icon
-            object, or None if the loading fails. It must be safe to
-            invoke this reply from a thread.
+            object, or None if the loading fails.
 
         """
         spec = urlparse(url)
@@ -2,13 +2,19 @@
 #  Copyright (c) 2012, Enthought, Inc.
 #  All rights reserved.
 #------------------------------------------------------------------------------
+from collections import OrderedDict
+from copy import deepcopy
 import logging
+from time import time
 
-from traits.api import HasTraits, Instance, List, Str, ReadOnly, Enum, Property
+from traits.api import (
+    HasTraits, Instance, List, Str, ReadOnly, Enum, Property, Bool, Set
+)
 
 from enaml.widgets.window import Window
 
 from .application import deferred_call
+from .message_instrumentation import message_instrumentation
 from .resource_manager import ResourceManager
 from .signaling import Signal
 from .socket_interface import ActionSocketInterface
@@ -103,6 +109,204 @@ class DeferredMessageBatch(object):
         self._tick += 1
 
 
+class CoalescingMessageBatch(object):
+    """ A class which aggregates attribute update messages.
+
+    Messages are keyed on their object id and action, and only the most
+    recent message for a given key is retained. The `triggered` signal
+    is fired on the next cycle of the event loop after the first message
+    is added to an empty batch.
+
+    """
+    #: A signal emitted when the owner of the batch should consume the
+    #: messages.
+    triggered = Signal()
+
+    def __init__(self):
+        """ Initialize a CoalescingMessageBatch.
+
+        """
+        self._messages = OrderedDict()
+        self._scheduled = False
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _trigger(self):
+        """ A private handler method which fires the `triggered` signal.
+
+        """
+        self._scheduled = False
+        if self._messages:
+            self.triggered.emit()
+
+    #--------------------------------------------------------------------------
+    # Public API
+    #--------------------------------------------------------------------------
+    def release(self):
+        """ Release the messages that were added to the batch.
+
+        Returns
+        -------
+        result : list
+            The list of (object_id, action, content) messages in the
+            order in which their latest version was added.
+
+        """
+        messages = self._messages
+        self._messages = OrderedDict()
+        return [key + (content,) for key, content in messages.iteritems()]
+
+    def add_message(self, object_id, action, content):
+        """ Add a message to the batch.
+
+        Any existing message with the same object id and action is
+        discarded in favor of the new message.
+
+        Parameters
+        ----------
+        object_id : str
+            The object id of the client object.
+
+        action : str
+            The action that should be performed by the object.
+
+        content : dict
+            The content dictionary for the action.
+
+        """
+        messages = self._messages
+        key = (object_id, action)
+        messages.pop(key, None)
+        messages[key] = content
+        if not self._scheduled:
+            self._scheduled = True
+            deferred_call(self._trigger)
+
+
+#: The types of the values which may be included in a snapshot template.
+_PLAIN_TYPES = (type(None), bool, int, long, float, str, unicode)
+
+
+def _is_plain(value):
+    """ Get whether a snapshot value is made of plain data only.
+
+    A plain value is a None, bool, number or string, or a list, tuple
+    or dict whose items are plain.
+
+    """
+    if isinstance(value, _PLAIN_TYPES):
+        return True
+    if isinstance(value, (list, tuple)):
+        return all(_is_plain(item) for item in value)
+    if isinstance(value, dict):
+        for key, item in value.iteritems():
+            if not (_is_plain(key) and _is_plain(item)):
+                return False
+        return True
+    return False
+
+
+class SnapshotTemplates(object):
+    """ A class which shares the repeated parts of the snapshots sent
+    to a client.
+
+    The first snapshot of a given class which is sent to the client is
+    sent in full, along with a template made from a copy of its plain
+    values. Later snapshots of the same class send only the values which
+    differ from the template, and the client expands them against the
+    template. Values which are not plain, such as the live objects of a
+    TraitsItem or an MPLCanvas, are never templated and are always sent
+    with the snapshot of their instance.
+
+    """
+    #: The snapshot keys which are specific to each instance and are
+    #: never included in a template.
+    instance_keys = frozenset([
+        'object_id', 'name', 'children', 'children_deferred',
+    ])
+
+    def __init__(self):
+        """ Initialize a SnapshotTemplates.
+
+        """
+        self._templates = {}
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _share(self, snap):
+        """ Share the values of a single snapshot dict with its template.
+
+        Returns
+        -------
+        result : dict
+            The snapshot dict to send to the client.
+
+        """
+        instance_keys = self.instance_keys
+        entry = self._templates.get(snap['class'])
+        if entry is None:
+            template_id = len(self._templates)
+            template = {}
+            result = {'template': template_id, 'template_def': template}
+            for key, value in snap.iteritems():
+                if key in instance_keys or not _is_plain(value):
+                    result[key] = value
+                else:
+                    # The values may be live trait containers which are
+                    # later changed in place, so the template holds a
+                    # copy of the values as they were sent.
+                    template[key] = deepcopy(value)
+            self._templates[snap['class']] = (template_id, template)
+            return result
+        template_id, template = entry
+        result = {'template': template_id}
+        shared = 0
+        for key, value in snap.iteritems():
+            if key in instance_keys:
+                result[key] = value
+            elif key in template:
+                shared += 1
+                if template[key] != value:
+                    result[key] = value
+            else:
+                result[key] = value
+        # A snapshot which lacks some of the template keys cannot be
+        # expanded from the template, and is sent in full.
+        if shared != len(template):
+            return snap
+        return result
+
+    #--------------------------------------------------------------------------
+    # Public API
+    #--------------------------------------------------------------------------
+    def share(self, snap):
+        """ Share the values of a snapshot tree with the templates.
+
+        The tree is processed in the order in which the client builds
+        it, so that each template is defined before it is used.
+
+        Parameters
+        ----------
+        snap : dict
+            The snapshot of an object tree.
+
+        Returns
+        -------
+        result : dict
+            The snapshot tree to send to the client.
+
+        """
+        result = self._share(snap)
+        children = snap.get('children')
+        if children:
+            if result is snap:
+                result = snap.copy()
+            result['children'] = [self.share(child) for child in children]
+        return result
+
+
 class URLReply(object):
     """ A reply object for sending a loaded resource to a client session.
 
@@ -144,8 +348,13 @@ class URLReply(object):
         if resource is None:
             reply['status'] = 'fail'
         else:
+            # The binary payloads of the resource are sent out-of-band
+            # in the 'frames' list, which a socket may transport as raw
+            # frames without serializing or copying them.
+            frames = []
             reply['status'] = 'ok'
-            reply['resource'] = resource.snapshot()
+            reply['resource'] = resource.snapshot(frames)
+            reply['frames'] = frames
         session = self._session
         session.send(session.session_id, 'url_reply', reply)
 
@@ -180,6 +389,21 @@ class Session(HasTraits):
     #: A resource manager used for loading resources for the session.
     resource_manager = Instance(ResourceManager, ())
 
+    #: Whether to coalesce the attribute update messages sent to the
+    #: client. When True, the `set_*` actions are held until the next
+    #: cycle of the event loop and only the latest message for a given
+    #: object and action is sent, as part of a single 'message_batch'.
+    #: The held messages are always sent before any other message, so
+    #: the relative ordering of the other messages is preserved. Any
+    #: held messages are sent when coalescing is turned off.
+    coalesce_updates = Bool(False)
+
+    #: The protocol features which are supported by the client. These
+    #: are announced by the client with a 'client_features' action.
+    #: Clients which do not announce any features are sent messages in
+    #: the original protocol format.
+    client_features = Set(Str)
+
     #: The socket used by this session for communication. This is
     #: provided by the Application when the session is activated.
     #: The value should not normally be manipulated by user code.
@@ -227,6 +451,19 @@ class Session(HasTraits):
         batch.triggered.connect(self._on_batch_triggered)
         return batch
 
+    #: The private coalescing message batch used for collapsing the
+    #: attribute update messages when `coalesce_updates` is True.
+    _updates = Instance(CoalescingMessageBatch)
+    def __updates_default(self):
+        updates = CoalescingMessageBatch()
+        updates.triggered.connect(self.flush_updates)
+        return updates
+
+    #: The templates used for sharing the repeated parts of the
+    #: snapshots sent to the client. These are only used if the client
+    #: supports the 'snapshot_templates' feature.
+    _templates = Instance(SnapshotTemplates, ())
+
     #--------------------------------------------------------------------------
     # Class API
     #--------------------------------------------------------------------------
@@ -264,8 +501,29 @@ class Session(HasTraits):
         message batch.
 
         """
-        content = {'batch': self._batch.release()}
-        self.send(self.session_id, 'message_batch', content)
+        self.flush_batch()
+
+    def _coalesce_updates_changed(self, coalesce):
+        """ The change handler for the 'coalesce_updates' attribute.
+
+        The updates which are held when coalescing is turned off are
+        sent immediately, so that they do not arrive after the updates
+        which are sent directly.
+
+        """
+        if not coalesce:
+            self.flush_updates()
+
+    def _class_name(self, object_id):
+        """ Get the class name of an object for the instrumentation.
+
+        """
+        if object_id == self.session_id:
+            return type(self).__name__
+        obj = self._registered_objects.get(object_id)
+        if obj is None:
+            return ''
+        return type(obj).__name__
 
     #--------------------------------------------------------------------------
     # Abstract API
@@ -368,7 +626,36 @@ class Session(HasTraits):
             this session.
 
         """
-        return [window.snapshot() for window in self.windows]
+        windows = self.windows
+        for window in windows:
+            window.update_deferred()
+        return self.share_snapshots(
+            [window.snapshot() for window in windows]
+        )
+
+    def share_snapshots(self, snapshots):
+        """ Prepare a list of snapshots for sending to the client.
+
+        If the client supports snapshot templates, the values which are
+        repeated between objects of the same class are shared through
+        templates, which the client expands when building the objects.
+        Otherwise, the snapshots are returned unchanged.
+
+        Parameters
+        ----------
+        snapshots : list
+            The list of snapshot trees to send to the client.
+
+        Returns
+        -------
+        result : list
+            The list of snapshot trees to send.
+
+        """
+        if 'snapshot_templates' not in self.client_features:
+            return snapshots
+        share = self._templates.share
+        return [share(snap) for snap in snapshots]
 
     def register(self, obj):
         """ Register an object with the session.
@@ -420,11 +707,55 @@ class Session(HasTraits):
 
         """
         if self.is_active:
+            if message_instrumentation.enabled and action != 'message_batch':
+                message_instrumentation.message_sent(
+                    'server', self._class_name(object_id), object_id, action,
+                    content,
+                )
             if action in BATCH_ACTIONS:
                 self._batch.add_message((object_id, action, content))
+            elif self.coalesce_updates:
+                if action.startswith('set_'):
+                    self._updates.add_message(object_id, action, content)
+                else:
+                    self.flush_updates()
+                    self.socket.send(object_id, action, content)
             else:
                 self.socket.send(object_id, action, content)
 
+    def flush_updates(self):
+        """ Send the coalesced attribute update messages to the client.
+
+        This method is called automatically on the next cycle of the
+        event loop after an update is coalesced, and before any other
+        message is sent. It will rarely need to be called by user code.
+
+        """
+        updates = self._updates.release()
+        if updates and self.is_active:
+            if message_instrumentation.enabled:
+                message_instrumentation.batch_sent(
+                    'server', 'coalesced', updates
+                )
+            content = {'batch': updates}
+            self.socket.send(self.session_id, 'message_batch', content)
+
+    def flush_batch(self):
+        """ Send the deferred batch messages to the client.
+
+        This method is called automatically once the event queue is
+        drained of the events which add to the batch. It can be called
+        directly when a message which is about to be sent must not
+        overtake the batched messages.
+
+        """
+        batch = self._batch.release()
+        if batch:
+            if message_instrumentation.enabled:
+                message_instrumentation.batch_sent('server', 'deferred', batch)
+            content = {'batch': batch}
+            self.send(self.session_id, 'message_batch', content)
+
     def on_message(self, object_id, action, content):
         """ Receive a message sent to an object owned by this session.
 
@@ -446,7 +777,7 @@ class Session(HasTraits):
         """
         if self.is_active:
             if object_id == self.session_id:
-                dispatch_action(self, action, content)
+                obj = self
             else:
                 try:
                     obj = self._registered_objects[object_id]
@@ -454,12 +785,31 @@ class Session(HasTraits):
                     msg = "Invalid object id sent to Session: %s:%s"
                     logger.warn(msg % (object_id, action))
                     return
-                else:
-                    obj.receive_action(action, content)
+            instrument = message_instrumentation.enabled
+            if instrument:
+                class_name = type(obj).__name__
+                message_instrumentation.message_received(
+                    'server', class_name, object_id, action, content
+                )
+                start = time()
+            if obj is self:
+                dispatch_action(self, action, content)
+            else:
+                obj.receive_action(action, content)
+            if instrument:
+                message_instrumentation.action_dispatched(
+                    'server', class_name, action, time() - start
+                )
 
     #--------------------------------------------------------------------------
     # Action Handlers
     #--------------------------------------------------------------------------
+    def on_action_client_features(self, content):
+        """ Handle the 'client_features' action from the client session.
+
+        """
+        self.client_features = set(content['features'])
+
     def on_action_url_request(self, content):
         """ Handle the 'url_request' action from the client session.
 
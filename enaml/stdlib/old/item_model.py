@@ -4,7 +4,7 @@
 #------------------------------------------------------------------------------
 from abc import ABCMeta, abstractmethod
 
-from .signaling import Signal
+from enaml.signaling import Signal
 
 
 #------------------------------------------------------------------------------
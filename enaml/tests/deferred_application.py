@@ -0,0 +1,47 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from enaml.application import Application
+
+
+class DeferredApplication(Application):
+    """ An application which queues deferred calls for the tests.
+
+    """
+    def __init__(self):
+        super(DeferredApplication, self).__init__([])
+        self.calls = []
+
+    def start_session(self, name):
+        raise NotImplementedError
+
+    def end_session(self, session_id):
+        raise NotImplementedError
+
+    def session(self, session_id):
+        return None
+
+    def sessions(self):
+        return []
+
+    def start(self):
+        raise NotImplementedError
+
+    def stop(self):
+        raise NotImplementedError
+
+    def deferred_call(self, callback, *args, **kwargs):
+        self.calls.append((callback, args, kwargs))
+
+    def timed_call(self, ms, callback, *args, **kwargs):
+        raise NotImplementedError
+
+    def is_main_thread(self):
+        return True
+
+    def process_calls(self):
+        calls = self.calls
+        self.calls = []
+        for callback, args, kwargs in calls:
+            callback(*args, **kwargs)
@@ -0,0 +1,102 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import unittest
+
+from .deferred_application import DeferredApplication
+
+
+class TestSchedule(unittest.TestCase):
+    """ Unit tests for the task scheduling of an Application.
+
+    """
+    def setUp(self):
+        self.app = DeferredApplication()
+        self.ran = []
+
+    def tearDown(self):
+        self.app.destroy()
+
+    def schedule(self, name, priority=0):
+        return self.app.schedule(self.ran.append, (name,), priority=priority)
+
+    def test_one_task_per_cycle(self):
+        """ Test that a single task is run per cycle by default.
+
+        """
+        app = self.app
+        for name in 'abc':
+            self.schedule(name)
+        self.assertEqual(len(app.calls), 1)
+        self.assertTrue(app.has_pending_tasks())
+        app.process_calls()
+        self.assertEqual(self.ran, ['a'])
+        app.process_calls()
+        app.process_calls()
+        self.assertEqual(self.ran, ['a', 'b', 'c'])
+        self.assertFalse(app.has_pending_tasks())
+        self.assertEqual(app.calls, [])
+
+    def test_time_slice(self):
+        """ Test that a time slice runs the tasks in priority order.
+
+        """
+        app = self.app
+        app.task_time_slice = 1000
+        self.schedule('low', priority=-1)
+        self.schedule('a')
+        self.schedule('high', priority=1)
+        self.schedule('b')
+        app.process_calls()
+        self.assertEqual(self.ran, ['high', 'a', 'b', 'low'])
+        self.assertEqual(app.calls, [])
+
+    def test_nested_schedule(self):
+        """ Test that tasks scheduled by a task run in the same slice.
+
+        """
+        app = self.app
+        app.task_time_slice = 1000
+        app.schedule(self.schedule, ('nested',))
+        app.process_calls()
+        self.assertEqual(self.ran, ['nested'])
+        self.assertEqual(app.calls, [])
+
+    def test_unschedule(self):
+        """ Test that an unscheduled task is not run.
+
+        """
+        app = self.app
+        task = self.schedule('a')
+        self.schedule('b')
+        task.unschedule()
+        app.task_time_slice = 1000
+        app.process_calls()
+        self.assertEqual(self.ran, ['b'])
+        self.assertFalse(task.pending())
+
+    def test_task_stats(self):
+        """ Test the statistics for the scheduled tasks.
+
+        """
+        app = self.app
+        for name in 'abcd':
+            self.schedule(name)
+        stats = app.task_stats()
+        self.assertEqual(stats['pending'], 4)
+        self.assertEqual(stats['max_pending'], 4)
+        app.process_calls()
+        app.task_time_slice = 1000
+        app.process_calls()
+        stats = app.task_stats()
+        self.assertEqual(stats['pending'], 0)
+        self.assertEqual(stats['executed'], 4)
+        self.assertEqual(stats['batches'], 2)
+        self.assertTrue(stats['max_latency'] >= stats['mean_latency'] >= 0)
+        app.reset_task_stats()
+        self.assertEqual(app.task_stats()['executed'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import unittest
+
+from enaml.benchmarks.startup import compare_results, run_benchmark
+from enaml.benchmarks.synthetic import make_source
+
+
+class TestStartupBenchmark(unittest.TestCase):
+    """ Unit tests for the session startup benchmark.
+
+    """
+    def test_make_source(self):
+        """ Test that the synthetic source holds the requested leaves.
+
+        """
+        source = make_source(10, 2)
+        leaves = ('Label:', 'Field:', 'PushButton:', 'CheckBox:')
+        count = sum(source.count(leaf) for leaf in leaves)
+        self.assertEqual(count, 10)
+
+    def test_run_benchmark(self):
+        """ Test a run of the server stages of the benchmark.
+
+        """
+        results = run_benchmark(size=8, depth=2, repeat=2, client=False)
+        stages = results['stages']
+        for name in ('parse', 'compile', 'instantiate', 'snapshot'):
+            self.assertEqual(len(stages[name]['times']), 2)
+            growth = stages[name]['rss_growth_kb']
+            self.assertTrue(growth is None or growth >= 0)
+        self.assertEqual(results['skipped']['build'], 'disabled')
+        rows = compare_results(results, results)
+        self.assertTrue(all(row[3] == 1.0 for row in rows if row[1] > 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
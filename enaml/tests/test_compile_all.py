@@ -0,0 +1,72 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import os
+import shutil
+import tempfile
+import unittest
+
+from enaml.compile_all import compile_trees
+from enaml.core.import_hooks import EnamlImporter, make_file_info
+
+
+class TestCompileAll(unittest.TestCase):
+    """ Unit tests for the ahead of time compilation of source trees.
+
+    """
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        os.mkdir(os.path.join(self.root, 'pkg'))
+        self.write('pkg/__init__.py', '')
+        for index in range(4):
+            self.write('pkg/mod_%d.enaml' % index, 'value = %d\n' % index)
+        self.write('top.enaml', 'value = "top"\n')
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def write(self, relpath, text):
+        path = os.path.join(self.root, relpath)
+        with open(path, 'w') as f:
+            f.write(text)
+        return path
+
+    def statuses(self, results):
+        return [status for src_path, status, error in results]
+
+    def test_compile(self):
+        """ Test that the caches are written and then skipped.
+
+        """
+        results = compile_trees([self.root], jobs=2)
+        self.assertEqual(self.statuses(results), ['compiled'] * 5)
+        path = os.path.join(self.root, 'top.enaml')
+        file_info = make_file_info(path)
+        importer = EnamlImporter(file_info)
+        mtime = int(os.stat(path).st_mtime)
+        code = importer._load_current_cache(file_info, mtime)
+        namespace = {}
+        exec code in namespace
+        self.assertEqual(namespace['value'], 'top')
+
+        results = compile_trees([self.root], jobs=1)
+        self.assertEqual(self.statuses(results), ['skipped'] * 5)
+        results = compile_trees([self.root], jobs=1, force=True)
+        self.assertEqual(self.statuses(results), ['compiled'] * 5)
+
+    def test_errors(self):
+        """ Test that errors are reported without stopping the batch.
+
+        """
+        bad = self.write('pkg/bad.enaml', 'enamldef (:\n')
+        results = compile_trees([self.root], jobs=1)
+        failed = [r for r in results if r[1] == 'failed']
+        self.assertEqual(len(failed), 1)
+        self.assertEqual(failed[0][0], bad)
+        self.assertTrue(failed[0][2])
+        self.assertEqual(self.statuses(results).count('compiled'), 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
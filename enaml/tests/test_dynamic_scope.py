@@ -0,0 +1,135 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import unittest
+
+from enaml.core.dynamic_scope import (
+    DynamicScope, Nonlocals, ScopeCache, DynamicAttributeError,
+    invalidate_scope_caches,
+)
+
+
+class Node(object):
+    """ A simple object tree node used as the owner of a scope.
+
+    """
+    def __init__(self, parent=None, **attrs):
+        self.parent = parent
+        self.__dict__.update(attrs)
+
+
+class Uninitialized(Node):
+    """ A node with an attribute which raises DynamicAttributeError.
+
+    """
+    @property
+    def pending(self):
+        raise DynamicAttributeError('pending')
+
+
+class Listener(object):
+    """ A scope listener which records the dynamic loads.
+
+    """
+    def __init__(self):
+        self.loads = []
+
+    def dynamic_load(self, obj, name, value):
+        self.loads.append((obj, name, value))
+
+
+class TestDynamicScope(unittest.TestCase):
+    """ Unit tests for the DynamicScope and Nonlocals lookups.
+
+    """
+    def setUp(self):
+        self.root = Uninitialized(None, a=1, b=2)
+        self.mid = Node(self.root, b=3)
+        self.leaf = Node(self.mid)
+
+    def test_precedence(self):
+        """ Test that overrides and identifiers precede the ancestors.
+
+        """
+        scope = DynamicScope(self.leaf, {'a': 10}, {'b': 20}, None)
+        self.assertEqual(scope['a'], 10)
+        self.assertEqual(scope['b'], 20)
+
+    def test_ancestor_lookup(self):
+        """ Test that the nearest ancestor resolves a name.
+
+        """
+        listener = Listener()
+        scope = DynamicScope(self.leaf, {}, {}, listener)
+        self.assertEqual(scope['b'], 3)
+        self.assertEqual(scope['a'], 1)
+        self.assertEqual(
+            listener.loads, [(self.mid, 'b', 3), (self.root, 'a', 1)]
+        )
+        self.assertRaises(KeyError, scope.__getitem__, 'missing')
+        self.assertTrue('a' in scope)
+        self.assertFalse('missing' in scope)
+        self.assertFalse(1 in scope)
+
+    def test_dynamic_attribute_error(self):
+        """ Test that a DynamicAttributeError escapes the lookup.
+
+        """
+        scope = DynamicScope(self.leaf, {}, {}, None, {})
+        self.assertRaises(DynamicAttributeError, scope.__getitem__, 'pending')
+
+    def test_cache_depths(self):
+        """ Test that the resolving ancestor depths are cached.
+
+        """
+        cache = {}
+        scope = DynamicScope(self.leaf, {}, {}, None, cache)
+        scope['a']
+        scope['b']
+        self.assertEqual(cache, {'a': 2, 'b': 1})
+
+    def test_stale_cache_entry(self):
+        """ Test that a stale cache entry falls back to a full lookup.
+
+        """
+        cache = {'b': 0, 'a': 5}
+        listener = Listener()
+        scope = DynamicScope(self.leaf, {}, {}, listener, cache)
+        self.assertEqual(scope['b'], 3)
+        self.assertEqual(scope['a'], 1)
+        self.assertEqual(cache, {'a': 2, 'b': 1})
+        self.assertEqual(len(listener.loads), 2)
+
+    def test_scope_cache_invalidation(self):
+        """ Test that a ScopeCache is emptied by a parent change.
+
+        """
+        cache = ScopeCache()
+        depths = cache.depths()
+        depths['a'] = 2
+        self.assertIs(cache.depths(), depths)
+        invalidate_scope_caches()
+        self.assertEqual(cache.depths(), {})
+
+    def test_nonlocals(self):
+        """ Test the lookup, offset and assignment of nonlocals.
+
+        """
+        cache = {}
+        nonlocals = Nonlocals(self.leaf, None, cache)
+        self.assertEqual(nonlocals.b, 3)
+        self.assertEqual(nonlocals(2).b, 2)
+        self.assertEqual(cache, {'b': 1})
+        nonlocals.b = 30
+        self.assertEqual(self.mid.b, 30)
+        self.assertRaises(ValueError, nonlocals, -1)
+        self.assertRaises(ValueError, nonlocals, 4)
+        with self.assertRaises(AttributeError):
+            nonlocals.missing
+        with self.assertRaises(AttributeError):
+            nonlocals.missing = 1
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from enaml.core.enaml_compiler import EnamlCompiler
+from enaml.core.expression_profiler import expression_profiler
+from enaml.core.parser import parse
+
+
+SOURCE = """
+from enaml.core.declarative import Declarative
+
+enamldef Main(Declarative):
+    attr a = 1
+    attr b << a + 1
+    attr c := a
+    attr d
+    a :: self.d = a
+"""
+
+
+def compile_source(source, filename):
+    """ Compile an Enaml source string and return its namespace.
+
+    """
+    ast = parse(source, filename)
+    code = EnamlCompiler.compile(ast, filename)
+    ns = {}
+    exec code in ns
+    return ns
+
+
+class TestExpressionProfiler(unittest.TestCase):
+    """ Unit tests for the per-binding expression profiler.
+
+    """
+    def setUp(self):
+        self.Main = compile_source(SOURCE, 'profiled.enaml')['Main']
+        expression_profiler.reset()
+        expression_profiler.enabled = True
+
+    def tearDown(self):
+        expression_profiler.enabled = False
+        expression_profiler.reset()
+
+    def rows(self):
+        return dict(
+            (row['operator'], row) for row in expression_profiler.snapshot()
+        )
+
+    def test_record(self):
+        """ Test that the bindings are recorded by location.
+
+        """
+        main = self.Main()
+        main.b
+        main.c
+        main.a = 2
+        main.c = 3
+        rows = self.rows()
+        self.assertEqual(sorted(rows), ['::', ':=', '<<', '=', '>>'])
+        self.assertEqual(rows['=']['location'], 'profiled.enaml:5')
+        self.assertEqual(rows['<<']['location'], 'profiled.enaml:6')
+        self.assertEqual(rows[':=']['location'], 'profiled.enaml:7')
+        self.assertEqual(rows['>>']['location'], 'profiled.enaml:7')
+        self.assertEqual(rows['=']['count'], 1)
+        self.assertEqual(rows['<<']['count'], 3)
+        self.assertEqual(rows['<<']['max_deps'], 1)
+        self.assertEqual(rows['=']['max_deps'], 0)
+        for row in rows.itervalues():
+            self.assertTrue(row['max'] <= row['cumulative'])
+
+    def test_disabled(self):
+        """ Test that nothing is recorded while disabled.
+
+        """
+        expression_profiler.enabled = False
+        main = self.Main()
+        main.b
+        self.assertEqual(expression_profiler.snapshot(), [])
+
+    def test_reset(self):
+        """ Test that the statistics can be reset.
+
+        """
+        self.Main().b
+        self.assertTrue(expression_profiler.snapshot())
+        expression_profiler.reset()
+        self.assertEqual(expression_profiler.snapshot(), [])
+
+    def test_format_table(self):
+        """ Test the text table of the statistics.
+
+        """
+        self.Main().b
+        table = expression_profiler.format_table(sort='location')
+        lines = table.splitlines()
+        self.assertEqual(lines[0].split()[0], 'count')
+        self.assertTrue(lines[1].endswith('profiled.enaml:5'))
+        self.assertRaises(ValueError, expression_profiler.format_table, 'x')
+
+    def test_dump_json(self):
+        """ Test dumping the statistics as JSON.
+
+        """
+        self.Main().b
+        tmpdir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmpdir, 'profile.json')
+            expression_profiler.dump(path, format='json')
+            with open(path) as f:
+                rows = json.load(f)
+        finally:
+            shutil.rmtree(tmpdir)
+        self.assertEqual(rows, json.loads(
+            json.dumps(expression_profiler.snapshot())
+        ))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,243 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import ast
+import unittest
+
+from traits.api import HasTraits, Instance, Str
+
+from enaml.core.enaml_compiler import EnamlCompiler, analyze_chain
+from enaml.core.expressions import refresh_scheduler
+from enaml.core.parser import parse
+
+from .deferred_application import DeferredApplication
+
+
+def compile_source(source):
+    """ Compile an Enaml source string and return its namespace.
+
+    """
+    ast = parse(source, 'test_expressions')
+    code = EnamlCompiler.compile(ast, 'test_expressions')
+    ns = {}
+    exec code in ns
+    return ns
+
+
+class Model(HasTraits):
+    """ A simple model used as an expression dependency.
+
+    """
+    name = Str
+
+
+def count_handlers(obj, name):
+    """ Count the trait change handlers attached to an object trait.
+
+    """
+    trait = obj._trait(name, 0)
+    if trait is None:
+        return 0
+    notifiers = trait._notifiers(0)
+    return len(notifiers) if notifiers is not None else 0
+
+
+SUBSCRIPTION_SOURCE = """
+from enaml.core.declarative import Declarative
+
+enamldef Main(Declarative):
+    attr items
+    attr index = 0
+    attr value << items[index].name
+"""
+
+
+class TestSubscriptionExpression(unittest.TestCase):
+    """ Unit tests for the `<<` subscription expression.
+
+    """
+    def setUp(self):
+        self.Main = compile_source(SUBSCRIPTION_SOURCE)['Main']
+
+    def test_stale_handlers_removed(self):
+        """ Test that handlers are removed from stale dependencies.
+
+        """
+        models = [Model(name='a'), Model(name='b')]
+        main = self.Main(items=models)
+        self.assertEqual(main.value, 'a')
+        self.assertEqual(count_handlers(models[0], 'name'), 1)
+        for index in (1, 0, 1, 0, 1):
+            main.index = index
+        self.assertEqual(main.value, 'b')
+        self.assertEqual(count_handlers(models[0], 'name'), 0)
+        self.assertEqual(count_handlers(models[1], 'name'), 1)
+
+    def test_live_handlers_kept(self):
+        """ Test that handlers on unchanged dependencies are not rebound.
+
+        """
+        models = [Model(name='a'), Model(name='b')]
+        main = self.Main(items=models)
+        self.assertEqual(main.value, 'a')
+        before = list(main._trait('items', 0)._notifiers(0))
+        main.index = 1
+        after = list(main._trait('items', 0)._notifiers(0))
+        self.assertEqual(len(before), len(after))
+        self.assertTrue(all(a is b for a, b in zip(before, after)))
+
+    def test_notification(self):
+        """ Test that the live dependencies still notify.
+
+        """
+        models = [Model(name='a'), Model(name='b')]
+        main = self.Main(items=models)
+        main.index = 1
+        models[0].name = 'c'
+        models[1].name = 'd'
+        self.assertEqual(main.value, 'd')
+        main.index = 0
+        self.assertEqual(main.value, 'c')
+
+
+class Holder(HasTraits):
+    """ A model which holds another model.
+
+    """
+    model = Instance(Model)
+
+
+CHAIN_SOURCE = """
+from enaml.core.declarative import Declarative
+
+enamldef Main(Declarative):
+    attr holder
+    attr value << holder.model.name
+    attr upper << holder.model.name.upper()
+"""
+
+
+class TestAttributeChain(unittest.TestCase):
+    """ Unit tests for the untraced evaluation of attribute chains.
+
+    """
+    def setUp(self):
+        self.Main = compile_source(CHAIN_SOURCE)['Main']
+
+    def test_analyze_chain(self):
+        """ Test the static analysis of expression asts.
+
+        """
+        def chain(source):
+            return analyze_chain(ast.parse(source, mode='eval'))
+        self.assertEqual(chain('a.b.c'), ('a', 'b', 'c'))
+        self.assertEqual(chain('a'), ('a',))
+        self.assertIsNone(chain('a.b()'))
+        self.assertIsNone(chain('a[0].b'))
+        self.assertIsNone(chain('None'))
+
+    def test_chain_attribute(self):
+        """ Test that only attribute chains are compiled as chains.
+
+        """
+        main = self.Main()
+        self.assertEqual(
+            main._expressions['value']._chain, ('holder', 'model', 'name')
+        )
+        self.assertIsNone(main._expressions['upper']._chain)
+
+    def test_chain_notification(self):
+        """ Test that a chain is refreshed when any link changes.
+
+        """
+        first = Model(name='a')
+        holder = Holder(model=first)
+        main = self.Main(holder=holder)
+        self.assertEqual(main.value, 'a')
+        first.name = 'b'
+        self.assertEqual(main.value, 'b')
+        second = Model(name='c')
+        holder.model = second
+        self.assertEqual(main.value, 'c')
+        self.assertEqual(count_handlers(first, 'name'), 0)
+        self.assertEqual(count_handlers(second, 'name'), 1)
+        first.name = 'd'
+        self.assertEqual(main.value, 'c')
+
+    def test_unchanged_chain_kept(self):
+        """ Test that the handlers are kept if the chain is unchanged.
+
+        """
+        model = Model(name='a')
+        main = self.Main(holder=Holder(model=model))
+        self.assertEqual(main.value, 'a')
+        notifier = main._expressions['value']._notifier
+        items = notifier.items
+        model.name = 'b'
+        self.assertEqual(main.value, 'b')
+        self.assertIs(notifier.items, items)
+
+
+SCHEDULER_SOURCE = """
+from enaml.core.declarative import Declarative
+
+evaluated = []
+
+def record(name, value):
+    evaluated.append(name)
+    return value
+
+enamldef Main(Declarative):
+    attr a = 0
+    attr b = 0
+    attr double << record('double', total * 2 + a)
+    attr total << record('total', a + b)
+"""
+
+
+class TestRefreshScheduler(unittest.TestCase):
+    """ Unit tests for the deferred refreshing of `<<` expressions.
+
+    """
+    def setUp(self):
+        self.ns = compile_source(SCHEDULER_SOURCE)
+        self.app = DeferredApplication()
+        refresh_scheduler.enabled = True
+
+    def tearDown(self):
+        refresh_scheduler.enabled = False
+        self.app.destroy()
+
+    def test_batched_refresh(self):
+        """ Test that a burst of changes refreshes each expression once.
+
+        """
+        main = self.ns['Main']()
+        self.assertEqual(main.double, 0)
+        evaluated = self.ns['evaluated']
+        del evaluated[:]
+        for value in range(10):
+            main.a = value
+            main.b = value
+        self.assertEqual(evaluated, [])
+        self.assertEqual(main.total, 0)
+        self.app.process_calls()
+        self.assertEqual(main.total, 18)
+        self.assertEqual(main.double, 45)
+        self.assertEqual(evaluated, ['total', 'double'])
+
+    def test_disabled(self):
+        """ Test that expressions are refreshed immediately by default.
+
+        """
+        refresh_scheduler.enabled = False
+        main = self.ns['Main']()
+        self.assertEqual(main.double, 0)
+        main.a = 1
+        self.assertEqual(main.total, 1)
+        self.assertEqual(main.double, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,10 +2,17 @@
 #  Copyright (c) 2011, Enthought, Inc.
 #  All rights reserved.
 #------------------------------------------------------------------------------
+import os
+import shutil
 import sys
+import tempfile
 import unittest
 
+from enaml.bundler import build_bundle
 from enaml.core import import_hooks
+from enaml.core.import_hooks import (
+    DirectoryCache, EnamlBundleImporter, imports
+)
 
 
 class FakeSys(object):
@@ -49,3 +56,87 @@ class TestImportHooks(unittest.TestCase):
         self.assertEquals(counts[importer], 0)
         self.assertEquals(len(meta_path), 0)
 
+
+class TestImporters(unittest.TestCase):
+    """ Unit tests for the directory cache and the bundle importer.
+
+    """
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.src = os.path.join(self.root, 'src')
+        os.mkdir(self.src)
+        os.mkdir(os.path.join(self.src, 'hooks_pkg'))
+        self.write('hooks_pkg/__init__.py', '')
+        self.write('hooks_pkg/hooks_leaf.enaml', 'value = "leaf"\n')
+        self.write('hooks_top.enaml', 'value = "top"\n')
+
+    def tearDown(self):
+        for name in ('hooks_pkg', 'hooks_pkg.hooks_leaf', 'hooks_top'):
+            sys.modules.pop(name, None)
+        if self.src in sys.path:
+            sys.path.remove(self.src)
+        shutil.rmtree(self.root)
+        DirectoryCache.clear()
+
+    def write(self, relpath, text):
+        with open(os.path.join(self.src, relpath), 'w') as f:
+            f.write(text)
+
+    def test_directory_cache(self):
+        """ Test that a listing is refreshed when its directory changes.
+
+        """
+        names = DirectoryCache.entries(self.src)
+        self.assertTrue('hooks_top.enaml' in names)
+        self.assertTrue(DirectoryCache.entries(self.src) is names)
+        os.mkdir(os.path.join(self.src, 'extra'))
+        os.utime(self.src, (0, 0))
+        self.assertTrue('extra' in DirectoryCache.entries(self.src))
+        missing = os.path.join(self.root, 'missing')
+        self.assertEqual(DirectoryCache.entries(missing), frozenset())
+
+    def test_source_import(self):
+        """ Test that the default importer finds modules by listing.
+
+        """
+        sys.path.insert(0, self.src)
+        with imports():
+            import hooks_top
+            from hooks_pkg import hooks_leaf
+        self.assertEqual(hooks_top.value, 'top')
+        self.assertEqual(hooks_leaf.value, 'leaf')
+
+    def test_bundle_import(self):
+        """ Test that modules are imported from a bundle.
+
+        """
+        bundle = os.path.join(self.root, 'app.enamlb')
+        names = build_bundle(bundle, [self.src])
+        self.assertEqual(names, ['hooks_pkg.hooks_leaf', 'hooks_top'])
+
+        # The sources are removed so that only the bundle can be used.
+        os.remove(os.path.join(self.src, 'hooks_top.enaml'))
+        os.remove(os.path.join(self.src, 'hooks_pkg', 'hooks_leaf.enaml'))
+        sys.path.insert(0, self.src)
+        EnamlBundleImporter.add_bundle(bundle)
+        imports.add_importer(EnamlBundleImporter)
+        try:
+            with imports():
+                import hooks_top
+                from hooks_pkg import hooks_leaf
+        finally:
+            imports.remove_importer(EnamlBundleImporter)
+            EnamlBundleImporter.remove_bundle(bundle)
+        self.assertEqual(hooks_top.value, 'top')
+        self.assertEqual(hooks_leaf.value, 'leaf')
+        expected = os.path.join(self.src, 'hooks_top.enaml')
+        self.assertEqual(hooks_top.__file__, expected)
+
+    def test_invalid_bundle(self):
+        """ Test that an invalid bundle is rejected.
+
+        """
+        bundle = os.path.join(self.root, 'bad.enamlb')
+        with open(bundle, 'wb') as f:
+            f.write('not a bundle')
+        self.assertRaises(ImportError, EnamlBundleImporter.add_bundle, bundle)
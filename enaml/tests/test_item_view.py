@@ -0,0 +1,174 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import unittest
+
+from enaml.stdlib.old.item_model import AbstractTableModel
+from enaml.widgets.table_view import TableView
+
+from .deferred_application import DeferredApplication
+from .test_session import EmptySession, RecordingSocket
+
+
+class GridModel(AbstractTableModel):
+    """ A table model whose items are computed from their position.
+
+    Rows are added in pages of 100 when more rows are fetched.
+
+    """
+    def __init__(self, rows, columns, total=None):
+        self.rows = rows
+        self.columns = columns
+        self.total = rows if total is None else total
+        self.reads = 0
+
+    def row_count(self, parent=None):
+        return self.rows
+
+    def column_count(self, parent=None):
+        return self.columns
+
+    def data(self, index):
+        self.reads += 1
+        return '%d,%d' % (index.row, index.column)
+
+    def horizontal_header_data(self, section):
+        return 'C%d' % section
+
+    def vertical_header_data(self, section):
+        return section
+
+    def can_fetch_more(self, parent=None):
+        return self.rows < self.total
+
+    def fetch_more(self, parent=None):
+        first = self.rows
+        last = min(first + 100, self.total) - 1
+        self.begin_insert_rows(None, first, last)
+        self.rows = last + 1
+        self.end_insert_rows(None, first, last)
+
+
+class TestTableView(unittest.TestCase):
+    """ Unit tests for the paged fetching of the TableView.
+
+    """
+    def setUp(self):
+        self.app = DeferredApplication()
+        self.socket = RecordingSocket()
+        self.session = EmptySession()
+        self.session.open('s_1')
+        self.session.activate(self.socket)
+
+    def tearDown(self):
+        self.app.destroy()
+
+    def create_view(self, model):
+        view = TableView(item_model=model)
+        view.initialize()
+        view.activate(self.session)
+        return view
+
+    def sent_actions(self):
+        self.app.process_calls()
+        actions = [(action, content) for _, action, content in
+                   self.socket.sent]
+        self.socket.sent = []
+        return actions
+
+    def test_snapshot(self):
+        """ Test that the snapshot holds the shape but not the items.
+
+        """
+        model = GridModel(100000, 20)
+        view = TableView(item_model=model)
+        snap = view.snapshot()
+        self.assertEqual(snap['row_count'], 100000)
+        self.assertEqual(snap['column_count'], 20)
+        self.assertFalse('data' in snap)
+        self.assertEqual(model.reads, 0)
+
+    def test_request_items(self):
+        """ Test that only the requested window of items is read.
+
+        """
+        model = GridModel(100000, 20)
+        view = self.create_view(model)
+        view.receive_action('request_items', {
+            'rows': [5000, 5009], 'columns': [18, 30],
+        })
+        self.assertEqual(model.reads, 20)
+        [(action, content)] = self.sent_actions()
+        self.assertEqual(action, 'items')
+        self.assertEqual(content['row'], 5000)
+        self.assertEqual(content['column'], 18)
+        self.assertEqual(len(content['data']), 10)
+        self.assertEqual(content['data'][0], ['5000,18', '5000,19'])
+        self.assertEqual(content['horizontal_headers'], ['C18', 'C19'])
+        self.assertEqual(content['vertical_headers'][-1], 5009)
+
+    def test_data_changed(self):
+        """ Test that only changes within the window are sent.
+
+        """
+        model = GridModel(1000, 10)
+        view = self.create_view(model)
+        view.receive_action('request_items', {
+            'rows': [0, 49], 'columns': [0, 9],
+        })
+        self.sent_actions()
+        model.notify_data_changed(model.index(100, 0), model.index(200, 9))
+        self.assertEqual(self.sent_actions(), [])
+
+        model.notify_data_changed(model.index(40, 2), model.index(60, 3))
+        [(action, content)] = self.sent_actions()
+        self.assertEqual(action, 'data_changed')
+        self.assertEqual((content['row'], content['column']), (40, 2))
+        self.assertEqual(len(content['data']), 10)
+        self.assertEqual(len(content['data'][0]), 2)
+
+        model.notify_horizontal_header_data_changed(8, 20)
+        [(action, content)] = self.sent_actions()
+        self.assertEqual(action, 'headers_changed')
+        self.assertEqual(content['first'], 8)
+        self.assertEqual(content['data'], ['C8', 'C9'])
+
+    def test_fetch_more(self):
+        """ Test that requesting the last rows fetches more rows.
+
+        """
+        model = GridModel(100, 5, total=250)
+        view = self.create_view(model)
+        view.receive_action('request_items', {
+            'rows': [90, 120], 'columns': [0, 4],
+        })
+        self.assertEqual(model.rows, 200)
+        actions = self.sent_actions()
+        self.assertEqual([action for action, _ in actions],
+                         ['items', 'model_reset'])
+        self.assertEqual(len(actions[0][1]['data']), 10)
+        self.assertEqual(actions[1][1]['row_count'], 200)
+
+        # The window was discarded by the reset.
+        model.notify_data_changed(model.index(95, 0), model.index(95, 0))
+        self.assertEqual(self.sent_actions(), [])
+
+    def test_replace_model(self):
+        """ Test that replacing the model disconnects the old model.
+
+        """
+        old = GridModel(10, 2)
+        view = self.create_view(old)
+        new = GridModel(5, 3)
+        view.item_model = new
+        [(action, content)] = self.sent_actions()
+        self.assertEqual(action, 'model_reset')
+        self.assertEqual(content['row_count'], 5)
+        old.begin_reset_model()
+        old.end_reset_model()
+        self.assertEqual(self.sent_actions(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from casuarius import ConstraintVariable
+
+from enaml.layout.layout_instrumentation import (
+    OPERATIONS, layout_instrumentation,
+)
+from enaml.layout.layout_manager import LayoutManager
+
+
+class TestLayoutInstrumentation(unittest.TestCase):
+    """ Unit tests for the layout instrumentation.
+
+    """
+    def setUp(self):
+        self.width = ConstraintVariable('width')
+        self.height = ConstraintVariable('height')
+        self.left = ConstraintVariable('left')
+        self.hard = [self.width >= 0, self.height >= 0]
+        layout_instrumentation.reset()
+        layout_instrumentation.enabled = True
+
+    def tearDown(self):
+        layout_instrumentation.enabled = False
+        layout_instrumentation.reset()
+
+    def exercise(self, owner):
+        """ Run every timed operation of a layout manager once.
+
+        """
+        width = self.width
+        height = self.height
+        manager = LayoutManager(owner)
+        manager.initialize(self.hard)
+        manager.replace_constraints([], [(self.left + width <= 100)])
+        manager.layout(lambda: None, width, height, (50, 50))
+        manager.get_min_size(width, height)
+        manager.get_max_size(width, height)
+        return manager
+
+    def test_record(self):
+        """ Test that the operations and system size are recorded.
+
+        """
+        self.exercise('QtContainer:c_1')
+        layout_instrumentation.record_relayout('QtContainer:c_1', 'relayout')
+        layout_instrumentation.record_resize_latency('QtContainer:c_1', 0.5)
+        [row] = layout_instrumentation.snapshot()
+        self.assertEqual(row['owner'], 'QtContainer:c_1')
+        self.assertEqual(row['constraints'], 3)
+        self.assertEqual(row['variables'], 3)
+        self.assertEqual(sorted(row['timings']), sorted(OPERATIONS))
+        for timing in row['timings'].itervalues():
+            self.assertEqual(timing['count'], 1)
+        self.assertEqual(row['relayouts'], {'relayout': 1})
+        self.assertEqual(row['resize_latency']['max'], 0.5)
+
+    def test_disabled(self):
+        """ Test that nothing is recorded while disabled.
+
+        """
+        layout_instrumentation.enabled = False
+        self.exercise('QtContainer:c_1')
+        self.assertEqual(layout_instrumentation.snapshot(), [])
+
+    def test_format_table(self):
+        """ Test the text table of the statistics.
+
+        """
+        self.exercise('QtContainer:c_2')
+        self.exercise('QtContainer:c_1')
+        lines = layout_instrumentation.format_table().splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertEqual(lines[0].split()[0], 'cns')
+        self.assertTrue(lines[1].endswith('QtContainer:c_1'))
+        self.assertEqual(lines[1].split()[:3], ['3', '3', '0'])
+
+    def test_dump_json(self):
+        """ Test dumping the statistics as JSON.
+
+        """
+        self.exercise('QtContainer:c_1')
+        tmpdir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmpdir, 'layout.json')
+            layout_instrumentation.dump(path, format='json')
+            with open(path) as f:
+                rows = json.load(f)
+        finally:
+            shutil.rmtree(tmpdir)
+        self.assertEqual(rows, json.loads(
+            json.dumps(layout_instrumentation.snapshot())
+        ))
+        self.assertRaises(
+            ValueError, layout_instrumentation.dump, path, format='xml'
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import unittest
+
+from casuarius import ConstraintVariable, weak
+
+from enaml.layout.layout_manager import LayoutManager
+
+
+class TestLayoutManager(unittest.TestCase):
+    """ Unit tests for the LayoutManager.
+
+    """
+    def setUp(self):
+        self.width = ConstraintVariable('width')
+        self.height = ConstraintVariable('height')
+        self.hard = [self.width >= 0, self.height >= 0]
+
+    def test_update_constraints(self):
+        """ Test that updating the constraints applies only the delta.
+
+        """
+        width = self.width
+        height = self.height
+        min_width = (width >= 100) | 'strong'
+        manager = LayoutManager()
+        manager.initialize(self.hard + [min_width])
+        self.assertEqual(manager.get_min_size(width, height), (100, 0))
+
+        min_height = (height >= 50) | 'strong'
+        manager.update_constraints(self.hard + [min_height])
+        self.assertEqual(manager.get_min_size(width, height), (0, 50))
+
+        # Updating with the same set of constraints is a no-op.
+        manager.update_constraints(self.hard + [min_height])
+        self.assertEqual(manager.get_min_size(width, height), (0, 50))
+
+    def test_update_after_replace(self):
+        """ Test that replaced constraints are tracked by the manager.
+
+        """
+        width = self.width
+        height = self.height
+        min_width = (width >= 100) | 'strong'
+        manager = LayoutManager()
+        manager.initialize(self.hard + [min_width])
+        manager.replace_constraints([min_width], [])
+        # The removed constraint must not be removed a second time.
+        manager.update_constraints(self.hard)
+        self.assertEqual(manager.get_min_size(width, height), (0, 0))
+
+    def test_size_cache(self):
+        """ Test that sizes are cached until the constraints change.
+
+        """
+        width = self.width
+        height = self.height
+        max_width = (width <= 300) | 'strong'
+        manager = LayoutManager()
+        manager.initialize(self.hard + [max_width])
+        min_size = manager.get_min_size(width, height)
+        max_size = manager.get_max_size(width, height)
+        self.assertEqual(max_size, (300, -1))
+        self.assertTrue(manager.get_min_size(width, height) is min_size)
+        self.assertTrue(manager.get_max_size(width, height) is max_size)
+
+        # The cache is keyed on the strength of the solve.
+        best_size = manager.get_min_size(width, height, weak)
+        self.assertTrue(best_size is not min_size)
+
+        min_width = (width >= 100) | 'strong'
+        manager.replace_constraints([], [min_width])
+        self.assertEqual(manager.get_min_size(width, height), (100, 0))
+        manager.update_constraints(self.hard + [min_width])
+        self.assertEqual(manager.get_max_size(width, height), (-1, -1))
+
+    def test_update_uninitialized(self):
+        """ Test that updating an uninitialized manager raises.
+
+        """
+        manager = LayoutManager()
+        self.assertRaises(RuntimeError, manager.update_constraints, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
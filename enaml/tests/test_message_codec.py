@@ -0,0 +1,113 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import unittest
+
+from enaml.message_codec import (
+    BinaryCodec, CodecRegistry, JSONCodec, _encode, _decode, _pack
+)
+
+
+class TestBinaryCodec(unittest.TestCase):
+    """ Unit tests for the BinaryCodec.
+
+    """
+    def setUp(self):
+        self.codec = BinaryCodec()
+
+    def roundtrip(self, obj):
+        codec = self.codec
+        return codec.decode(codec.encode(obj))
+
+    def test_scalars(self):
+        """ Test the round trip of scalar values.
+
+        """
+        values = [
+            None, True, False, 0, 1, 127, 128, -1, -32, -33, 2**40,
+            -2**40, 2**63 - 1, -2**63, 0.5, -1e300,
+        ]
+        for value in values:
+            result = self.roundtrip(value)
+            self.assertEqual(result, value)
+            for kind in (bool, float):
+                is_kind = isinstance(value, kind)
+                self.assertEqual(isinstance(result, kind), is_kind)
+
+    def test_strings(self):
+        """ Test that bytes and unicode strings keep their types.
+
+        """
+        image_data = ''.join(chr(i) for i in range(256)) * 300
+        for value in ['', 'set_value', image_data]:
+            result = self.roundtrip(value)
+            self.assertEqual(result, value)
+            self.assertTrue(isinstance(result, str))
+        for value in [u'', u'caf\xe9', u'x' * 40, u'y' * 70000]:
+            result = self.roundtrip(value)
+            self.assertEqual(result, value)
+            self.assertTrue(isinstance(result, unicode))
+
+    def test_containers(self):
+        """ Test the round trip of nested containers.
+
+        """
+        content = {
+            'order': ['o_%d' % i for i in range(20)],
+            'batch': [('o_1', 'set_value', {'value': 42})],
+            'layout': {'hug': ('strong', 'weak'), 'padding': (10,) * 4},
+        }
+        expected = {
+            'order': ['o_%d' % i for i in range(20)],
+            'batch': [['o_1', 'set_value', {'value': 42}]],
+            'layout': {'hug': ['strong', 'weak'], 'padding': [10] * 4},
+        }
+        self.assertEqual(self.roundtrip(content), expected)
+        big = dict(('k%d' % i, i) for i in range(70000))
+        self.assertEqual(self.roundtrip(big), big)
+
+    def test_pure_python_format(self):
+        """ Test the pure Python packer against the msgpack format.
+
+        """
+        chunks = []
+        _pack({'a': [1, u'b', 'c', None]}, chunks.append)
+        data = ''.join(chunks)
+        self.assertEqual(data, '\x81\xc4\x01a\x94\x01\xa1b\xc4\x01c\xc0')
+        self.assertEqual(_decode(_encode('x')), 'x')
+
+    def test_invalid(self):
+        """ Test that unserializable objects raise a TypeError.
+
+        """
+        self.assertRaises(TypeError, self.codec.encode, object())
+
+
+class TestCodecRegistry(unittest.TestCase):
+    """ Unit tests for the CodecRegistry.
+
+    """
+    def test_lookup(self):
+        """ Test the lookup of the default codecs.
+
+        """
+        self.assertTrue(isinstance(CodecRegistry.lookup('json'), JSONCodec))
+        binary = CodecRegistry.lookup('binary')
+        self.assertTrue(isinstance(binary, BinaryCodec))
+        self.assertTrue(CodecRegistry.lookup('bogus') is None)
+
+    def test_negotiate(self):
+        """ Test codec negotiation with a fallback to JSON.
+
+        """
+        codec = CodecRegistry.negotiate(['json', 'binary'])
+        self.assertEqual(codec.name, 'binary')
+        codec = CodecRegistry.negotiate(['json'])
+        self.assertEqual(codec.name, 'json')
+        codec = CodecRegistry.negotiate(['bogus'])
+        self.assertEqual(codec.name, 'json')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import os
+import shutil
+import tempfile
+import unittest
+
+from enaml.message_codec import CodecRegistry
+from enaml.message_instrumentation import (
+    MessageCounters, MessageLog, message_instrumentation,
+)
+
+from .deferred_application import DeferredApplication
+from .test_session import EmptySession, RecordingSocket
+
+
+class TestMessageInstrumentation(unittest.TestCase):
+    """ Unit tests for the instrumentation of the session messages.
+
+    """
+    def setUp(self):
+        self.app = DeferredApplication()
+        self.socket = RecordingSocket()
+        self.session = EmptySession(coalesce_updates=True)
+        self.session.open('s_1')
+        self.session.activate(self.socket)
+        self.counters = MessageCounters()
+        message_instrumentation.add_monitor(self.counters)
+
+    def tearDown(self):
+        message_instrumentation.remove_monitor(self.counters)
+        self.app.destroy()
+
+    def test_enabled(self):
+        """ Test that the hub is enabled only while it has monitors.
+
+        """
+        self.assertTrue(message_instrumentation.enabled)
+        message_instrumentation.remove_monitor(self.counters)
+        self.assertFalse(message_instrumentation.enabled)
+        self.session.send('o_1', 'append_text', {'text': 'a'})
+        self.assertEqual(self.counters.snapshot()['actions'], {})
+
+    def test_sent(self):
+        """ Test the counters of the sent messages and batches.
+
+        """
+        session = self.session
+        for value in range(3):
+            session.send('o_1', 'set_value', {'value': value})
+        self.app.process_calls()
+        session.send('s_1', 'append_text', {'text': 'abc'})
+        snap = self.counters.snapshot()
+        sent = snap['actions']['server']['sent']
+        self.assertEqual(sent['set_value']['count'], 3)
+        self.assertEqual(sent['append_text']['count'], 1)
+        self.assertTrue(sent['append_text']['bytes'] > 0)
+        self.assertFalse('message_batch' in sent)
+        classes = snap['classes']['server']['sent']
+        self.assertEqual(classes['']['count'], 3)
+        self.assertEqual(classes['EmptySession']['count'], 1)
+        coalesced = snap['batches']['server']['coalesced']
+        self.assertEqual(coalesced['count'], 1)
+        self.assertEqual(coalesced['max_size'], 1)
+
+    def test_received(self):
+        """ Test the counters of the received and dispatched messages.
+
+        """
+        content = {'features': ['snapshot_templates']}
+        self.session.on_message('s_1', 'client_features', content)
+        self.assertEqual(
+            self.session.client_features, set(['snapshot_templates'])
+        )
+        snap = self.counters.snapshot()
+        received = snap['actions']['server']['received']
+        self.assertEqual(received['client_features']['count'], 1)
+        dispatch = snap['dispatch']['server']['client_features']
+        self.assertEqual(dispatch['count'], 1)
+        self.assertTrue(dispatch['max'] >= 0.0)
+        self.counters.reset()
+        self.assertEqual(self.counters.snapshot()['dispatch'], {})
+
+    def test_log(self):
+        """ Test that the events are written to the rolling log file.
+
+        """
+        tmpdir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmpdir, 'messages.log')
+            log = MessageLog(path, codec='json')
+            message_instrumentation.add_monitor(log)
+            try:
+                self.session.send('o_1', 'append_text', {'text': 'a'})
+            finally:
+                message_instrumentation.remove_monitor(log)
+                log.close()
+            with open(path) as f:
+                lines = f.read().splitlines()
+        finally:
+            shutil.rmtree(tmpdir)
+        size = len(CodecRegistry.lookup('json').encode({'text': 'a'}))
+        self.assertEqual(len(lines), 1)
+        fields = lines[0].split('\t')
+        self.assertEqual(
+            fields[1:], ['server', 'sent', '', 'o_1', 'append_text', str(size)]
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
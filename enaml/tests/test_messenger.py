@@ -0,0 +1,303 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import random
+import unittest
+
+from traits.api import Int, Str
+
+from enaml.core.messenger import Messenger, SnapshotPlan, children_edits
+from enaml.widgets.container import Container
+from enaml.widgets.field import Field
+from enaml.widgets.notebook import Notebook
+from enaml.widgets.page import Page
+from enaml.widgets.slider import Slider
+from enaml.widgets.stack import Stack
+from enaml.widgets.stack_item import StackItem
+
+from .deferred_application import DeferredApplication
+from .test_session import EmptySession, RecordingSocket
+
+
+class Base(Messenger):
+    """ A messenger which declares snapshot attributes.
+
+    """
+    count = Int(1)
+
+    snapshot_attributes = ('count',)
+
+
+class Derived(Base):
+    """ A messenger which extends the snapshot attributes.
+
+    """
+    label = Str('foo')
+
+    snapshot_attributes = ('label', 'count')
+
+
+class TestSnapshotPlan(unittest.TestCase):
+    """ Unit tests for the snapshot plans of Messenger classes.
+
+    """
+    def test_attributes(self):
+        """ Test that the snapshot attributes are combined in MRO order.
+
+        """
+        plan = SnapshotPlan.lookup(Derived)
+        self.assertEqual(plan.attributes, ('count', 'label'))
+        self.assertTrue(SnapshotPlan.lookup(Derived) is plan)
+        snap = Derived(count=3).snapshot()
+        self.assertEqual(snap['count'], 3)
+        self.assertEqual(snap['label'], 'foo')
+        self.assertEqual(snap['class'], 'Derived')
+        self.assertEqual(snap['bases'][:2], ['Base', 'Messenger'])
+        self.assertEqual(snap['bases'][-1], 'Object')
+
+    def test_base_names(self):
+        """ Test that the base names are not shared with the plan or
+        between snapshots.
+
+        """
+        obj = Derived()
+        names = obj.base_names()
+        names.append('bogus')
+        self.assertNotEqual(obj.base_names(), names)
+        self.assertEqual(obj.base_names()[-1], 'Object')
+        first = obj.snapshot()
+        first['bases'].append('bogus')
+        self.assertEqual(obj.snapshot()['bases'][-1], 'Object')
+
+    def test_widget_snapshot(self):
+        """ Test the snapshot of a widget with inherited attributes.
+
+        """
+        snap = Slider(value=25).snapshot()
+        self.assertEqual(snap['value'], 25)
+        self.assertEqual(snap['maximum'], 100)
+        self.assertEqual(snap['enabled'], True)
+        self.assertTrue('layout' in snap)
+        self.assertEqual(snap['bases'][0], 'Control')
+
+
+class TestDeferredChildren(unittest.TestCase):
+    """ Unit tests for the lazy snapshots of Notebook and Stack.
+
+    """
+    def setUp(self):
+        self.app = DeferredApplication()
+        self.socket = RecordingSocket()
+        self.session = EmptySession()
+        self.session.open('s_1')
+        self.session.activate(self.socket)
+
+    def tearDown(self):
+        self.app.destroy()
+
+    def populate(self, parent, item_class):
+        fields = []
+        for ignored in range(3):
+            item = item_class(parent)
+            fields.append(Field(Container(item)))
+        parent.initialize()
+        return fields
+
+    def sent_actions(self):
+        self.app.process_calls()
+        actions = []
+        for object_id, action, content in self.socket.sent:
+            if action == 'message_batch':
+                actions.extend(content['batch'])
+            else:
+                actions.append((object_id, action, content))
+        return actions
+
+    def test_notebook(self):
+        """ Test that only the first visible page is snapshotted.
+
+        """
+        notebook = Notebook(lazy=True)
+        fields = self.populate(notebook, Page)
+        notebook.pages[0].visible = False
+        self.assertFalse(notebook.snapshot()['children'][0].get(
+            'children_deferred'
+        ))
+        notebook.update_deferred()
+        snap = notebook.snapshot()
+        deferred = [page.get('children_deferred') for page in snap['children']]
+        self.assertEqual(deferred, [True, None, True])
+        self.assertEqual(snap['children'][0]['children'], [])
+
+        notebook.activate(self.session)
+        states = [field.state for field in fields]
+        self.assertEqual(states, ['initialized', 'active', 'initialized'])
+
+        # Deferred objects do not message the client.
+        fields[2].text = u'changed'
+        self.assertEqual(self.sent_actions(), [])
+
+        page = notebook.pages[2]
+        page.receive_action('materialize_children', {})
+        self.assertEqual(fields[2].state, 'active')
+        actions = self.sent_actions()
+        self.assertEqual(len(actions), 1)
+        object_id, action, content = actions[0]
+        self.assertEqual(object_id, page.object_id)
+        self.assertEqual(action, 'children_changed')
+        field_snap = content['added'][0]['children'][0]
+        self.assertEqual(field_snap['text'], u'changed')
+
+        # A second request is a no-op.
+        page.receive_action('materialize_children', {})
+        self.assertEqual(self.sent_actions(), actions)
+
+    def test_stack(self):
+        """ Test that a stack sends deferred items on an index change.
+
+        """
+        stack = Stack(lazy=True, index=1)
+        fields = self.populate(stack, StackItem)
+        stack.update_deferred()
+        snap = stack.snapshot()
+        deferred = [item.get('children_deferred') for item in snap['children']]
+        self.assertEqual(deferred, [True, None, True])
+        stack.activate(self.session)
+        stack.index = 2
+        self.assertEqual(fields[2].state, 'active')
+        # The contents are sent before the client shows the item.
+        actions = [action for o, action, c in self.sent_actions()]
+        self.assertEqual(actions, ['children_changed', 'set_index'])
+
+    def test_not_lazy(self):
+        """ Test that a notebook is snapshotted in full by default.
+
+        """
+        notebook = Notebook()
+        self.populate(notebook, Page)
+        notebook.update_deferred()
+        snap = notebook.snapshot()
+        for page in snap['children']:
+            self.assertFalse('children_deferred' in page)
+            self.assertEqual(len(page['children']), 1)
+
+
+def apply_edits(order, edits):
+    """ Apply an edit script to a list of ids, as the client does.
+
+    """
+    order = list(order)
+    for edit in edits:
+        if edit[0] == 'remove':
+            del order[edit[1]:edit[1] + edit[2]]
+        elif edit[0] == 'move':
+            block = order[edit[1]:edit[1] + edit[2]]
+            del order[edit[1]:edit[1] + edit[2]]
+            order[edit[3]:edit[3]] = block
+        else:
+            order[edit[1]:edit[1]] = edit[2]
+    return order
+
+
+class TestChildrenEdits(unittest.TestCase):
+    """ Unit tests for the edit scripts of children_changed actions.
+
+    """
+    def setUp(self):
+        self.app = DeferredApplication()
+        self.socket = RecordingSocket()
+        self.session = EmptySession()
+        self.session.open('s_1')
+        self.session.activate(self.socket)
+
+    def tearDown(self):
+        self.app.destroy()
+
+    def children_changed(self):
+        while self.app.calls:
+            self.app.process_calls()
+        sent = []
+        for object_id, action, content in self.socket.sent:
+            if action == 'message_batch':
+                sent.extend(
+                    item[2] for item in content['batch']
+                    if item[1] == 'children_changed'
+                )
+        self.socket.sent = []
+        return sent
+
+    def test_common_edits(self):
+        """ Test the scripts for appending, removing and moving.
+
+        """
+        old = range(10)
+        self.assertEqual(children_edits(old, old + [10]),
+                         [['insert', 10, [10]]])
+        self.assertEqual(children_edits(old, old[:3] + old[6:]),
+                         [['remove', 3, 3]])
+        self.assertEqual(children_edits(old, old[1:] + old[:1]),
+                         [['move', 1, 9, 0]])
+        self.assertEqual(children_edits(old, old), [])
+
+    def test_random_edits(self):
+        """ Test that random edit scripts produce the new order.
+
+        """
+        rand = random.Random(42)
+        for ignored in range(200):
+            old = rand.sample(range(30), rand.randint(0, 20))
+            new = rand.sample(range(30), rand.randint(0, 20))
+            if rand.random() < 0.5:
+                new = [oid for oid in old if rand.random() < 0.8]
+                new.insert(rand.randint(0, len(new)), 100)
+            edits = children_edits(old, new)
+            self.assertEqual(apply_edits(old, edits), new)
+
+    def test_session_features(self):
+        """ Test that edits are only sent to clients which support them.
+
+        """
+        container = Container()
+        fields = [Field(container) for ignored in range(50)]
+        container.initialize()
+        container.activate(self.session)
+        order = [field.object_id for field in fields]
+
+        field = Field()
+        field.initialize()
+        container.insert_children(None, [field])
+        [content] = self.children_changed()
+        self.assertEqual(content['order'], order + [field.object_id])
+        self.assertFalse('edits' in content)
+
+        self.session.on_message(
+            's_1', 'client_features', {'features': ['children_edits']}
+        )
+        field = Field()
+        field.initialize()
+        container.insert_children(fields[0], [field])
+        [content] = self.children_changed()
+        self.assertFalse('order' in content)
+        self.assertEqual(content['size'], 51)
+        self.assertEqual(content['edits'],
+                         [['insert', 0, [field.object_id]]])
+        self.assertEqual(len(content['added']), 1)
+
+    def test_resync(self):
+        """ Test that a client can request the full order.
+
+        """
+        container = Container()
+        fields = [Field(container) for ignored in range(3)]
+        container.initialize()
+        container.activate(self.session)
+        container.receive_action('children_resync', {})
+        [content] = self.children_changed()
+        order = [field.object_id for field in fields]
+        self.assertEqual(content['order'], order)
+        self.assertEqual(content['added'], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
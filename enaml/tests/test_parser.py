@@ -0,0 +1,74 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import unittest
+
+from enaml.core import parser
+from enaml.core.lexer import EnamlLexer
+
+
+SOURCE = """\
+enamldef Main(Window):
+    Field:
+        text = 'a'
+        value := (1,
+                  2)[0]
+"""
+
+
+class TestLazyParser(unittest.TestCase):
+    """ Unit tests for the lazy creation of the parser and lexer.
+
+    """
+    def test_parser_is_reused(self):
+        """ Test that the parser is created once and reused.
+
+        """
+        parser.parse(SOURCE)
+        first = parser._parser
+        self.assertTrue(first is not None)
+        parser.parse(SOURCE)
+        self.assertTrue(parser._parser is first)
+
+    def test_parse_errors(self):
+        """ Test that errors are raised after a successful parse.
+
+        """
+        parser.parse(SOURCE)
+        with self.assertRaises(SyntaxError):
+            parser.parse('enamldef Main(Window)\n    pass\n')
+        parser.parse(SOURCE)
+
+    def test_lexer_clones(self):
+        """ Test that the lexers share a template but not their state.
+
+        """
+        first = EnamlLexer('first')
+        second = EnamlLexer('second')
+        self.assertTrue(first.lexer is not second.lexer)
+        self.assertEqual(first.lexer.filename, 'first')
+        self.assertEqual(second.lexer.filename, 'second')
+        first.input('a = (1,\n 2)\n')
+        second.input('b = 3\n')
+        self.assertEqual(second.token().value, 'b')
+        self.assertEqual(first.token().value, 'a')
+
+    def test_lexer_state_stack(self):
+        """ Test that a failed lex does not leak into the state stack
+        of the template or of other lexers.
+
+        """
+        first = EnamlLexer()
+        second = EnamlLexer()
+        self.assertTrue(first.lexer.lexstatestack is not
+                        second.lexer.lexstatestack)
+        with self.assertRaises(SyntaxError):
+            parser.parse('a = """unterminated\n')
+        self.assertEqual(EnamlLexer._template.lexstatestack, [])
+        self.assertEqual(first.lexer.lexstatestack, [])
+        parser.parse(SOURCE)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,237 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import unittest
+
+from enaml.message import (
+    create_message, deserialize_message, serialize_message
+)
+from enaml.message_codec import CodecRegistry
+from enaml.remote_application import RemoteApplication
+from enaml.request import BasePushHandler, BaseRequest
+from enaml.session import Session
+from enaml.session_factory import SessionFactory
+
+
+class LoopbackClient(BasePushHandler):
+    """ A push handler which records the messages pushed to a client.
+
+    Messages are round tripped through the wire format.
+
+    """
+    def __init__(self):
+        self.messages = []
+        self.closed = 0
+
+    def push_message(self, message):
+        wire = serialize_message(message, CodecRegistry.lookup('binary'))
+        message, codec = deserialize_message(wire)
+        self.messages.append(message)
+
+    def add_callback(self, callback):
+        raise NotImplementedError
+
+    def close(self):
+        self.closed += 1
+
+    def session_messages(self):
+        return [
+            msg.content for msg in self.messages
+            if msg.header['msg_type'] == 'session_message'
+        ]
+
+
+class LoopbackRequest(BaseRequest):
+    """ A request which delivers its reply to a LoopbackClient.
+
+    """
+    def __init__(self, client, msg_type, content):
+        self.client = client
+        self._message = create_message(msg_type, content)
+
+    @property
+    def message(self):
+        return self._message
+
+    def add_callback(self, callback):
+        raise NotImplementedError
+
+    def send_reply(self, message):
+        self.client.push_message(message)
+
+    def push_handler(self):
+        return self.client
+
+
+class PingSession(Session):
+    """ A session without windows which records 'ping' actions.
+
+    """
+    def on_open(self):
+        self.pings = []
+
+    def on_action_ping(self, content):
+        self.pings.append(content)
+
+
+class LoopbackApplication(RemoteApplication):
+    """ A RemoteApplication which queues deferred calls for the tests.
+
+    """
+    def __init__(self, factories):
+        super(LoopbackApplication, self).__init__(factories)
+        self.calls = []
+
+    def start(self):
+        raise NotImplementedError
+
+    def stop(self):
+        raise NotImplementedError
+
+    def deferred_call(self, callback, *args, **kwargs):
+        self.calls.append((callback, args, kwargs))
+
+    def timed_call(self, ms, callback, *args, **kwargs):
+        raise NotImplementedError
+
+    def is_main_thread(self):
+        return True
+
+    def process_calls(self):
+        calls = self.calls
+        self.calls = []
+        for callback, args, kwargs in calls:
+            callback(*args, **kwargs)
+
+
+class TestRemoteApplication(unittest.TestCase):
+    """ Unit tests for the RemoteApplication.
+
+    """
+    def setUp(self):
+        factory = SessionFactory('ping', 'A ping session', PingSession)
+        self.app = LoopbackApplication([factory])
+        self.app.max_pending = 4
+
+    def tearDown(self):
+        self.app.destroy()
+
+    def request(self, client, msg_type, **content):
+        self.app.handle_request(LoopbackRequest(client, msg_type, content))
+        return client.messages[-1] if client.messages else None
+
+    def start(self, client, window=2):
+        reply = self.request(client, 'start_session', name='ping',
+                             window=window)
+        self.assertEqual(reply.header['msg_type'], 'start_session_reply')
+        self.assertEqual(reply.content['status'], 'ok')
+        return reply.content['session_id']
+
+    def test_discover(self):
+        """ Test the discovery of the available sessions.
+
+        """
+        reply = self.request(LoopbackClient(), 'discover')
+        self.assertEqual(reply.header['msg_type'], 'discover_reply')
+        sessions = reply.content['sessions']
+        self.assertEqual([info['name'] for info in sessions], ['ping'])
+
+    def test_invalid_requests(self):
+        """ Test that invalid requests are answered with an error.
+
+        """
+        client = LoopbackClient()
+        reply = self.request(client, 'bogus')
+        self.assertEqual(reply.content['status'], 'error')
+        reply = self.request(client, 'start_session', name='bogus')
+        self.assertEqual(reply.content['status'], 'error')
+        self.assertEqual(self.app.sessions(), [])
+
+    def test_routing(self):
+        """ Test that messages are routed by session id.
+
+        """
+        first = LoopbackClient()
+        second = LoopbackClient()
+        first_id = self.start(first)
+        second_id = self.start(second)
+        self.assertNotEqual(first_id, second_id)
+        self.request(first, 'session_message', session_id=first_id,
+                     object_id=first_id, action='ping', content={'n': 1})
+        self.assertEqual(self.app.session(first_id).pings, [{'n': 1}])
+        self.assertEqual(self.app.session(second_id).pings, [])
+
+        self.app.session(second_id).send('o_1', 'set_value', {'value': 1})
+        self.assertEqual(first.session_messages(), [])
+        msg = second.session_messages()[0]
+        self.assertEqual(msg['session_id'], second_id)
+        self.assertEqual(msg['object_id'], 'o_1')
+        self.assertEqual(msg['content'], {'value': 1})
+
+    def test_frames(self):
+        """ Test that binary frames are carried outside the content.
+
+        """
+        client = LoopbackClient()
+        session_id = self.start(client)
+        data = '\x00\xff' * 100
+        content = {'id': 1, 'frames': [data]}
+        self.app.session(session_id).send(session_id, 'url_reply', content)
+        msg = client.session_messages()[0]
+        self.assertEqual(msg['frames'], [data])
+        self.assertEqual(msg['content'], {'id': 1})
+
+    def test_backpressure(self):
+        """ Test that messages wait for credits from the client.
+
+        """
+        client = LoopbackClient()
+        session_id = self.start(client, window=2)
+        session = self.app.session(session_id)
+        for value in range(5):
+            session.send('o_1', 'set_value', {'value': value})
+        sent = client.session_messages()
+        self.assertEqual([msg['content']['value'] for msg in sent], [0, 1])
+
+        self.request(client, 'session_ack', session_id=session_id, count=2)
+        sent = client.session_messages()
+        values = [msg['content']['value'] for msg in sent]
+        self.assertEqual(values, [0, 1, 2, 3])
+
+    def test_stalled_client(self):
+        """ Test that the session of a stalled client is ended.
+
+        """
+        client = LoopbackClient()
+        session_id = self.start(client, window=1)
+        session = self.app.session(session_id)
+        for value in range(6):
+            session.send('o_1', 'set_value', {'value': value})
+        self.assertTrue(self.app.session(session_id) is session)
+        self.app.process_calls()
+        self.assertTrue(self.app.session(session_id) is None)
+        self.assertEqual(session.state, 'closed')
+        last = client.messages[-1]
+        self.assertEqual(last.header['msg_type'], 'session_closed')
+        self.assertEqual(last.content['session_id'], session_id)
+        self.assertEqual(client.closed, 1)
+
+    def test_end_session(self):
+        """ Test that a client can end its session.
+
+        """
+        client = LoopbackClient()
+        session_id = self.start(client)
+        session = self.app.session(session_id)
+        reply = self.request(client, 'end_session', session_id=session_id)
+        self.assertEqual(reply.content['status'], 'ok')
+        self.assertEqual(session.state, 'closed')
+        self.assertEqual(self.app.sessions(), [])
+        msg_types = [msg.header['msg_type'] for msg in client.messages]
+        self.assertTrue('session_closed' in msg_types)
+        self.assertEqual(client.closed, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import unittest
+
+from enaml.icon_provider import Icon, IconImage
+from enaml.image_provider import Image
+
+
+class TestResourceFrames(unittest.TestCase):
+    """ Unit tests for the out-of-band frames of resource snapshots.
+
+    """
+    def test_inline_image(self):
+        """ Test that image data is inlined when no frames are given.
+
+        """
+        image = Image(data='\x89PNG')
+        self.assertEqual(image.snapshot()['data'], '\x89PNG')
+
+    def test_image_frames(self):
+        """ Test that image data is moved into the frames list.
+
+        """
+        frames = []
+        snap = Image(data='\x89PNG').snapshot(frames)
+        self.assertEqual(snap['data'], {'frame': 0})
+        self.assertEqual(frames, ['\x89PNG'])
+
+    def test_icon_frames(self):
+        """ Test that every image of an icon references its own frame.
+
+        """
+        images = [
+            IconImage(image=Image(data='a')),
+            IconImage(image=Image(data='b'), state='on'),
+        ]
+        frames = []
+        snap = Icon(images=images).snapshot(frames)
+        refs = [img['image']['data'] for img in snap['images']]
+        self.assertEqual(refs, [{'frame': 0}, {'frame': 1}])
+        self.assertEqual(frames, ['a', 'b'])
+
+
+if __name__ == '__main__':
+    unittest.main()
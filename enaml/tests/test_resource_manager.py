@@ -0,0 +1,194 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from multiprocessing.pool import ThreadPool
+from threading import Thread, current_thread
+import unittest
+
+from enaml.image_provider import Image, ImageProvider
+from enaml.resource_manager import ResourceCache, ResourceManager
+
+from .deferred_application import DeferredApplication
+
+
+class CountingProvider(ImageProvider):
+    """ An image provider which counts the requested images.
+
+    """
+    def __init__(self):
+        self.requests = []
+
+    def request_image(self, path, size, callback):
+        self.requests.append((path, size))
+        callback(Image(data=path))
+
+
+class SingleThreadPool(object):
+    """ A worker pool which runs each task to completion on a new
+    thread.
+
+    """
+    def apply_async(self, func, args):
+        thread = Thread(target=func, args=args)
+        thread.start()
+        thread.join()
+
+
+class TestResourceManager(unittest.TestCase):
+    """ Unit tests for the caching in the ResourceManager.
+
+    """
+    def setUp(self):
+        self.app = DeferredApplication()
+        self.provider = CountingProvider()
+        self.cache = ResourceCache()
+        self.results = []
+
+    def tearDown(self):
+        self.app.destroy()
+
+    def make_manager(self):
+        manager = ResourceManager(cache=self.cache)
+        manager.image_providers['test'] = self.provider
+        return manager
+
+    def test_shared_cache(self):
+        """ Test that managers sharing a cache load a resource once.
+
+        """
+        for ignored in range(3):
+            manager = self.make_manager()
+            manager.load('image://test/a.png', {}, self.results.append)
+            self.app.process_calls()
+        self.assertEqual(self.provider.requests, [('/a.png', (-1, -1))])
+        self.assertEqual([img.data for img in self.results], ['/a.png'] * 3)
+        stats = self.cache.stats()
+        self.assertEqual((stats['hits'], stats['misses']), (2, 1))
+
+    def test_provider_key(self):
+        """ Test that managers with different providers for the same
+        location do not share resources.
+
+        """
+        manager = self.make_manager()
+        manager.load('image://test/a.png', {}, self.results.append)
+        other = ResourceManager(cache=self.cache)
+        other_provider = CountingProvider()
+        other.image_providers['test'] = other_provider
+        other.load('image://test/a.png', {}, self.results.append)
+        self.app.process_calls()
+        self.assertEqual(len(self.provider.requests), 1)
+        self.assertEqual(len(other_provider.requests), 1)
+
+    def test_size_key(self):
+        """ Test that the image size is part of the cache key.
+
+        """
+        manager = self.make_manager()
+        manager.load('image://test/a.png', {}, self.results.append)
+        manager.load('image://test/a.png', {'size': [16, 16]}, id)
+        self.assertEqual(len(self.provider.requests), 2)
+
+    def test_coalescing(self):
+        """ Test that in-flight requests are coalesced.
+
+        """
+        class DeferredProvider(ImageProvider):
+            callbacks = []
+            def request_image(self, path, size, callback):
+                self.callbacks.append(callback)
+        provider = DeferredProvider()
+        manager = ResourceManager(cache=self.cache)
+        manager.image_providers['test'] = provider
+        for ignored in range(3):
+            manager.load('image://test/a.png', {}, self.results.append)
+        self.assertEqual(len(provider.callbacks), 1)
+        self.assertEqual(self.cache.stats()['pending'], 1)
+        provider.callbacks[0](Image(data='a'))
+        self.app.process_calls()
+        self.assertEqual(len(self.results), 3)
+        self.assertEqual(self.cache.stats()['pending'], 0)
+
+    def test_failure_not_cached(self):
+        """ Test that a failed load is delivered but not cached.
+
+        """
+        manager = ResourceManager(cache=self.cache)
+        manager.load('image://missing/a.png', {}, self.results.append)
+        self.app.process_calls()
+        self.assertEqual(self.results, [None])
+        self.assertEqual(self.cache.stats()['entries'], 0)
+
+    def test_raising_provider(self):
+        """ Test that a raising provider does not block the cache.
+
+        """
+        class RaisingProvider(ImageProvider):
+            def request_image(self, path, size, callback):
+                raise ValueError(path)
+        manager = ResourceManager(cache=self.cache)
+        manager.image_providers['test'] = RaisingProvider()
+        manager.load('image://test/a.png', {}, self.results.append)
+        self.app.process_calls()
+        self.assertEqual(self.results, [None])
+        self.assertEqual(self.cache.stats()['pending'], 0)
+        manager = self.make_manager()
+        manager.load('image://test/a.png', {}, self.results.append)
+        self.app.process_calls()
+        self.assertEqual(self.provider.requests, [('/a.png', (-1, -1))])
+        self.assertEqual(self.results[1].data, '/a.png')
+
+    def test_pending_timeout(self):
+        """ Test that a lost in-flight request is retried.
+
+        """
+        class StallingProvider(CountingProvider):
+            def request_image(self, path, size, callback):
+                # The first request is never answered.
+                if self.requests:
+                    callback(Image(data=path))
+                self.requests.append((path, size))
+        self.cache = ResourceCache(pending_timeout=0.0)
+        self.provider = StallingProvider()
+        manager = self.make_manager()
+        manager.load('image://test/a.png', {}, self.results.append)
+        manager.load('image://test/a.png', {}, self.results.append)
+        self.app.process_calls()
+        self.assertEqual([img.data for img in self.results], ['/a.png'] * 2)
+        self.assertEqual(self.cache.stats()['pending'], 0)
+
+    def test_worker_pool(self):
+        """ Test that providers are invoked on the worker pool.
+
+        """
+        pool = ThreadPool(2)
+        try:
+            manager = self.make_manager()
+            manager.worker_pool = pool
+            manager.load('image://test/a.png', {}, self.results.append)
+        finally:
+            pool.close()
+            pool.join()
+        self.app.process_calls()
+        self.assertEqual([img.data for img in self.results], ['/a.png'])
+
+    def test_worker_pool_uncached(self):
+        """ Test that the replies of uncached requests are invoked on
+        the main thread when the providers run on a worker pool.
+
+        """
+        threads = []
+        def reply(image):
+            threads.append(current_thread())
+        manager = ResourceManager(cache=None, worker_pool=SingleThreadPool())
+        manager.image_providers['test'] = self.provider
+        manager.load('image://test/a.png', {}, reply)
+        self.assertEqual(len(self.provider.requests), 1)
+        self.assertEqual(threads, [])
+        self.app.process_calls()
+        self.assertEqual(threads, [current_thread()])
+
+
+if __name__ == '__main__':
+    unittest.main()
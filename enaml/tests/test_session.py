@@ -0,0 +1,222 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import unittest
+
+from traits.api import HasTraits
+
+from enaml.session import Session, SnapshotTemplates
+from enaml.socket_interface import ActionSocketInterface
+from enaml.widgets.combo_box import ComboBox
+from enaml.widgets.container import Container
+from enaml.widgets.field import Field
+from enaml.widgets.traits_item import TraitsItem
+from enaml.widgets.window import Window
+
+from .deferred_application import DeferredApplication
+
+
+class RecordingSocket(ActionSocketInterface):
+    """ An action socket which records the sent messages.
+
+    """
+    def __init__(self):
+        self.sent = []
+
+    def on_message(self, callback):
+        pass
+
+    def send(self, object_id, action, content):
+        self.sent.append((object_id, action, content))
+
+
+class EmptySession(Session):
+    """ A session without any windows.
+
+    """
+    def on_open(self):
+        pass
+
+
+class TestCoalesceUpdates(unittest.TestCase):
+    """ Unit tests for the coalescing of update messages in a Session.
+
+    """
+    def setUp(self):
+        self.app = DeferredApplication()
+        self.socket = RecordingSocket()
+        self.session = EmptySession(coalesce_updates=True)
+        self.session.open('s_1')
+        self.session.activate(self.socket)
+
+    def tearDown(self):
+        self.app.destroy()
+
+    def test_latest_update(self):
+        """ Test that only the latest update per object is sent.
+
+        """
+        session = self.session
+        for value in range(100):
+            session.send('o_1', 'set_value', {'value': value})
+        session.send('o_2', 'set_value', {'value': -1})
+        self.assertEqual(self.socket.sent, [])
+        self.app.process_calls()
+        batch = [
+            ('o_1', 'set_value', {'value': 99}),
+            ('o_2', 'set_value', {'value': -1}),
+        ]
+        message = ('s_1', 'message_batch', {'batch': batch})
+        self.assertEqual(self.socket.sent, [message])
+
+    def test_ordering(self):
+        """ Test that updates are sent before subsequent messages.
+
+        """
+        session = self.session
+        session.send('o_1', 'set_value', {'value': 1})
+        session.send('o_1', 'destroy', {})
+        session.send('o_2', 'append_text', {'text': 'a'})
+        actions = [msg[1] for msg in self.socket.sent]
+        self.assertEqual(actions, ['message_batch', 'append_text'])
+        self.app.process_calls()
+        self.app.process_calls()
+        batch = self.socket.sent[-1][2]['batch']
+        self.assertEqual(batch, [('o_1', 'destroy', {})])
+
+    def test_disabled(self):
+        """ Test that updates are sent immediately by default.
+
+        """
+        session = self.session
+        session.coalesce_updates = False
+        session.send('o_1', 'set_value', {'value': 1})
+        expected = [('o_1', 'set_value', {'value': 1})]
+        self.assertEqual(self.socket.sent, expected)
+
+    def test_turned_off(self):
+        """ Test that held updates are sent when coalescing is turned
+        off, before any later update.
+
+        """
+        session = self.session
+        session.send('o_1', 'set_value', {'value': 1})
+        session.coalesce_updates = False
+        session.send('o_1', 'set_value', {'value': 2})
+        self.app.process_calls()
+        batch = [('o_1', 'set_value', {'value': 1})]
+        expected = [
+            ('s_1', 'message_batch', {'batch': batch}),
+            ('o_1', 'set_value', {'value': 2}),
+        ]
+        self.assertEqual(self.socket.sent, expected)
+
+
+class ListSession(Session):
+    """ A session with a window which holds a list of fields.
+
+    """
+    def on_open(self):
+        window = Window()
+        container = Container(window)
+        for index in range(50):
+            Field(container, text=u'same' if index else u'first')
+        self.windows = [window]
+
+
+def expand(tree, templates):
+    """ Expand a snapshot tree against its templates, as the client
+    does.
+
+    """
+    if 'template' in tree:
+        if 'template_def' in tree:
+            templates[tree['template']] = tree['template_def']
+        expanded = templates[tree['template']].copy()
+        expanded.update(tree)
+        del expanded['template']
+        expanded.pop('template_def', None)
+        tree = expanded
+    children = [expand(child, templates) for child in tree['children']]
+    tree['children'] = children
+    return tree
+
+
+class TestSnapshotTemplates(unittest.TestCase):
+    """ Unit tests for the snapshot templates of a Session.
+
+    """
+    def setUp(self):
+        self.app = DeferredApplication()
+
+    def tearDown(self):
+        self.app.destroy()
+
+    def test_templates(self):
+        """ Test that repeated values are sent once per class.
+
+        """
+        session = ListSession()
+        session.open('s_1')
+        full = [window.snapshot() for window in session.windows]
+        session.client_features = set(['snapshot_templates'])
+        [shared] = session.snapshot()
+        fields = shared['children'][0]['children']
+        self.assertTrue('template_def' in fields[0])
+        self.assertEqual(fields[1]['text'], u'same')
+        self.assertFalse('class' in fields[1])
+        self.assertFalse('template_def' in fields[1])
+        self.assertFalse('enabled' in fields[2])
+        self.assertEqual(fields[2]['template'], fields[1]['template'])
+        # The container layout is regenerated with each snapshot, so
+        # only the fields are compared against the full snapshot.
+        expanded = expand(shared, {})
+        self.assertEqual(
+            expanded['children'][0]['children'],
+            full[0]['children'][0]['children'],
+        )
+
+    def test_mutated_value(self):
+        """ Test that a template is not changed by an in-place change
+        of the value it was made from.
+
+        """
+        templates = SnapshotTemplates()
+        first = ComboBox(items=[u'x', u'y'])
+        shared = templates.share(first.snapshot())
+        first.items.append(u'z')
+        self.assertEqual(shared['template_def']['items'], [u'x', u'y'])
+        second = ComboBox(items=[u'x', u'y', u'z'])
+        shared = templates.share(second.snapshot())
+        self.assertEqual(shared['items'], [u'x', u'y', u'z'])
+
+    def test_live_objects(self):
+        """ Test that live objects are sent with their own instance and
+        are never copied into a template.
+
+        """
+        templates = SnapshotTemplates()
+        client_templates = {}
+        for model in (HasTraits(), HasTraits()):
+            shared = templates.share(TraitsItem(model=model).snapshot())
+            self.assertTrue(shared['model'] is model)
+            expanded = expand(shared, client_templates)
+            self.assertTrue(expanded['model'] is model)
+        [template] = client_templates.values()
+        self.assertFalse('model' in template)
+        self.assertTrue('enabled' in template)
+
+    def test_disabled(self):
+        """ Test that snapshots are sent in full by default.
+
+        """
+        session = ListSession()
+        session.open('s_1')
+        [snap] = session.snapshot()
+        fields = snap['children'][0]['children']
+        self.assertFalse(any('template' in field for field in fields))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import unittest
+
+from enaml.utils import LRUCache
+
+
+class TestLRUCache(unittest.TestCase):
+    """ Unit tests for the LRUCache.
+
+    """
+    def test_entry_limit(self):
+        """ Test that the least recently used entry is evicted.
+
+        """
+        cache = LRUCache(max_entries=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        self.assertEqual(cache.get('a'), 1)
+        cache.set('c', 3)
+        self.assertTrue('a' in cache)
+        self.assertFalse('b' in cache)
+        self.assertTrue('c' in cache)
+        self.assertEqual(cache.evictions, 1)
+
+    def test_byte_limit(self):
+        """ Test that entries are evicted to stay within the byte limit.
+
+        """
+        cache = LRUCache(max_bytes=10, sizeof=len)
+        cache.set('a', 'x' * 4)
+        cache.set('b', 'x' * 4)
+        self.assertEqual(cache.nbytes, 8)
+        cache.set('c', 'x' * 4)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.nbytes, 8)
+        self.assertFalse('a' in cache)
+        # A value larger than the limit is not retained.
+        cache.set('d', 'x' * 11)
+        self.assertFalse('d' in cache)
+        self.assertEqual(cache.nbytes, 8)
+
+    def test_replace(self):
+        """ Test that replacing an entry updates the byte count.
+
+        """
+        cache = LRUCache(sizeof=len)
+        cache.set('a', 'xx')
+        cache.set('a', 'xxxx')
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.nbytes, 4)
+        self.assertEqual(cache.pop('a'), 'xxxx')
+        self.assertEqual(cache.nbytes, 0)
+
+    def test_stats(self):
+        """ Test the hit, miss, and eviction counters.
+
+        """
+        cache = LRUCache(max_entries=1)
+        cache.get('a')
+        cache.set('a', 1)
+        cache.get('a')
+        cache.set_limits(max_entries=0)
+        stats = cache.stats()
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(stats['evictions'], 1)
+        self.assertEqual(stats['entries'], 0)
+
+    def test_set_limits(self):
+        """ Test that an omitted limit is left unchanged.
+
+        """
+        cache = LRUCache(max_entries=2, max_bytes=10)
+        cache.set_limits(max_bytes=20)
+        self.assertEqual((cache.max_entries, cache.max_bytes), (2, 20))
+        cache.set_limits(max_entries=None)
+        self.assertEqual((cache.max_entries, cache.max_bytes), (None, 20))
+
+
+if __name__ == '__main__':
+    unittest.main()
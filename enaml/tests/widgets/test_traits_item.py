@@ -0,0 +1,43 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from .enaml_test_case import EnamlTestCase
+
+
+class TestTraitsItem(EnamlTestCase):
+    """ Unit tests for the TraitsItem widget.
+
+    """
+
+    def setUp(self):
+        enaml_source = """
+from traits.api import HasTraits
+from enaml.widgets.api import Container, TraitsItem, Window
+
+enamldef MainView(Window):
+    Container:
+        TraitsItem:
+            model = HasTraits()
+        TraitsItem:
+            model = HasTraits()
+"""
+        self.parse_and_create(enaml_source)
+        container = self.view.children[0]
+        self.server_items = container.children
+        client_container = self.client_view.children()[0]
+        self.client_items = client_container.children()
+
+    def test_model_identity(self):
+        """ Test that each client item is built with the model object of
+        its server item, and not a copy of it.
+
+        """
+        self.assertEqual(len(self.client_items), 2)
+        for server, client in zip(self.server_items, self.client_items):
+            self.assertTrue(client._model is server.model)
+
+
+if __name__ == '__main__':
+    import unittest
+    unittest.main()
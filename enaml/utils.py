@@ -5,7 +5,7 @@
 """ An amalgamation of utilities used throughout the Enaml framework.
 
 """
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from functools import wraps
 import logging
 from random import shuffle
@@ -217,6 +217,213 @@ class ObjectDict(dict):
         self[name] = value
 
 
+#: A sentinel for a cache limit which is left unchanged.
+_UNCHANGED = object()
+
+
+class LRUCache(object):
+    """ A least-recently-used cache with entry count and size limits.
+
+    When either limit is exceeded, the least recently used entries are
+    evicted until the cache is within its limits. The cache maintains
+    counters for hits, misses, and evictions for monitoring purposes.
+
+    """
+    def __init__(self, max_entries=None, max_bytes=None, sizeof=None):
+        """ Initialize an LRUCache.
+
+        Parameters
+        ----------
+        max_entries : int, optional
+            The maximum number of entries to hold in the cache. The
+            default is None and indicates no limit.
+
+        max_bytes : int, optional
+            The maximum total size in bytes of the entries held in the
+            cache. The default is None and indicates no limit.
+
+        sizeof : callable, optional
+            A callable which accepts a cached value and returns its
+            size in bytes. The default considers every value to have
+            a size of zero.
+
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.nbytes = 0
+        self._items = OrderedDict()
+
+    def __len__(self):
+        """ Get the number of entries in the cache.
+
+        """
+        return len(self._items)
+
+    def __contains__(self, key):
+        """ Get whether the key is in the cache.
+
+        This does not affect the counters or the entry order.
+
+        """
+        return key in self._items
+
+    #--------------------------------------------------------------------------
+    # Public API
+    #--------------------------------------------------------------------------
+    def get(self, key, default=None):
+        """ Get the value for a key and mark it as recently used.
+
+        Parameters
+        ----------
+        key : object
+            The key for the cached value.
+
+        default : object, optional
+            The value to return if the key is not in the cache.
+
+        Returns
+        -------
+        result : object
+            The cached value or the default.
+
+        """
+        items = self._items
+        if key not in items:
+            self.misses += 1
+            return default
+        self.hits += 1
+        item = items.pop(key)
+        items[key] = item
+        return item[0]
+
+    def set(self, key, value):
+        """ Add a value to the cache and evict entries as needed.
+
+        A value which by itself exceeds the size limit of the cache is
+        not retained, and the existing entries are left untouched.
+
+        Parameters
+        ----------
+        key : object
+            The key for the cached value.
+
+        value : object
+            The value to add to the cache.
+
+        """
+        items = self._items
+        if key in items:
+            self.nbytes -= items.pop(key)[1]
+        sizeof = self.sizeof
+        nbytes = sizeof(value) if sizeof is not None else 0
+        max_bytes = self.max_bytes
+        if max_bytes is not None and nbytes > max_bytes:
+            self.evictions += 1
+            return
+        items[key] = (value, nbytes)
+        self.nbytes += nbytes
+        self._evict()
+
+    def pop(self, key, default=None):
+        """ Remove a key from the cache.
+
+        Parameters
+        ----------
+        key : object
+            The key for the cached value.
+
+        default : object, optional
+            The value to return if the key is not in the cache.
+
+        Returns
+        -------
+        result : object
+            The removed value or the default.
+
+        """
+        items = self._items
+        if key not in items:
+            return default
+        value, nbytes = items.pop(key)
+        self.nbytes -= nbytes
+        return value
+
+    def set_limits(self, max_entries=_UNCHANGED, max_bytes=_UNCHANGED):
+        """ Set the limits of the cache and evict entries as needed.
+
+        Parameters
+        ----------
+        max_entries : int, optional
+            The maximum number of entries to hold in the cache. None
+            indicates no limit. If not given, the current limit is
+            kept.
+
+        max_bytes : int, optional
+            The maximum total size in bytes of the entries held in the
+            cache. None indicates no limit. If not given, the current
+            limit is kept.
+
+        """
+        if max_entries is not _UNCHANGED:
+            self.max_entries = max_entries
+        if max_bytes is not _UNCHANGED:
+            self.max_bytes = max_bytes
+        self._evict()
+
+    def clear(self):
+        """ Remove all entries from the cache.
+
+        The counters are not reset.
+
+        """
+        self._items.clear()
+        self.nbytes = 0
+
+    def stats(self):
+        """ Get a dictionary of the cache statistics.
+
+        Returns
+        -------
+        result : dict
+            A dict with the keys 'entries', 'bytes', 'hits', 'misses'
+            and 'evictions'.
+
+        """
+        stats = {
+            'entries': len(self._items),
+            'bytes': self.nbytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+        return stats
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _evict(self):
+        """ Evict the least recently used entries until the cache is
+        within its limits.
+
+        """
+        items = self._items
+        max_entries = self.max_entries
+        max_bytes = self.max_bytes
+        while items:
+            full = max_entries is not None and len(items) > max_entries
+            if not full:
+                full = max_bytes is not None and self.nbytes > max_bytes
+            if not full:
+                break
+            key, (value, nbytes) = items.popitem(last=False)
+            self.nbytes -= nbytes
+            self.evictions += 1
+
+
 def log_exceptions(func):
     """ A decorator which will catch errors raised by a function and
     convert them into log error messages.
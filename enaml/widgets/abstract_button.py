@@ -43,6 +43,11 @@ class AbstractButton(Control):
     #: their contents' width weakly by default.
     hug_width = 'weak'
 
+    #: The attributes which are included in the snapshot.
+    snapshot_attributes = (
+        'text', 'checkable', 'checked', 'icon_source',
+    )
+
     #--------------------------------------------------------------------------
     # Initialization
     #--------------------------------------------------------------------------
@@ -51,11 +56,7 @@ class AbstractButton(Control):
 
         """
         snap = super(AbstractButton, self).snapshot()
-        snap['text'] = self.text
-        snap['checkable'] = self.checkable
-        snap['checked'] = self.checked
         snap['icon_size'] = tuple(self.icon_size)
-        snap['icon_source'] = self.icon_source
         return snap
 
     def bind(self):
@@ -0,0 +1,290 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from traits.api import Any, Instance, Int
+
+from enaml.stdlib.old.item_model import AbstractItemModel
+
+from .control import Control
+
+
+#: The types of item data which are sent to the client as-is. Data of
+#: any other type is converted to unicode.
+_WIRE_TYPES = (type(None), bool, int, long, float, str, unicode)
+
+
+def _clip(first, last, count):
+    """ Clip an inclusive range to the given item count.
+
+    Returns
+    -------
+    result : tuple or None
+        The clipped (first, last) range, or None if it is empty.
+
+    """
+    first = max(first, 0)
+    last = min(last, count - 1)
+    if first > last:
+        return None
+    return (first, last)
+
+
+def _to_wire(value):
+    """ Convert an item data value into a serializable value.
+
+    """
+    if isinstance(value, _WIRE_TYPES):
+        return value
+    return unicode(value)
+
+
+class AbstractItemView(Control):
+    """ A base class for widgets which display the items of an
+    AbstractItemModel.
+
+    The items are not part of the snapshot. The client requests the
+    range of items which it is showing, plus a prefetch margin, and
+    the view answers from the model. Changes to the model data are
+    only sent to the client if they fall within that range, so the
+    size of the model does not affect the cost of showing it.
+
+    """
+    #: The model which provides the items for the view.
+    item_model = Instance(AbstractItemModel)
+
+    #: The number of rows beyond the visible rows which the client
+    #: requests ahead of time.
+    prefetch_rows = Int(50)
+
+    #: The number of columns beyond the visible columns which the
+    #: client requests ahead of time.
+    prefetch_columns = Int(5)
+
+    #: How strongly a component hugs it's contents' width. Item views
+    #: ignore their width hug by default, so they expand freely.
+    hug_width = 'ignore'
+
+    #: How strongly a component hugs it's contents' height. Item views
+    #: ignore their height hug by default, so they expand freely.
+    hug_height = 'ignore'
+
+    #: The attributes which are included in the snapshot.
+    snapshot_attributes = (
+        'prefetch_rows', 'prefetch_columns',
+    )
+
+    #: The (first_row, last_row, first_column, last_column) range of
+    #: items held by the client, or None if it holds no items.
+    _window = Any
+
+    #--------------------------------------------------------------------------
+    # Initialization
+    #--------------------------------------------------------------------------
+    def snapshot(self):
+        """ Returns the snapshot for the control.
+
+        """
+        snap = super(AbstractItemView, self).snapshot()
+        snap['row_count'], snap['column_count'] = self._model_shape()
+        return snap
+
+    def bind(self):
+        """ A method called after initialization which allows the widget
+        to bind any event handlers necessary.
+
+        """
+        super(AbstractItemView, self).bind()
+        self.publish_attributes('prefetch_rows', 'prefetch_columns')
+
+    #--------------------------------------------------------------------------
+    # Message Handling
+    #--------------------------------------------------------------------------
+    def on_action_request_items(self, content):
+        """ Handle the 'request_items' action from the client widget.
+
+        The content contains the inclusive 'rows' and 'columns' ranges
+        of items to send. The range becomes the window of items held
+        by the client. If the window reaches the end of the model and
+        the model can fetch more rows, it is asked to do so.
+
+        """
+        model = self.item_model
+        if model is None:
+            return
+        row_count, column_count = self._model_shape()
+        rows = _clip(content['rows'][0], content['rows'][1], row_count)
+        columns = _clip(
+            content['columns'][0], content['columns'][1], column_count
+        )
+        if rows is None or columns is None:
+            self._window = None
+            return
+        self._window = rows + columns
+        first_row, last_row = rows
+        first_column, last_column = columns
+        reply = {}
+        reply['row'] = first_row
+        reply['column'] = first_column
+        reply['data'] = self._item_data(*self._window)
+        reply['vertical_headers'] = [
+            _to_wire(model.vertical_header_data(row))
+            for row in xrange(first_row, last_row + 1)
+        ]
+        reply['horizontal_headers'] = [
+            _to_wire(model.horizontal_header_data(column))
+            for column in xrange(first_column, last_column + 1)
+        ]
+        self.send_action('items', reply)
+        if last_row == row_count - 1 and model.can_fetch_more(None):
+            model.fetch_more(None)
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _model_shape(self):
+        """ Get the number of rows and columns in the model.
+
+        """
+        model = self.item_model
+        if model is None:
+            return (0, 0)
+        return (model.row_count(None), model.column_count(None))
+
+    def _item_data(self, first_row, last_row, first_column, last_column):
+        """ Get the display data for an inclusive range of items.
+
+        Returns
+        -------
+        result : list
+            The row-major list of lists of item data.
+
+        """
+        model = self.item_model
+        index = model.index
+        data = model.data
+        columns = xrange(first_column, last_column + 1)
+        return [
+            [_to_wire(data(index(row, column, None))) for column in columns]
+            for row in xrange(first_row, last_row + 1)
+        ]
+
+    def _item_model_changed(self, old, new):
+        """ The change handler for the 'item_model' attribute.
+
+        """
+        if old is not None:
+            old.data_changed.disconnect(self._on_data_changed)
+            old.horizontal_header_data_changed.disconnect(
+                self._on_horizontal_header_changed
+            )
+            old.vertical_header_data_changed.disconnect(
+                self._on_vertical_header_changed
+            )
+            for signal in self._structure_signals(old):
+                signal.disconnect(self._on_structure_changed)
+        if new is not None:
+            new.data_changed.connect(self._on_data_changed)
+            new.horizontal_header_data_changed.connect(
+                self._on_horizontal_header_changed
+            )
+            new.vertical_header_data_changed.connect(
+                self._on_vertical_header_changed
+            )
+            for signal in self._structure_signals(new):
+                signal.connect(self._on_structure_changed)
+        self._reset_client()
+
+    @staticmethod
+    def _structure_signals(model):
+        """ Get the model signals which change the shape of the model.
+
+        """
+        return (
+            model.rows_inserted, model.rows_removed, model.rows_moved,
+            model.columns_inserted, model.columns_removed,
+            model.columns_moved, model.layout_changed, model.model_reset,
+        )
+
+    def _reset_client(self):
+        """ Reset the items held by the client.
+
+        The client discards its items and requests the items it needs
+        from the new shape of the model.
+
+        """
+        self._window = None
+        content = {}
+        content['row_count'], content['column_count'] = self._model_shape()
+        self.send_action('model_reset', content)
+
+    def _on_structure_changed(self, *args):
+        """ Handle a change to the shape or the layout of the model.
+
+        """
+        self._reset_client()
+
+    def _on_data_changed(self, event):
+        """ Handle the 'data_changed' signal of the model.
+
+        Only the part of the change which intersects the window of the
+        client is sent.
+
+        """
+        window = self._window
+        if window is None:
+            return
+        top_left, bottom_right = event
+        rows = _clip(top_left.row, bottom_right.row, window[1] + 1)
+        columns = _clip(top_left.column, bottom_right.column, window[3] + 1)
+        if rows is None or columns is None:
+            return
+        first_row = max(rows[0], window[0])
+        first_column = max(columns[0], window[2])
+        if first_row > rows[1] or first_column > columns[1]:
+            return
+        content = {}
+        content['row'] = first_row
+        content['column'] = first_column
+        content['data'] = self._item_data(
+            first_row, rows[1], first_column, columns[1]
+        )
+        self.send_action('data_changed', content)
+
+    def _on_horizontal_header_changed(self, event):
+        """ Handle the 'horizontal_header_data_changed' model signal.
+
+        """
+        window = self._window
+        if window is not None:
+            self._send_headers('horizontal', event, window[2], window[3])
+
+    def _on_vertical_header_changed(self, event):
+        """ Handle the 'vertical_header_data_changed' model signal.
+
+        """
+        window = self._window
+        if window is not None:
+            self._send_headers('vertical', event, window[0], window[1])
+
+    def _send_headers(self, orientation, event, first, last):
+        """ Send the changed headers which fall within a window range.
+
+        """
+        first = max(first, event[0])
+        last = min(last, event[1])
+        if first > last:
+            return
+        model = self.item_model
+        if orientation == 'horizontal':
+            header_data = model.horizontal_header_data
+        else:
+            header_data = model.vertical_header_data
+        content = {}
+        content['orientation'] = orientation
+        content['first'] = first
+        content['data'] = [
+            _to_wire(header_data(section))
+            for section in xrange(first, last + 1)
+        ]
+        self.send_action('headers_changed', content)
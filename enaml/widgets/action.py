@@ -54,25 +54,15 @@ class Action(Messenger):
     #: An event fired when a checkable action changes its checked state.
     toggled = EnamlEvent
 
+    #: The attributes which are included in the snapshot.
+    snapshot_attributes = (
+        'text', 'tool_tip', 'status_tip', 'icon_source', 'checkable',
+        'checked', 'enabled', 'visible', 'separator',
+    )
+
     #--------------------------------------------------------------------------
     # Initialization
     #--------------------------------------------------------------------------
-    def snapshot(self):
-        """ Returns the snapshot dict for the Action.
-
-        """
-        snap = super(Action, self).snapshot()
-        snap['text'] = self.text
-        snap['tool_tip'] = self.tool_tip
-        snap['status_tip'] = self.status_tip
-        snap['icon_source'] = self.icon_source
-        snap['checkable'] = self.checkable
-        snap['checked'] = self.checked
-        snap['enabled'] = self.enabled
-        snap['visible'] = self.visible
-        snap['separator'] = self.separator
-        return snap
-
     def bind(self):
         """ Binds the change handlers for the Action.
 
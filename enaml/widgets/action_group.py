@@ -30,19 +30,14 @@ class ActionGroup(Messenger):
     #: A read only property which returns the actions for this group.
     actions = Property(depends_on='children')
 
+    #: The attributes which are included in the snapshot.
+    snapshot_attributes = (
+        'exclusive', 'enabled', 'visible',
+    )
+
     #--------------------------------------------------------------------------
     # Initialization
     #--------------------------------------------------------------------------
-    def snapshot(self):
-        """ Returns the snapshot dict for the ActionGroup.
-
-        """
-        snap = super(ActionGroup, self).snapshot()
-        snap['exclusive'] = self.exclusive
-        snap['enabled'] = self.enabled
-        snap['visible'] = self.visible
-        return snap
-
     def bind(self):
         """ Binds the change handlers for the ActionGroup.
 
@@ -33,19 +33,14 @@ class ComboBox(Control):
     #: hug width weakly, by default.
     hug_width = 'weak'
 
+    #: The attributes which are included in the snapshot.
+    snapshot_attributes = (
+        'items', 'index', 'editable',
+    )
+
     #--------------------------------------------------------------------------
     # Initialization
     #--------------------------------------------------------------------------
-    def snapshot(self):
-        """ Returns the dict of creation attributes for the combo box.
-
-        """
-        snap = super(ComboBox, self).snapshot()
-        snap['items'] = self.items
-        snap['index'] = self.index
-        snap['editable'] = self.editable
-        return snap
-
     def bind(self):
         """ A method called after initialization which allows the widget
         to bind any event handlers necessary.
@@ -27,19 +27,14 @@ class DateSelector(BoundedDate):
     #: the width hug by default, so it expands freely in width.
     hug_width = 'ignore'
 
+    #: The attributes which are included in the snapshot.
+    snapshot_attributes = (
+        'date_format', 'calendar_popup',
+    )
+
     #--------------------------------------------------------------------------
     # Initialization
     #--------------------------------------------------------------------------
-    def snapshot(self):
-        """ Return a dictionary which contains all the state necessary to
-        initialize a client widget.
-
-        """
-        snap = super(DateSelector, self).snapshot()
-        snap['date_format'] = self.date_format
-        snap['calendar_popup'] = self.calendar_popup
-        return snap
-
     def bind(self):
         """ A method called after initialization which allows the widget
         to bind any event handlers necessary.
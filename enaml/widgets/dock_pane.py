@@ -56,25 +56,15 @@ class DockPane(Widget):
     #: dock pane's close button.
     closed = EnamlEvent
 
+    #: The attributes which are included in the snapshot.
+    snapshot_attributes = (
+        'title', 'title_bar_visible', 'title_bar_orientation', 'closable',
+        'movable', 'floatable', 'floating', 'dock_area', 'allowed_dock_areas',
+    )
+
     #--------------------------------------------------------------------------
     # Initialization
     #--------------------------------------------------------------------------
-    def snapshot(self):
-        """ Returns the snapshot dict for the DockPane.
-
-        """
-        snap = super(DockPane, self).snapshot()
-        snap['title'] = self.title
-        snap['title_bar_visible'] = self.title_bar_visible
-        snap['title_bar_orientation'] = self.title_bar_orientation
-        snap['closable'] = self.closable
-        snap['movable'] = self.movable
-        snap['floatable'] = self.floatable
-        snap['floating'] = self.floating
-        snap['dock_area'] = self.dock_area
-        snap['allowed_dock_areas'] = self.allowed_dock_areas
-        return snap
-
     def bind(self):
         super(DockPane, self).bind()
         attrs = (
@@ -20,17 +20,14 @@ class EnableCanvas(Control):
     hug_width = 'ignore'
     hug_height = 'ignore'
 
+    #: The attributes which are included in the snapshot.
+    snapshot_attributes = (
+        'component',
+    )
+
     #--------------------------------------------------------------------------
     # Initialization
     #--------------------------------------------------------------------------
-    def snapshot(self):
-        """ Get the snapshot dict for the canvas.
-
-        """
-        snap = super(EnableCanvas, self).snapshot()
-        snap['component'] = self.component
-        return snap
-
     def bind(self):
         """ Bind the change handlers for the control.
 
@@ -53,6 +53,12 @@ class Field(Control):
     #: the width hug by default, so they expand freely in width.
     hug_width = 'ignore'
 
+    #: The attributes which are included in the snapshot.
+    snapshot_attributes = (
+        'text', 'submit_triggers', 'placeholder', 'echo_mode', 'max_length',
+        'read_only',
+    )
+
     #--------------------------------------------------------------------------
     # Initialization
     #--------------------------------------------------------------------------
@@ -61,13 +67,7 @@ class Field(Control):
 
         """
         snap = super(Field, self).snapshot()
-        snap['text'] = self.text
         snap['validator'] = self._client_validator()
-        snap['submit_triggers'] = self.submit_triggers
-        snap['placeholder'] = self.placeholder
-        snap['echo_mode'] = self.echo_mode
-        snap['max_length'] = self.max_length
-        snap['read_only'] = self.read_only
         return snap
 
     def bind(self):
@@ -40,21 +40,15 @@ class FlowArea(ConstraintsWidget):
     hug_width = 'ignore'
     hug_height = 'ignore'
 
+    #: The attributes which are included in the snapshot.
+    snapshot_attributes = (
+        'direction', 'align', 'horizontal_spacing', 'vertical_spacing',
+        'margins',
+    )
+
     #--------------------------------------------------------------------------
     # Initialization
     #--------------------------------------------------------------------------
-    def snapshot(self):
-        """ Returns the snapshot dict for the FlowArea.
-
-        """
-        snap = super(FlowArea, self).snapshot()
-        snap['direction'] = self.direction
-        snap['align'] = self.align
-        snap['horizontal_spacing'] = self.horizontal_spacing
-        snap['vertical_spacing'] = self.vertical_spacing
-        snap['margins'] = self.margins
-        return snap
-
     def bind(self):
         """ Bind the change handler for the FlowItem.
 
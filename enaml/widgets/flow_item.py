@@ -44,20 +44,14 @@ class FlowItem(Widget):
     #: A read only property which returns the items's flow widget.
     flow_widget = Property(depends_on='children')
 
+    #: The attributes which are included in the snapshot.
+    snapshot_attributes = (
+        'preferred_size', 'align', 'stretch', 'ortho_stretch',
+    )
+
     #--------------------------------------------------------------------------
     # Initialization
     #--------------------------------------------------------------------------
-    def snapshot(self):
-        """ Returns the snapshot dict for the FlowItem.
-
-        """
-        snap = super(FlowItem, self).snapshot()
-        snap['preferred_size'] = self.preferred_size
-        snap['align'] = self.align
-        snap['stretch'] = self.stretch
-        snap['ortho_stretch'] = self.ortho_stretch
-        return snap
-
     def bind(self):
         """ Bind the change handler for the FlowItem.
 
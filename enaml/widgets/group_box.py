@@ -23,15 +23,10 @@ class GroupBox(Container):
     #: The alignment of the title text.
     title_align = Enum('left', 'right', 'center')
 
-    def snapshot(self):
-        """ Populates the initial attributes dict for the component.
-
-        """
-        snap = super(GroupBox, self).snapshot()
-        snap['title'] = self.title
-        snap['flat'] = self.flat
-        snap['title_align'] = self.title_align
-        return snap
+    #: The attributes which are included in the snapshot.
+    snapshot_attributes = (
+        'title', 'flat', 'title_align',
+    )
 
     def bind(self):
         """ A method called after initialization which allows the widget
@@ -22,17 +22,14 @@ class Html(Control):
     #: ignore the height hug by default, so they expand freely in height.
     hug_height = 'ignore'
 
+    #: The attributes which are included in the snapshot.
+    snapshot_attributes = (
+        'source',
+    )
+
     #--------------------------------------------------------------------------
     # Initialization
     #--------------------------------------------------------------------------
-    def snapshot(self):
-        """ Return the dictionary of creation attributes for the control.
-
-        """
-        snap = super(Html, self).snapshot()
-        snap['source'] = self.source
-        return snap
-
     def bind(self):
         """ A method called after initialization which allows the widget
         to bind any event handlers necessary.
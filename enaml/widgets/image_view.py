@@ -29,20 +29,14 @@ class ImageView(Control):
     #: An image view hugs its height weakly by default.
     hug_height = 'weak'
 
+    #: The attributes which are included in the snapshot.
+    snapshot_attributes = (
+        'source', 'scale_to_fit', 'allow_upscaling', 'preserve_aspect_ratio',
+    )
+
     #--------------------------------------------------------------------------
     # Initialization
     #--------------------------------------------------------------------------
-    def snapshot(self):
-        """ Returns the dict of creation attribute for the control.
-
-        """
-        snap = super(ImageView, self).snapshot()
-        snap['source'] = self.source
-        snap['scale_to_fit'] = self.scale_to_fit
-        snap['allow_upscaling'] = self.allow_upscaling
-        snap['preserve_aspect_ratio'] = self.preserve_aspect_ratio
-        return snap
-
     def bind(self):
         """ A method called after initialization which allows the widget
         to bind any event handlers necessary.
@@ -24,19 +24,14 @@ class Label(Control):
     #: contents' width weakly by default.
     hug_width = 'weak'
 
+    #: The attributes which are included in the snapshot.
+    snapshot_attributes = (
+        'text', 'align', 'vertical_align',
+    )
+
     #--------------------------------------------------------------------------
     # Initialization
     #--------------------------------------------------------------------------
-    def snapshot(self):
-        """ Returns the dict of creation attributes for the control.
-
-        """
-        snap = super(Label, self).snapshot()
-        snap['text'] = self.text
-        snap['align'] = self.align
-        snap['vertical_align'] = self.vertical_align
-        return snap
-
     def bind(self):
         """ A method called after initialization which allows the widget
         to bind any event handlers necessary.
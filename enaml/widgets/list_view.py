@@ -0,0 +1,17 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from .abstract_item_view import AbstractItemView
+
+
+class ListView(AbstractItemView):
+    """ A widget which displays the items of a list model.
+
+    Only the items which are visible in the client, plus a prefetch
+    margin, are sent over the session. Lists of any size may be shown.
+
+    """
+    #: A list view shows a single column, so no columns are prefetched.
+    prefetch_columns = 0
+
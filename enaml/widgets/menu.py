@@ -22,18 +22,14 @@ class Menu(Widget):
     #: The items in the menu: Menu | Action | ActionGroup
     items = Property(depends_on='children')
 
+    #: The attributes which are included in the snapshot.
+    snapshot_attributes = (
+        'title', 'context_menu',
+    )
+
     #--------------------------------------------------------------------------
     # Initialization
     #--------------------------------------------------------------------------
-    def snapshot(self):
-        """ Returns the snapshot dict for the Menu.
-
-        """
-        snap = super(Menu, self).snapshot()
-        snap['title'] = self.title
-        snap['context_menu'] = self.context_menu
-        return snap
-
     def bind(self):
         """ Bind the change handlers for the menu.
 
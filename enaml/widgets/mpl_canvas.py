@@ -25,18 +25,14 @@ class MPLCanvas(Control):
     hug_width = 'ignore'
     hug_height = 'ignore'
 
+    #: The attributes which are included in the snapshot.
+    snapshot_attributes = (
+        'figure', 'toolbar_visible',
+    )
+
     #--------------------------------------------------------------------------
     # Initialization
     #--------------------------------------------------------------------------
-    def snapshot(self):
-        """ Get the snapshot dict for the MPLCanvas.
-
-        """
-        snap = super(MPLCanvas, self).snapshot()
-        snap['figure'] = self.figure
-        snap['toolbar_visible'] = self.toolbar_visible
-        return snap
-
     def bind(self):
         """ Bind the change handlers for the MPLCanvas.
 
@@ -27,6 +27,12 @@ class Notebook(ConstraintsWidget):
     #: Whether or not the tabs in the notebook should be movable.
     tabs_movable = Bool(True)
 
+    #: Whether or not the contents of the pages are sent to the client
+    #: lazily. When True, only the contents of the first visible page
+    #: are included in the snapshot. The contents of the other pages
+    #: are sent the first time the client shows them.
+    lazy = Bool(False)
+
     #: A read only property which returns the notebook's Pages.
     pages = Property(depends_on='children')
 
@@ -38,20 +44,14 @@ class Notebook(ConstraintsWidget):
     #: ignores its height hug by default, so it expands freely in height.
     hug_height = 'ignore'
 
+    #: The attributes which are included in the snapshot.
+    snapshot_attributes = (
+        'tab_style', 'tab_position', 'tabs_closable', 'tabs_movable',
+    )
+
     #--------------------------------------------------------------------------
     # Initialization
     #--------------------------------------------------------------------------
-    def snapshot(self):
-        """ Returns the snapshot for the control.
-
-        """
-        snap = super(Notebook, self).snapshot()
-        snap['tab_style'] = self.tab_style
-        snap['tab_position'] = self.tab_position
-        snap['tabs_closable'] = self.tabs_closable
-        snap['tabs_movable'] = self.tabs_movable
-        return snap
-
     def bind(self):
         """ Bind the change handlers for the control.
 
@@ -62,6 +62,25 @@ class Notebook(ConstraintsWidget):
         )
         self.publish_attributes(*attrs)
 
+    #--------------------------------------------------------------------------
+    # Snapshot API
+    #--------------------------------------------------------------------------
+    def update_deferred(self):
+        """ Update which children of the notebook are deferred.
+
+        If the notebook is lazy, the contents of the pages which are
+        not yet active are deferred, except for the first visible page.
+
+        """
+        if self.lazy:
+            shown = None
+            for page in self.pages:
+                if shown is None and page.visible:
+                    shown = page
+                if not page.is_active:
+                    page.children_deferred = page is not shown
+        super(Notebook, self).update_deferred()
+
     #--------------------------------------------------------------------------
     # Private API
     #--------------------------------------------------------------------------
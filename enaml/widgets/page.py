@@ -37,19 +37,14 @@ class Page(Widget):
     #: Notebook when the tab is closed. This event has no payload.
     closed = EnamlEvent
 
+    #: The attributes which are included in the snapshot.
+    snapshot_attributes = (
+        'title', 'closable', 'icon_source',
+    )
+
     #--------------------------------------------------------------------------
     # Initialization
     #--------------------------------------------------------------------------
-    def snapshot(self):
-        """ Return the snapshot for the control.
-
-        """
-        snap = super(Page, self).snapshot()
-        snap['title'] = self.title
-        snap['closable'] = self.closable
-        snap['icon_source'] = self.icon_source
-        return snap
-
     def bind(self):
         """ Bind the change handlers for the control.
 
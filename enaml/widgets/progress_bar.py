@@ -44,19 +44,14 @@ class ProgressBar(Control):
     #: to fill the available horizontal space by default.
     hug_width = 'ignore'
 
+    #: The attributes which are included in the snapshot.
+    snapshot_attributes = (
+        'maximum', 'minimum', 'value',
+    )
+
     #--------------------------------------------------------------------------
     # Initialization
     #--------------------------------------------------------------------------
-    def snapshot(self):
-        """ Returns the dict of creation attributes for the control.
-
-        """
-        snap = super(ProgressBar, self).snapshot()
-        snap['maximum'] = self.maximum
-        snap['minimum'] = self.minimum
-        snap['value'] = self.value
-        return snap
-
     def bind(self):
         """ A method called after initialization which allows the widget
         to bind any event handlers necessary.
@@ -40,20 +40,14 @@ class ScrollArea(ConstraintsWidget):
     #: areas do not hug their height and are free to expand.
     hug_height = 'ignore'
 
+    #: The attributes which are included in the snapshot.
+    snapshot_attributes = (
+        'horizontal_policy', 'vertical_policy', 'widget_resizable',
+    )
+
     #--------------------------------------------------------------------------
     # Initialization
     #--------------------------------------------------------------------------
-    def snapshot(self):
-        """ Return a dictionary which contains all the state necessary to
-        initialize a client widget.
-
-        """
-        snap = super(ScrollArea, self).snapshot()
-        snap['horizontal_policy'] = self.horizontal_policy
-        snap['vertical_policy'] = self.vertical_policy
-        snap['widget_resizable'] = self.widget_resizable
-        return snap
-
     def bind(self):
         """ Bind the change handlers for this widget.
 
@@ -39,20 +39,14 @@ class Separator(Control):
     #: An internal override trait for hug_height
     _hug_height = Either(None, PolicyEnum, default=None)
 
+    #: The attributes which are included in the snapshot.
+    snapshot_attributes = (
+        'orientation', 'line_style', 'line_width', 'midline_width',
+    )
+
     #--------------------------------------------------------------------------
     # Initialization
     #--------------------------------------------------------------------------
-    def snapshot(self):
-        """ Returns the snapshot dictionary for the Separator.
-
-        """
-        snap = super(Separator, self).snapshot()
-        snap['orientation'] = self.orientation
-        snap['line_style'] = self.line_style
-        snap['line_width'] = self.line_width
-        snap['midline_width'] = self.midline_width
-        return snap
-
     def bind(self):
         """ Binds the change handlers for the Separator.
 
@@ -89,26 +89,15 @@ class Slider(Control):
     #: An internal override trait for hug_height
     _hug_height = Either(None, PolicyEnum, default=None)
 
+    #: The attributes which are included in the snapshot.
+    snapshot_attributes = (
+        'minimum', 'maximum', 'value', 'single_step', 'page_step',
+        'tick_position', 'tick_interval', 'orientation', 'tracking',
+    )
+
     #--------------------------------------------------------------------------
     # Initialization
     #--------------------------------------------------------------------------
-    def snapshot(self):
-        """ Return a dictionary which contains all the state necessary to
-        initialize a client widget.
-
-        """
-        snap = super(Slider, self).snapshot()
-        snap['minimum'] = self.minimum
-        snap['maximum'] = self.maximum
-        snap['value'] = self.value
-        snap['single_step'] = self.single_step
-        snap['page_step'] = self.page_step
-        snap['tick_position'] = self.tick_position
-        snap['tick_interval'] = self.tick_interval
-        snap['orientation'] = self.orientation
-        snap['tracking'] = self.tracking
-        return snap
-
     def bind(self):
         """ A method called after initialization which allows the widget
         to bind any event handlers necessary.
@@ -48,28 +48,15 @@ class SpinBox(Control):
     #: ignore the width hug by default, so they expand freely in width.
     hug_width = 'ignore'
 
+    #: The attributes which are included in the snapshot.
+    snapshot_attributes = (
+        'maximum', 'minimum', 'value', 'prefix', 'suffix',
+        'special_value_text', 'single_step', 'read_only', 'wrapping',
+    )
+
     #--------------------------------------------------------------------------
     # Initialization
     #--------------------------------------------------------------------------
-    def snapshot(self):
-        """ Return the dict of creation attributes for the control.
-
-        """
-        snap = super(SpinBox, self).snapshot()
-        attrs = {
-            'maximum' : self.maximum,
-            'minimum' : self.minimum,
-            'value' : self.value,
-            'prefix': self.prefix,
-            'suffix': self.suffix,
-            'special_value_text': self.special_value_text,
-            'single_step' : self.single_step,
-            'read_only': self.read_only,
-            'wrapping' : self.wrapping,
-        }
-        snap.update(attrs)
-        return snap
-
     def bind(self):
         """ A method called after initialization which allows the widget
         to bind any event handlers necessary.
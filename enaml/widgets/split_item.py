@@ -31,18 +31,14 @@ class SplitItem(Widget):
     #: This is a deprecated attribute. It should no longer be used.
     preferred_size = Any
 
+    #: The attributes which are included in the snapshot.
+    snapshot_attributes = (
+        'stretch', 'collapsible',
+    )
+
     #--------------------------------------------------------------------------
     # Initialization
     #--------------------------------------------------------------------------
-    def snapshot(self):
-        """ Return the dict of creation attributes for the control.
-
-        """
-        snap = super(SplitItem, self).snapshot()
-        snap['stretch'] = self.stretch
-        snap['collapsible'] = self.collapsible
-        return snap
-
     def bind(self):
         """ Bind the change handlers for the widget.
 
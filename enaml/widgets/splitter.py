@@ -38,18 +38,14 @@ class Splitter(ConstraintsWidget):
     #: in height.
     hug_height = 'ignore'
 
+    #: The attributes which are included in the snapshot.
+    snapshot_attributes = (
+        'orientation', 'live_drag',
+    )
+
     #--------------------------------------------------------------------------
     # Initialization
     #--------------------------------------------------------------------------
-    def snapshot(self):
-        """ Return the dict of creation attributes for the control.
-
-        """
-        snap = super(Splitter, self).snapshot()
-        snap['orientation'] = self.orientation
-        snap['live_drag'] = self.live_drag
-        return snap
-
     def bind(self):
         """ Bind the change handlers for the widget.
 
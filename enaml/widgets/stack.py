@@ -2,7 +2,7 @@
 #  Copyright (c) 2012, Enthought, Inc.
 #  All rights reserved.
 #------------------------------------------------------------------------------
-from traits.api import Dict, Int, Property, cached_property
+from traits.api import Bool, Dict, Int, Property, cached_property
 
 from .constraints_widget import ConstraintsWidget
 from .stack_item import StackItem
@@ -23,21 +23,23 @@ class Stack(ConstraintsWidget):
     #: XXX Document the supported transitions.
     transition = Dict
 
+    #: Whether or not the contents of the stack items are sent to the
+    #: client lazily. When True, only the contents of the current item
+    #: are included in the snapshot. The contents of the other items
+    #: are sent the first time they become the current item.
+    lazy = Bool(False)
+
     #: A read only property which returns the stack's StackItems
     stack_items = Property(depends_on='children')
 
+    #: The attributes which are included in the snapshot.
+    snapshot_attributes = (
+        'index', 'transition',
+    )
+
     #--------------------------------------------------------------------------
     # Initialization
     #--------------------------------------------------------------------------
-    def snapshot(self):
-        """ Returns the snapshot for the control.
-
-        """
-        snap = super(Stack, self).snapshot()
-        snap['index'] = self.index
-        snap['transition'] = self.transition
-        return snap
-
     def bind(self):
         """ Bind the change handlers for the control.
 
@@ -45,6 +47,23 @@ class Stack(ConstraintsWidget):
         super(Stack, self).bind()
         self.publish_attributes('index', 'transition')
 
+    #--------------------------------------------------------------------------
+    # Snapshot API
+    #--------------------------------------------------------------------------
+    def update_deferred(self):
+        """ Update which children of the stack are deferred.
+
+        If the stack is lazy, the contents of the items which are not
+        yet active are deferred, except for the current item.
+
+        """
+        if self.lazy:
+            current = self.index
+            for index, item in enumerate(self.stack_items):
+                if not item.is_active:
+                    item.children_deferred = index != current
+        super(Stack, self).update_deferred()
+
     #--------------------------------------------------------------------------
     # Message Handling
     #--------------------------------------------------------------------------
@@ -73,3 +92,19 @@ class Stack(ConstraintsWidget):
         items = (child for child in self.children if isinst(child, StackItem))
         return tuple(items)
 
+    def _index_changed(self, index):
+        """ The change handler for the 'index' attribute.
+
+        The contents of a deferred item are sent to the client before
+        the client is told to show the item. The contents are sent in
+        the deferred message batch, so the batch is flushed ahead of
+        the 'set_index' action.
+
+        """
+        items = self.stack_items
+        if 0 <= index < len(items):
+            item = items[index]
+            if item.children_deferred and item.is_active:
+                item.materialize_children()
+                self.session.flush_batch()
+
@@ -0,0 +1,16 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from .abstract_item_view import AbstractItemView
+
+
+class TableView(AbstractItemView):
+    """ A widget which displays the items of a table model in a grid.
+
+    Only the items which are visible in the client, plus a prefetch
+    margin, are sent over the session. Tables of any size may be shown.
+
+    """
+    pass
+
@@ -32,23 +32,15 @@ class TextEditor(Control):
     #: The column number for the margin line
     margin_line_column = Int(80)
 
+    #: The attributes which are included in the snapshot.
+    snapshot_attributes = (
+        'text', 'mode', 'theme', 'auto_pair', 'font_size', 'margin_line',
+        'margin_line_column',
+    )
+
     #--------------------------------------------------------------------------
     # Initialization
     #--------------------------------------------------------------------------
-    def snapshot(self):
-        """ Returns the dict of creation attributes for the control.
-
-        """
-        snap = super(TextEditor, self).snapshot()
-        snap['text'] = self.text
-        snap['mode'] = self.mode
-        snap['theme'] = self.theme
-        snap['auto_pair'] = self.auto_pair
-        snap['font_size'] = self.font_size
-        snap['margin_line'] = self.margin_line
-        snap['margin_line_column'] = self.margin_line_column
-        return snap
-
     def bind(self):
         """ A method called after initialization which allows the widget
         to bind any event handlers necessary.
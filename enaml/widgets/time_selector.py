@@ -21,18 +21,14 @@ class TimeSelector(BoundedTime):
     #: the width hug by default, so it expands freely in width.
     hug_width = 'ignore'
 
+    #: The attributes which are included in the snapshot.
+    snapshot_attributes = (
+        'time_format',
+    )
+
     #--------------------------------------------------------------------------
     # Initialization
     #--------------------------------------------------------------------------
-    def snapshot(self):
-        """ Return a dictionary which contains all the state necessary to
-        initialize a client widget.
-
-        """
-        snap = super(TimeSelector, self).snapshot()
-        snap['time_format'] = self.time_format
-        return snap
-
     def bind(self):
         """ A method called after initialization which allows the widget
         to bind any event handlers necessary.
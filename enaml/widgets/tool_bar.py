@@ -68,22 +68,15 @@ class ToolBar(ConstraintsWidget):
     #: An internal override trait for hug_height
     _hug_height = Either(None, PolicyEnum, default=None)
 
+    #: The attributes which are included in the snapshot.
+    snapshot_attributes = (
+        'movable', 'floatable', 'floating', 'dock_area', 'allowed_dock_areas',
+        'orientation',
+    )
+
     #--------------------------------------------------------------------------
     # Initialization
     #--------------------------------------------------------------------------
-    def snapshot(self):
-        """ Returns the snapshot dict for the DockPane.
-
-        """
-        snap = super(ToolBar, self).snapshot()
-        snap['movable'] = self.movable
-        snap['floatable'] = self.floatable
-        snap['floating'] = self.floating
-        snap['dock_area'] = self.dock_area
-        snap['allowed_dock_areas'] = self.allowed_dock_areas
-        snap['orientation'] = self.orientation
-        return snap
-
     def bind(self):
         """ Bind the change handlers for the ToolBar.
 
@@ -31,19 +31,14 @@ class TraitsItem(Control):
     hug_width = 'ignore'
     hug_height = 'ignore'
 
+    #: The attributes which are included in the snapshot.
+    snapshot_attributes = (
+        'model', 'view', 'handler',
+    )
+
     #--------------------------------------------------------------------------
     # Initialization
     #--------------------------------------------------------------------------
-    def snapshot(self):
-        """ Get the snapshot dictionary for the TraitsItem widget.
-
-        """
-        snap = super(TraitsItem, self).snapshot()
-        snap['model'] = self.model
-        snap['view'] = self.view
-        snap['handler'] = self.handler
-        return snap
-
     def bind(self):
         """ Bind the change handlers for the control.
 
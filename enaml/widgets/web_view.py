@@ -27,18 +27,14 @@ class WebView(Control):
     hug_width = 'ignore'
     hug_height = 'ignore'
 
+    #: The attributes which are included in the snapshot.
+    snapshot_attributes = (
+        'url', 'html',
+    )
+
     #--------------------------------------------------------------------------
     # Initialization
     #--------------------------------------------------------------------------
-    def snapshot(self):
-        """ Create the snapshot for the widget.
-
-        """
-        snap = super(WebView, self).snapshot()
-        snap['url'] = self.url
-        snap['html'] = self.html
-        return snap
-
     def bind(self):
         """ Bind the change handlers for the widget.
 
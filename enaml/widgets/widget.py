@@ -51,23 +51,15 @@ class Widget(Messenger):
     #: The status tip to show when the user hovers over the widget.
     status_tip = Unicode
 
+    #: The attributes which are included in the snapshot.
+    snapshot_attributes = (
+        'enabled', 'visible', 'bgcolor', 'fgcolor', 'font', 'minimum_size',
+        'maximum_size', 'show_focus_rect', 'tool_tip', 'status_tip',
+    )
+
     #--------------------------------------------------------------------------
     # Initialization
     #--------------------------------------------------------------------------
-    def snapshot(self):
-        snap = super(Widget, self).snapshot()
-        snap['enabled'] = self.enabled
-        snap['visible'] = self.visible
-        snap['bgcolor'] = self.bgcolor
-        snap['fgcolor'] = self.fgcolor
-        snap['font'] = self.font
-        snap['minimum_size'] = self.minimum_size
-        snap['maximum_size'] = self.maximum_size
-        snap['show_focus_rect'] = self.show_focus_rect
-        snap['tool_tip'] = self.tool_tip
-        snap['status_tip'] = self.status_tip
-        return snap
-
     def bind(self):
         """ Bind the change handlers for a widget component.
 
@@ -42,20 +42,14 @@ class Window(Widget):
     #: The source url for the titlebar icon.
     icon_source = Str
 
+    #: The attributes which are included in the snapshot.
+    snapshot_attributes = (
+        'title', 'initial_size', 'modality', 'icon_source',
+    )
+
     #--------------------------------------------------------------------------
     # Initialization
     #--------------------------------------------------------------------------
-    def snapshot(self):
-        """ Return the snapshot for a Window.
-
-        """
-        snap = super(Window, self).snapshot()
-        snap['title'] = self.title
-        snap['initial_size'] = self.initial_size
-        snap['modality'] = self.modality
-        snap['icon_source'] = self.icon_source
-        return snap
-
     def bind(self):
         """ A method called after initialization which allows the widget
         to bind any event handlers necessary.
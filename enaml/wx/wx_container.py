@@ -3,8 +3,12 @@
 #  All rights reserved.
 #------------------------------------------------------------------------------
 from collections import deque
+from time import time
 
 from casuarius import weak
+from enaml.layout.layout_instrumentation import (
+    layout_instrumentation, owner_label,
+)
 from enaml.layout.layout_manager import LayoutManager
 
 import wx
@@ -193,7 +197,7 @@ class WxContainer(WxConstraintsWidget):
             # Initializing the layout manager can fail if the objective
             # function is unbounded. We let that failure occur so it can
             # be logged. Nothing is stored until it succeeds.
-            manager = LayoutManager()
+            manager = LayoutManager(owner_label(self))
             manager.initialize(cns)
             self._offset_table = offset_table
             self._layout_table = layout_table
@@ -211,7 +215,16 @@ class WxContainer(WxConstraintsWidget):
         is resized.
 
         """
-        self.refresh()
+        # The layout pass is run synchronously, so the resize latency
+        # is the duration of the refresh.
+        if layout_instrumentation.enabled:
+            start = time()
+            self.refresh()
+            layout_instrumentation.record_resize_latency(
+                owner_label(self), time() - start
+            )
+        else:
+            self.refresh()
 
     def on_show(self, event):
         """ The event handler for the EVT_SHOW event.
@@ -239,6 +252,10 @@ class WxContainer(WxConstraintsWidget):
 
         """
         if self._owns_layout:
+            if layout_instrumentation.enabled:
+                layout_instrumentation.record_relayout(
+                    owner_label(self), 'relayout'
+                )
             widget = self.widget()
             old_hint = widget.GetBestSize()
             self.init_layout()
@@ -300,6 +317,10 @@ class WxContainer(WxConstraintsWidget):
         if self._owns_layout:
             manager = self._layout_manager
             if manager is not None:
+                if layout_instrumentation.enabled:
+                    layout_instrumentation.record_relayout(
+                        owner_label(self), 'replace_constraints'
+                    )
                 widget = self.widget()
                 old_hint = widget.GetBestSize()
                 manager.replace_constraints(old_cns, new_cns)
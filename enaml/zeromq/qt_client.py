@@ -0,0 +1,316 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import logging
+import types
+
+import zmq
+
+from enaml.message import (
+    create_message, serialize_message, deserialize_message
+)
+from enaml.message_codec import CodecRegistry
+from enaml.qt.qt.QtCore import QObject, QSocketNotifier, Signal
+from enaml.qt.q_deferred_caller import deferredCall
+from enaml.qt.qt_factories import register_default
+from enaml.qt.qt_session import CLIENT_FEATURES, QtSession
+from enaml.socket_interface import ActionSocketInterface
+from enaml.utils import log_exceptions
+from enaml.weakmethod import WeakMethod
+
+
+logger = logging.getLogger(__name__)
+
+
+# This registers the default Qt factories with the QtWidgetRegistry so
+# that the client can build the widgets for a remote session.
+register_default()
+
+
+class ZMQClientSocket(object):
+    """ A concrete implementation of ActionSocketInterface for the
+    client side of a remote session.
+
+    Messages sent on the socket are forwarded to the server by the
+    client. Messages received from the server are delivered to the
+    registered callback, and their receipt is acknowledged to the
+    server after every half window so that it may keep sending.
+
+    """
+    def __init__(self, client, session_id, window):
+        """ Initialize a ZMQClientSocket.
+
+        Parameters
+        ----------
+        client : QtZMQClient
+            The client which owns the socket.
+
+        session_id : str
+            The identifier of the remote session.
+
+        window : int
+            The flow control window which was requested for the
+            session.
+
+        """
+        self._client = client
+        self._session_id = session_id
+        self._ack_every = max(1, window // 2)
+        self._received = 0
+        self._callback = None
+        self.closed = False
+
+    def on_message(self, callback):
+        """ Register a callback for receiving messages sent by the
+        server.
+
+        Parameters
+        ----------
+        callback : callable
+            A callable with an argument signature that is equivalent to
+            the `send` method. If the callback is a bound method, then
+            the lifetime of the callback will be bound to lifetime of
+            the method owner object.
+
+        """
+        if isinstance(callback, types.MethodType):
+            callback = WeakMethod(callback)
+        self._callback = callback
+
+    def send(self, object_id, action, content):
+        """ Send the action to the server session.
+
+        Parameters
+        ----------
+        object_id : str
+            The object id of the target object.
+
+        action : str
+            The action that should be performed by the object.
+
+        content : dict
+            The content dictionary for the action.
+
+        """
+        msg = {
+            'session_id': self._session_id,
+            'object_id': object_id,
+            'action': action,
+            'content': content,
+        }
+        self._client.send_message('session_message', msg)
+
+    def receive(self, object_id, action, content):
+        """ Receive a message sent by the server session.
+
+        Parameters
+        ----------
+        object_id : str
+            The object id of the target object.
+
+        action : str
+            The action that should be performed by the object.
+
+        content : dict
+            The content dictionary for the action.
+
+        """
+        if action == 'close' and object_id == self._session_id:
+            self.closed = True
+        callback = self._callback
+        if callback is not None:
+            callback(object_id, action, content)
+        self._received += 1
+        if self._received >= self._ack_every and not self.closed:
+            count = self._received
+            self._received = 0
+            content = {'session_id': self._session_id, 'count': count}
+            self._client.send_message('session_ack', content)
+
+
+ActionSocketInterface.register(ZMQClientSocket)
+
+
+class QtZMQClient(QObject):
+    """ A client which displays the sessions of a remote Enaml
+    application using Qt.
+
+    The client connects a zmq DEALER socket to a ZMQApplication and
+    services it from the Qt event loop with a QSocketNotifier.
+
+    """
+    #: A signal emitted with the session id when a session starts.
+    sessionStarted = Signal(object)
+
+    #: A signal emitted with the session id when a session ends.
+    sessionEnded = Signal(object)
+
+    #: A signal emitted with the list of session info dicts in reply
+    #: to a call to `discover`.
+    sessionsDiscovered = Signal(object)
+
+    def __init__(self, host='127.0.0.1', port=8888, window=256):
+        """ Initialize a QtZMQClient.
+
+        Parameters
+        ----------
+        host : str, optional
+            The host address of the server. The default is '127.0.0.1'.
+
+        port : int, optional
+            The port of the server. The default is 8888.
+
+        window : int, optional
+            The flow control window to request for each session.
+
+        """
+        super(QtZMQClient, self).__init__()
+        context = zmq.Context.instance()
+        zsocket = context.socket(zmq.DEALER)
+        zsocket.connect('tcp://%s:%s' % (host, port))
+        fd = zsocket.getsockopt(zmq.FD)
+        notifier = QSocketNotifier(fd, QSocketNotifier.Read, self)
+        notifier.activated.connect(self._on_readable)
+        self._zsocket = zsocket
+        self._notifier = notifier
+        self._codec = CodecRegistry.negotiate(CodecRegistry.names())
+        self._window = window
+        self._qt_sessions = {}
+        self._sockets = {}
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    @log_exceptions
+    def _on_readable(self, fd=None):
+        """ Process all of the messages waiting on the zmq socket.
+
+        The zmq socket descriptor is edge triggered, so the socket is
+        drained completely each time it becomes readable.
+
+        """
+        zsocket = self._zsocket
+        while zsocket.getsockopt(zmq.EVENTS) & zmq.POLLIN:
+            wire = zsocket.recv_multipart()
+            message, codec = deserialize_message(wire)
+            self._dispatch(message)
+
+    def _dispatch(self, message):
+        """ Dispatch a message received from the server.
+
+        """
+        msg_type = message.header.get('msg_type')
+        content = message.content
+        if msg_type == 'session_message':
+            socket = self._sockets.get(content['session_id'])
+            if socket is not None:
+                msg_content = content.get('content', {})
+                if 'frames' in content:
+                    msg_content['frames'] = content['frames']
+                object_id = content['object_id']
+                socket.receive(object_id, content['action'], msg_content)
+        elif msg_type == 'start_session_reply':
+            if content.get('status') == 'ok':
+                self._open_session(content)
+            else:
+                logger.error('Failed to start session: %s' % content)
+        elif msg_type == 'session_closed':
+            self._close_session(content['session_id'])
+        elif msg_type == 'discover_reply':
+            self.sessionsDiscovered.emit(content.get('sessions', []))
+        elif content.get('status') == 'error':
+            logger.error('Server error: %s' % content.get('message'))
+
+    def _open_session(self, content):
+        """ Create and activate the QtSession for a started session.
+
+        """
+        session_id = content['session_id']
+        qt_session = QtSession(session_id, content['widget_groups'])
+        qt_session.open(content['snapshot'])
+        socket = ZMQClientSocket(self, session_id, self._window)
+        self._qt_sessions[session_id] = qt_session
+        self._sockets[session_id] = socket
+        qt_session.activate(socket)
+        self.sessionStarted.emit(session_id)
+
+    def _close_session(self, session_id):
+        """ Discard the client state of an ended session.
+
+        """
+        qt_session = self._qt_sessions.pop(session_id, None)
+        socket = self._sockets.pop(session_id, None)
+        if qt_session is not None:
+            if not socket.closed:
+                qt_session.on_action_close({})
+            self.sessionEnded.emit(session_id)
+
+    #--------------------------------------------------------------------------
+    # Public API
+    #--------------------------------------------------------------------------
+    def send_message(self, msg_type, content):
+        """ Send a message to the server.
+
+        Parameters
+        ----------
+        msg_type : str
+            The type of the message.
+
+        content : dict
+            The content dict of the message.
+
+        """
+        message = create_message(
+            msg_type, content, codecs=CodecRegistry.names()
+        )
+        wire = serialize_message(message, self._codec)
+        self._zsocket.send_multipart(wire, copy=False)
+        # Sending may consume the readable edge of the descriptor, so
+        # any waiting messages are processed on the next event cycle.
+        deferredCall(self._on_readable)
+
+    def discover(self):
+        """ Request the list of sessions served by the application.
+
+        The result is emitted with the `sessionsDiscovered` signal.
+
+        """
+        self.send_message('discover', {})
+
+    def start_session(self, name):
+        """ Request a new session of the given name from the server.
+
+        The `sessionStarted` signal is emitted once the session has
+        been created on the client.
+
+        Parameters
+        ----------
+        name : str
+            The name of the session to start.
+
+        """
+        self.send_message('start_session', {
+            'name': name, 'window': self._window,
+            'features': list(CLIENT_FEATURES),
+        })
+
+    def end_session(self, session_id):
+        """ Request the server to end the given session.
+
+        Parameters
+        ----------
+        session_id : str
+            The identifier of the session to end.
+
+        """
+        self.send_message('end_session', {'session_id': session_id})
+
+    def close(self):
+        """ Close the connection to the server.
+
+        """
+        for session_id in self._qt_sessions.keys():
+            self.end_session(session_id)
+        self._notifier.setEnabled(False)
+        self._zsocket.close(linger=100)
@@ -0,0 +1,106 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from functools import partial
+import thread
+import time
+
+from enaml.remote_application import RemoteApplication
+
+from .zmq_server import ZMQServer
+
+
+class ZMQApplication(RemoteApplication):
+    """ A RemoteApplication which serves its sessions over ZeroMQ.
+
+    The application runs on the IOLoop of a ZMQServer, which routes
+    the messages of any number of clients to `handle_request`.
+
+    """
+    def __init__(self, factories, host='127.0.0.1', port=8888):
+        """ Initialize a ZMQApplication.
+
+        Parameters
+        ----------
+        factories : iterable
+            An iterable of SessionFactory instances to pass to the
+            superclass constructor.
+
+        host : str, optional
+            The host address on which to serve. The default is
+            '127.0.0.1'.
+
+        port : int, optional
+            The port on which to serve. The default is 8888.
+
+        """
+        super(ZMQApplication, self).__init__(factories)
+        self._server = ZMQServer(self, host, port)
+        self._thread_id = thread.get_ident()
+
+    #--------------------------------------------------------------------------
+    # Abstract API Implementation
+    #--------------------------------------------------------------------------
+    def start(self):
+        """ Start the application's main event loop.
+
+        """
+        self._thread_id = thread.get_ident()
+        self._server.start()
+
+    def stop(self):
+        """ Stop the application's main event loop.
+
+        """
+        self._server.stop()
+
+    def deferred_call(self, callback, *args, **kwargs):
+        """ Invoke a callable on the next cycle of the main event loop
+        thread.
+
+        Parameters
+        ----------
+        callback : callable
+            The callable object to execute at some point in the future.
+
+        *args, **kwargs
+            Any additional positional and keyword arguments to pass to
+            the callback.
+
+        """
+        self._server.ioloop.add_callback(partial(callback, *args, **kwargs))
+
+    def timed_call(self, ms, callback, *args, **kwargs):
+        """ Invoke a callable on the main event loop thread at a
+        specified time in the future.
+
+        Parameters
+        ----------
+        ms : int
+            The time to delay, in milliseconds, before executing the
+            callable.
+
+        callback : callable
+            The callable object to execute at some point in the future.
+
+        *args, **kwargs
+            Any additional positional and keyword arguments to pass to
+            the callback.
+
+        """
+        deadline = time.time() + ms / 1000.0
+        call = partial(callback, *args, **kwargs)
+        self._server.ioloop.add_timeout(deadline, call)
+
+    def is_main_thread(self):
+        """ Indicates whether the caller is on the main gui thread.
+
+        Returns
+        -------
+        result : bool
+            True if called from the thread running the event loop.
+            False otherwise.
+
+        """
+        return thread.get_ident() == self._thread_id
@@ -2,20 +2,22 @@
 #  Copyright (c) 2012, Enthought, Inc.
 #  All rights reserved.
 #------------------------------------------------------------------------------
-import json
-
 import zmq
 from zmq.eventloop.ioloop import IOLoop
 from zmq.eventloop.zmqstream import ZMQStream
 
-from enaml.message import Message
+from enaml.message import serialize_message, deserialize_message
+from enaml.message_codec import CodecRegistry
 from enaml.request import BaseRequest, BasePushHandler
 from enaml.utils import log_exceptions
 
 
-def pack_message(routing_id, message):
+def pack_message(routing_id, message, codec):
     """ Pack a routing id and Message into a mutlipart zmq message.
 
+    Any binary 'frames' in the content of the message are sent as raw
+    zmq frames. See `serialize_message` for details.
+
     Parameters
     ----------
     routing_id : str
@@ -24,10 +26,13 @@ def pack_message(routing_id, message):
     message : Message
         The Message object to serialized into the multipart message.
 
+    codec : AbstractCodec
+        The codec to use for serializing the parts of the message.
+        The name of the codec is sent as the second frame.
+
     """
     multipart = [routing_id]
-    dumps = json.dumps
-    multipart.extend(dumps(part) for part in message)
+    multipart.extend(serialize_message(message, codec))
     return multipart
 
 
@@ -37,27 +42,29 @@ def unpack_message(multipart):
     Parameters
     ----------
     multipart : list
-        The 5-element list representing the routing_id, header, 
-        parent_header, metadata, and content of a client message.
+        The list representing the routing_id, codec name, header,
+        parent_header, metadata, and content of a client message,
+        followed by any raw binary frames. The raw frames are placed
+        in the 'frames' key of the content.
 
     Returns
     -------
-    routing_id, message : str, Message
-        The zmq routing id and the deserialized Message object.
+    routing_id, message, codec : str, Message, AbstractCodec
+        The zmq routing id, the deserialized Message object, and the
+        codec with which the message was serialized.
 
     """
-    if len(multipart) != 5:
+    if len(multipart) < 6:
         raise TypeError('Invalid wire message: %s' % multipart)
-    routing_id = multipart[0]
-    loads = json.loads
-    return routing_id, Message(loads(part) for part in multipart[1:])
+    message, codec = deserialize_message(multipart[1:])
+    return multipart[0], message, codec
 
 
 class ZMQRequest(BaseRequest):
     """ A concrete BaseRequest implementation for the ZMQServer.
 
     """
-    def __init__(self, message, routing_id, stream, ioloop):
+    def __init__(self, message, routing_id, server, codec):
         """ Initialize a ZMQRequest.
 
         Parameters
@@ -68,17 +75,19 @@ class ZMQRequest(BaseRequest):
         routing_id : str
             The zmq identity string for the client.
 
-        stream : ZMQStream
-            The zmq socket stream for this request.
+        server : ZMQServer
+            The server which received this request.
 
-        ioloop : IOLoop
-            The zmq IOLoop instance for this request.
+        codec : AbstractCodec
+            The codec negotiated for the client connection.
 
         """
         self._message = message
         self._routing_id = routing_id
-        self._stream = stream
-        self._ioloop = ioloop
+        self._server = server
+        self._stream = server._stream
+        self._ioloop = server._ioloop
+        self._codec = codec
         self._finished = False
 
     #--------------------------------------------------------------------------
@@ -132,8 +141,8 @@ class ZMQRequest(BaseRequest):
         """
         if self._finished:
             raise RuntimeError('Request already finished')
-        packed = pack_message(self._routing_id, message)
-        self._stream.send_multipart(packed)
+        packed = pack_message(self._routing_id, message, self._codec)
+        self._stream.send_multipart(packed, copy=False)
         self._finished = True
 
     def push_handler(self):
@@ -147,7 +156,8 @@ class ZMQRequest(BaseRequest):
             to this client, without the client initiating a request.
 
         """
-        return ZMQPushHandler(self._routing_id, self._stream, self._ioloop)
+        self._server._acquire_client(self._routing_id)
+        return ZMQPushHandler(self._routing_id, self._server, self._codec)
 
 
 class ZMQPushHandler(BasePushHandler):
@@ -158,7 +168,7 @@ class ZMQPushHandler(BasePushHandler):
     this handler will silently drop the messages.
 
     """
-    def __init__(self, routing_id, stream, ioloop):
+    def __init__(self, routing_id, server, codec):
         """ Initialize a ZMQPushHandler.
 
         Parameters
@@ -166,16 +176,19 @@ class ZMQPushHandler(BasePushHandler):
         routing_id : str
             The zmq identity string for the client.
 
-        stream : ZMQStream
-            The zmq socket stream for this push handler.
+        server : ZMQServer
+            The server which serves the client.
 
-        ioloop : IOLoop
-            The zmq IOLoop instance for this push handler.
+        codec : AbstractCodec
+            The codec negotiated for the client connection.
 
         """
         self._routing_id = routing_id
-        self._stream = stream
-        self._ioloop = ioloop
+        self._server = server
+        self._stream = server._stream
+        self._ioloop = server._ioloop
+        self._codec = codec
+        self._closed = False
 
     @log_exceptions
     def push_message(self, message):
@@ -187,8 +200,8 @@ class ZMQPushHandler(BasePushHandler):
             The Message instance that should be pushed to the client.
 
         """
-        packed = pack_message(self._routing_id, message)
-        self._stream.send_multipart(packed)
+        packed = pack_message(self._routing_id, message, self._codec)
+        self._stream.send_multipart(packed, copy=False)
 
     def add_callback(self, callback):
         """ Add a callback to the event queue to be called later.
@@ -209,6 +222,17 @@ class ZMQPushHandler(BasePushHandler):
         """
         self._ioloop.add_callback(callback)
 
+    def close(self):
+        """ Release the handler once no more messages will be pushed.
+
+        The server forgets the codec negotiated for the client once all
+        of the push handlers of the client are closed.
+
+        """
+        if not self._closed:
+            self._closed = True
+            self._server._release_client(self._routing_id)
+
 
 class ZMQServer(object):
     """ An Enaml Application server which uses ZeroMQ sockets.
@@ -235,6 +259,8 @@ class ZMQServer(object):
         router.bind('tcp://%s:%s' % (host, port))
         self._app = app
         self._router = router
+        self._codecs = {}
+        self._handler_counts = {}
         self._stream = ZMQStream(router)
         self._stream.on_recv(self._on_recv)
         self._ioloop = IOLoop.instance()
@@ -252,13 +278,78 @@ class ZMQServer(object):
             The multipart message received by the client.
 
         """
-        routing_id, message = unpack_message(multipart)
-        request = ZMQRequest(message, routing_id, self._stream, self._ioloop)
+        routing_id, message, codec = unpack_message(multipart)
+        codec = self._negotiate_codec(routing_id, message, codec)
+        request = ZMQRequest(message, routing_id, self, codec)
         self._app.handle_request(request)
 
+    def _acquire_client(self, routing_id):
+        """ Record a new push handler for the given client.
+
+        """
+        counts = self._handler_counts
+        counts[routing_id] = counts.get(routing_id, 0) + 1
+
+    def _release_client(self, routing_id):
+        """ Record a closed push handler for the given client.
+
+        When the last push handler of the client is closed, which is
+        when its last session has ended or it was found to be stalled,
+        the codec negotiated for the client is discarded.
+
+        """
+        counts = self._handler_counts
+        count = counts.get(routing_id, 0) - 1
+        if count > 0:
+            counts[routing_id] = count
+        else:
+            counts.pop(routing_id, None)
+            self._codecs.pop(routing_id, None)
+
+    def _negotiate_codec(self, routing_id, message, codec):
+        """ Get the codec to use for replies to the given client.
+
+        A client advertises the codecs it supports with the `codecs`
+        key of a message header. The most preferred codec which is
+        supported by both ends is used for that client from then on,
+        until its last session ends. Until a client advertises its
+        codecs, replies are serialized with the same codec as the
+        client request.
+
+        Parameters
+        ----------
+        routing_id : str
+            The zmq identity string for the client.
+
+        message : Message
+            The message received from the client.
+
+        codec : AbstractCodec
+            The codec with which the message was serialized.
+
+        Returns
+        -------
+        result : AbstractCodec
+            The codec to use for messages sent to the client.
+
+        """
+        offered = message.header.get('codecs')
+        if offered is not None:
+            negotiated = CodecRegistry.negotiate(offered)
+            self._codecs[routing_id] = negotiated
+            return negotiated
+        return self._codecs.get(routing_id, codec)
+
     #--------------------------------------------------------------------------
     # Public API
     #--------------------------------------------------------------------------
+    @property
+    def ioloop(self):
+        """ The IOLoop instance which runs the server.
+
+        """
+        return self._ioloop
+
     def start(self):
         """ Start the server's io loop. This call will block until
         the 'stop' method is called.
@@ -29,6 +29,11 @@ enaml_extensions = Feature(
             'enaml.extensions.funchelper',
             ['enaml/extensions/funchelper.cpp'],
             language='c++',
+        ),
+        Extension(
+            'enaml.extensions.dynamicscope',
+            ['enaml/extensions/dynamicscope.cpp'],
+            language='c++',
         )
     ],
 )
@@ -50,6 +55,8 @@ setup(
     entry_points = dict(
         console_scripts=[
             'enaml-run = enaml.runner:main',
+            'enaml-bundle = enaml.bundler:main',
+            'enaml-compileall = enaml.compile_all:main',
         ],
     ),
     test_suite='enaml.test_collector',